@@ -0,0 +1,29 @@
+"""Add users created_at id index
+
+Revision ID: 3b8f2c1d9a47
+Revises: e4d972fa96a4
+Create Date: 2026-10-18 09:12:41.502318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8f2c1d9a47"
+down_revision: Union[str, None] = "e4d972fa96a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_created_at_id", "users", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_created_at_id", table_name="users")
@@ -0,0 +1,55 @@
+"""Add user list filter indexes
+
+Revision ID: 7c41d2e9b5f3
+Revises: 3b8f2c1d9a47
+Create Date: 2026-10-18 14:03:27.118904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op  # type: ignore
+
+# revision identifiers, used by Alembic.
+revision: str = "7c41d2e9b5f3"
+down_revision: Union[str, None] = "3b8f2c1d9a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_users_name_id", "users", ["name", "id"], unique=False)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.create_index(
+        "ix_users_active_created_at_id",
+        "users",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "ix_users_superuser_created_at_id",
+        "users",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("is_superuser"),
+    )
+    op.create_index(
+        "ix_users_email_domain",
+        "users",
+        [sa.text("lower(split_part(email, '@', 2))")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_users_email_domain", table_name="users")
+        op.drop_index("ix_users_superuser_created_at_id", table_name="users")
+        op.drop_index("ix_users_active_created_at_id", table_name="users")
+    op.drop_index("ix_users_name_id", table_name="users")
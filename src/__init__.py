@@ -0,0 +1,4 @@
+from time import perf_counter
+
+# earliest point the service's own code runs; startup timings count from here
+STARTED_AT = perf_counter()
@@ -0,0 +1,3 @@
+from src.server import main
+
+main()
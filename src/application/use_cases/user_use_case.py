@@ -1,7 +1,19 @@
-from typing import Dict, List
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from src.domain.models.user import CreateUser, User
+from src.core.tracing import traced
+from src.domain.models.user import (
+    BulkDeleteResult,
+    BulkUserResult,
+    CreateUser,
+    User,
+    UserBatch,
+    UserCount,
+    UserFilter,
+    UserPage,
+    UserSort,
+)
 from src.domain.repositories.user_repository import UserRepository
 
 
@@ -9,14 +21,63 @@ class UserUseCase:
     def __init__(self, user_repository: UserRepository) -> None:
         self.user_repository = user_repository
 
-    async def list_users(self) -> List[User]:
-        return await self.user_repository.get_all_users()
+    @traced("use_case")
+    async def list_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[UserFilter] = None,
+        sort: UserSort = "created_at",
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPage:
+        return await self.user_repository.get_all_users(
+            limit, cursor, filters, sort, fields
+        )
 
+    @traced("use_case")
+    async def count_users(
+        self, filters: Optional[UserFilter] = None, approximate: bool = False
+    ) -> UserCount:
+        return await self.user_repository.count_users(filters, approximate)
+
+    def export_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self.user_repository.stream_users(batch_size)
+
+    @traced("use_case")
     async def get_user(self, user_id: UUID) -> User:
         return await self.user_repository.get_user_by_id(user_id)
 
+    @traced("use_case")
+    async def get_user_updated_at(self, user_id: UUID) -> datetime:
+        return await self.user_repository.get_user_updated_at(user_id)
+
+    @traced("use_case")
+    async def get_users(self, user_ids: List[UUID]) -> UserBatch:
+        users = await self.user_repository.get_users_by_ids(user_ids)
+        found = {user.id for user in users}
+        return UserBatch(
+            users=users,
+            not_found=[
+                user_id
+                for user_id in dict.fromkeys(user_ids)
+                if user_id not in found
+            ],
+        )
+
+    @traced("use_case")
     async def register_user(self, user: CreateUser) -> User:
         return await self.user_repository.create_user(user)
 
+    @traced("use_case")
+    async def register_users(
+        self, users: List[CreateUser]
+    ) -> List[BulkUserResult]:
+        return await self.user_repository.create_users(users)
+
+    @traced("use_case")
     async def delete_user(self, user_id: UUID) -> Dict[str, str]:
         return await self.user_repository.delete_user(user_id)
+
+    @traced("use_case")
+    async def delete_users(self, user_ids: List[UUID]) -> BulkDeleteResult:
+        return await self.user_repository.delete_users(user_ids)
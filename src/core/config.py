@@ -1,5 +1,5 @@
 import secrets
-from typing import List
+from typing import Dict, List, Literal, Optional
 
 from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,15 +16,45 @@ class Settings(BaseSettings):  # type: ignore
     DATABASE_HOST: str
     DATABASE_PORT: int
     DATABASE_NAME: str
+    # full SQLAlchemy URL, overrides the parts above when set
+    # (e.g. sqlite+aiosqlite:///./bench.db for offline benchmarks)
+    DATABASE_URL: Optional[str] = None
 
     @computed_field  # type: ignore[misc]
     def DATABASE_URI(self) -> str:
+        if self.DATABASE_URL:
+            return self.DATABASE_URL
         return (
             f"postgresql+asyncpg://{self.DATABASE_USER}:"
             f"{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:"
             f"{self.DATABASE_PORT}/{self.DATABASE_NAME}"
         )
 
+    DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    # Postgres max_connections, split between the server's workers; the
+    # reserved ones are left for migrations and admin sessions
+    DATABASE_MAX_CONNECTIONS: Optional[int] = None
+    DATABASE_RESERVED_CONNECTIONS: int = 10
+    # asyncpg prepared statement cache, 0 disables it (e.g. behind pgbouncer)
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    # server-side statement_timeout in milliseconds, 0 disables it
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 30_000
+    # "request" keeps a session's connection until the response is sent,
+    # "unit_of_work" returns it as soon as a repository read or write ends
+    DATABASE_SESSION_SCOPE: Literal["request", "unit_of_work"] = "request"
+    # read replicas for plain SELECTs; sessions stick to the primary after
+    # their first write. A failing replica sits out RETRY_SECONDS.
+    DATABASE_REPLICA_URLS: List[str] = []
+    DATABASE_REPLICA_STRATEGY: Literal[
+        "round_robin", "least_connections"
+    ] = "round_robin"
+    DATABASE_REPLICA_RETRY_SECONDS: float = 30.0
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8"
     )
@@ -35,8 +65,138 @@ class Settings(BaseSettings):  # type: ignore
     # AUTH
     JWT_SECRET: str = secrets.token_urlsafe(32)
     JWT_ALGORITHM: str = "HS256"
+    # asymmetric algorithms (RS256, ES256, EdDSA, ...) sign with a PEM
+    # private key and verify against public keys selected by the "kid"
+    JWT_PRIVATE_KEY: Optional[str] = None
+    JWT_PUBLIC_KEYS: Dict[str, str] = {}
+    JWT_KEY_ID: Optional[str] = None
+    JWT_CACHE_SIZE: int = 10_000
     # 60 minutes * 24 hours * 8 days = 7 days
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
 
+    # PASSWORD HASHING
+    HASH_POOL_WORKERS: int = 4
+    HASH_POOL_MAX_PENDING: int = 64
+
+    # CACHE
+    # "memory" is per worker: with several SERVER_WORKERS, a user updated or
+    # deleted through one worker can be served stale by the others for up
+    # to CACHE_TTL_SECONDS; use "redis" (the redis extra) to share one cache
+    CACHE_BACKEND: Literal["none", "memory", "redis"] = "memory"
+    CACHE_TTL_SECONDS: float = 30.0
+    CACHE_NEGATIVE_TTL_SECONDS: float = 5.0
+    CACHE_MAX_ENTRIES: int = 10_000
+    REDIS_URL: str = "redis://localhost:6379/0"
+    # concurrent single-user lookups issued in the same event-loop tick are
+    # answered by one batched query
+    USER_LOADER_ENABLED: bool = True
+    USER_LOADER_MAX_BATCH: int = 100
+
+    # ADMISSION CONTROL
+    # per-client token buckets, keyed by JWT subject or else client IP, as
+    # {"METHOD /path/template": "<requests>/<second|minute|hour>"}; clients
+    # over budget get 429. CONCURRENCY_LIMITS caps in-flight requests per
+    # route and worker and answers 503 instead of queuing the excess.
+    RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    RATE_LIMITS: Dict[str, str] = {}
+    CONCURRENCY_LIMITS: Dict[str, int] = {
+        "POST /api/v1/user/": 64,
+        "POST /api/v1/user/bulk": 4,
+    }
+
+    # IDEMPOTENCY
+    # routes that honour an Idempotency-Key header: the first response per
+    # client and key is stored for TTL_SECONDS and replayed for retries.
+    # A running request renews its key's lock every LOCK_SECONDS / 3, so
+    # LOCK_SECONDS only bounds how long a crashed worker holds the key.
+    # Keys live in the cache's Redis with CACHE_BACKEND=redis and in each
+    # worker's memory otherwise, where retries on other workers run again.
+    IDEMPOTENT_ROUTES: List[str] = [
+        "POST /api/v1/user/",
+        "POST /api/v1/user/bulk",
+    ]
+    IDEMPOTENCY_TTL_SECONDS: float = 24 * 60 * 60
+    IDEMPOTENCY_LOCK_SECONDS: float = 60.0
+    IDEMPOTENCY_MAX_ENTRIES: int = 10_000
+
+    # BULK IMPORT
+    BULK_BATCH_SIZE: int = 1000
+
+    # EXPORT
+    # rows fetched per server-side cursor round trip and bytes buffered
+    # per streamed chunk
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_CHUNK_BYTES: int = 64 * 1024
+    EXPORT_GZIP_LEVEL: int = 6
+
+    # SERIALIZATION
+    # return user payloads as pre-rendered JSON, skipping FastAPI's
+    # response_model re-validation of rows that came from the database
+    FAST_JSON_RESPONSES: bool = False
+
+    # COMPRESSION
+    # responses of at least MIN_BYTES are compressed with the first of
+    # ENCODINGS the client accepts (br and zstd need the "compression"
+    # extra); bodies from OFFLOAD_BYTES up are compressed in a worker
+    # thread. Compressed list pages are kept per request and ETag.
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: List[str] = ["zstd", "br", "gzip"]
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_OFFLOAD_BYTES: int = 64 * 1024
+    COMPRESSION_CACHE_ENTRIES: int = 256
+
+    # HTTP CACHING
+    # user resources carry weak ETags and Last-Modified; clients must
+    # revalidate, which is cheap since 304s skip loading full rows
+    HTTP_CACHE_CONTROL: str = "private, no-cache"
+
+    # PAGINATION
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 500
+    # approximate counts fall back to an exact COUNT(*) below this estimate
+    COUNT_EXACT_THRESHOLD: int = 10_000
+    COUNT_CACHE_TTL_SECONDS: float = 10.0
+
+    # SERVER (python -m src)
+    # WORKERS defaults to the CPUs available to the process; recycling a
+    # worker after MAX_REQUESTS bounds slow memory growth (only with more
+    # than one worker; a lone worker would exit unreplaced). Several workers
+    # each keep their own memory cache (see CACHE_BACKEND)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: Optional[int] = None
+    SERVER_BACKLOG: int = 2048
+    # keep longer than the load balancer's idle timeout so it never
+    # reuses a connection uvicorn is closing
+    SERVER_KEEPALIVE_SECONDS: int = 75
+    SERVER_MAX_REQUESTS: Optional[int] = None
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: Optional[int] = 30
+    SERVER_ACCESS_LOG: bool = False
+    # comma-separated proxy IPs/CIDRs ("*" for any) whose X-Forwarded-For
+    # and X-Forwarded-Proto are trusted; the client IP keys rate limits
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+
+    # STARTUP / SHUTDOWN
+    # the lifespan opens PREFILL_CONNECTIONS (default: DATABASE_POOL_SIZE)
+    # per engine and runs the hot queries on each before reporting ready;
+    # on shutdown it waits up to DRAIN_SECONDS for connections to return
+    STARTUP_WARMUP_ENABLED: bool = True
+    STARTUP_PREFILL_CONNECTIONS: Optional[int] = None
+    SHUTDOWN_DRAIN_SECONDS: float = 10.0
+
+    # OBSERVABILITY
+    # fraction of requests that record per-layer spans and return a
+    # Server-Timing header; request latency histograms are always kept
+    TRACE_SAMPLE_RATE: float = 0.0
+
+    # QUERY PROFILER
+    # opt-in slow-query log and N+1 detector; strict raises instead of
+    # logging when one request repeats a statement too often
+    QUERY_PROFILER_ENABLED: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    QUERY_REPEAT_THRESHOLD: int = 10
+    QUERY_PROFILER_STRICT: bool = False
+
 
 settings = Settings()
@@ -0,0 +1,101 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from typing import Any, AsyncIterator, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.user_use_case import UserUseCase
+from src.core.config import Settings
+from src.domain.models.user import User
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.backend import CacheBackend
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.database.base import get_session_factory
+from src.infrastructure.repositories.batched_user_repository import (
+    BatchedUserRepository,
+)
+from src.infrastructure.repositories.cached_user_repository import (
+    CachedUserRepository,
+)
+from src.infrastructure.repositories.user_repository_impl import (
+    UserRepositoryImpl,
+)
+from src.interfaces.controllers.user_controller import UserController
+
+_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "session", default=None
+)
+
+
+def bind_session(session: AsyncSession) -> Token[Optional[AsyncSession]]:
+    return _session.set(session)
+
+
+def reset_session(token: Token[Optional[AsyncSession]]) -> None:
+    _session.reset(token)
+
+
+@asynccontextmanager
+async def bound_session(
+    factory: Callable[[], AsyncSession]
+) -> AsyncIterator[AsyncSession]:
+    """Open a session and bind it for code running outside a request's
+    dependencies, such as a streamed response body."""
+    async with factory() as session:
+        token = bind_session(session)
+        try:
+            yield session
+        finally:
+            reset_session(token)
+
+
+class SessionProxy:
+    """Stands in for the current request's AsyncSession."""
+
+    def __getattr__(self, name: str) -> Any:
+        session = _session.get()
+        if session is None:
+            raise RuntimeError("No database session bound to this request")
+        return getattr(session, name)
+
+
+class Container:
+    """App-scoped object graph.
+
+    Repositories, use cases and controllers hold no per-request state, so
+    they are built once. The session is the only request-scoped object and
+    is reached through a ContextVar-backed proxy.
+    """
+
+    def __init__(
+        self,
+        config: Settings,
+        cache: Optional[CacheBackend],
+        loads: SingleFlight[User],
+    ) -> None:
+        self.session = SessionProxy()
+
+        repository: UserRepository = UserRepositoryImpl(
+            self.session  # type: ignore[arg-type]
+        )
+        if config.USER_LOADER_ENABLED:
+            repository = BatchedUserRepository(
+                repository,
+                # resolved per batch so tests can swap the factory
+                lambda: get_session_factory()(),
+                max_batch_size=config.USER_LOADER_MAX_BATCH,
+                session=self.session,  # type: ignore[arg-type]
+            )
+        if cache is not None:
+            repository = CachedUserRepository(
+                repository,
+                cache,
+                loads,
+                ttl=config.CACHE_TTL_SECONDS,
+                negative_ttl=config.CACHE_NEGATIVE_TTL_SECONDS,
+                count_ttl=config.COUNT_CACHE_TTL_SECONDS,
+            )
+
+        self.user_repository = repository
+        self.user_use_case = UserUseCase(repository)
+        self.user_controller = UserController(self.user_use_case)
@@ -1,27 +1,69 @@
+from typing import AsyncGenerator, Optional
+
 from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.use_cases.user_use_case import UserUseCase
+from src.core.config import settings
+from src.core.container import Container, bind_session, reset_session
+from src.core.exceptions import AuthError
+from src.domain.models.auth import Principal
+from src.domain.models.user import User
+from src.infrastructure.cache.backend import create_cache_backend
+from src.infrastructure.cache.single_flight import SingleFlight
 from src.infrastructure.database.base import get_db
-from src.infrastructure.repositories.user_repository_impl import (
-    UserRepositoryImpl,
-)
+from src.infrastructure.security.jwt import decode_principal
 from src.interfaces.controllers.user_controller import UserController
 
+user_cache = create_cache_backend(settings)
+user_loads: SingleFlight[User] = SingleFlight()
+bearer_scheme = HTTPBearer(auto_error=False)
+container = Container(settings, user_cache, user_loads)
+
 
-def get_user_respository(
+async def bind_request_session(
     session: AsyncSession = Depends(get_db),
-) -> UserRepositoryImpl:
-    return UserRepositoryImpl(session)
+) -> AsyncGenerator[AsyncSession, None]:
+    token = bind_session(session)
+    try:
+        yield session
+    finally:
+        reset_session(token)
 
 
-def get_user_use_case(
-    repository: UserRepositoryImpl = Depends(get_user_respository),
+# repositories, use cases and controllers are app singletons built by the
+# container; only the session is resolved per request, so tests override
+# get_db (or these providers) rather than a repository provider. async
+# providers also avoid the threadpool hop FastAPI makes for sync ones.
+async def get_user_use_case(
+    session: AsyncSession = Depends(bind_request_session),
 ) -> UserUseCase:
-    return UserUseCase(repository)
+    return container.user_use_case
 
 
-def get_user_controller(
-    use_case: UserUseCase = Depends(get_user_use_case),
+async def get_user_controller(
+    session: AsyncSession = Depends(bind_request_session),
 ) -> UserController:
-    return UserController(use_case)
+    return container.user_controller
+
+
+# streamed bodies are sent after request-scoped dependencies have closed
+# their sessions, so streaming routes bind one per response with
+# ``bound_session(get_session_factory())`` instead
+async def get_streaming_user_controller() -> UserController:
+    return container.user_controller
+
+
+async def get_current_principal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(
+        bearer_scheme
+    ),
+) -> Principal:
+    if credentials is None:
+        raise AuthError("Not authenticated")
+
+    principal = decode_principal(credentials.credentials)
+    if principal is None:
+        raise AuthError("Invalid or expired token")
+    return principal
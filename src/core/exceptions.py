@@ -29,3 +29,10 @@ class ValidationError(HTTPException):  # type: ignore
         self, detail: Any = None, headers: Optional[Dict[str, Any]] = None
     ) -> None:
         super().__init__(status.HTTP_422_UNPROCESSABLE_ENTITY, detail, headers)
+
+
+class ServiceUnavailableError(HTTPException):  # type: ignore
+    def __init__(
+        self, detail: Any = None, headers: Optional[Dict[str, Any]] = None
+    ) -> None:
+        super().__init__(status.HTTP_503_SERVICE_UNAVAILABLE, detail, headers)
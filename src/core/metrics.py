@@ -0,0 +1,155 @@
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(
+        self, name: str, description: str, labels: Sequence[str]
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_labels(self.labels, key)} {value}"
+            for key, value in self.values.items()
+        ]
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        # per label set: [count per bucket..., +Inf count, sum]
+        self.values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self) -> List[str]:
+        lines = []
+        bounds = [*(str(bound) for bound in self.buckets), "+Inf"]
+        for key, series in self.values.items():
+            cumulative = 0.0
+            for bound, count in zip(bounds, series):
+                cumulative += count
+                labels = _labels((*self.labels, "le"), (*key, bound))
+                lines.append(f"{self.name}_bucket{labels} {int(cumulative)}")
+            labels = _labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {series[-1]}")
+            lines.append(f"{self.name}_count{labels} {int(cumulative)}")
+        return lines
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, description: str, collect: Callable[[], float]
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.collect = collect
+
+    def samples(self) -> List[str]:
+        return [f"{self.name} {self.collect()}"]
+
+
+Metric = Union[Counter, Histogram, Gauge]
+
+
+class Registry:
+    """Minimal Prometheus text-format registry.
+
+    Metrics are only updated from the event loop thread, so plain dict
+    updates are enough and observing stays a couple of list operations.
+    """
+
+    def __init__(self) -> None:
+        self.metrics: Dict[str, Metric] = {}
+
+    def counter(
+        self, name: str, description: str, labels: Sequence[str]
+    ) -> Counter:
+        return self.__register(Counter(name, description, labels))  # type: ignore
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.__register(  # type: ignore
+            Histogram(name, description, labels, buckets)
+        )
+
+    def gauge(
+        self, name: str, description: str, collect: Callable[[], float]
+    ) -> Gauge:
+        return self.__register(Gauge(name, description, collect))  # type: ignore
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def __register(self, metric: Metric) -> Metric:
+        # re-registering (e.g. on module reload) keeps the existing series
+        return self.metrics.setdefault(metric.name, metric)
+
+
+registry = Registry()
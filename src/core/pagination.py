@@ -0,0 +1,36 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Tuple
+from uuid import UUID
+
+from src.core.exceptions import ValidationError
+
+
+def encode_cursor(value: Any, user_id: UUID, sort: str = "created_at") -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort, value, str(user_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str = "created_at") -> Tuple[Any, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, user_id = json.loads(
+            base64.urlsafe_b64decode(padded)
+        )
+        if cursor_sort != sort:
+            raise ValueError(f"cursor was issued for sort={cursor_sort}")
+        # every sort key is a string on the wire; anything else would be
+        # bound into the keyset comparison as is
+        if not isinstance(value, str):
+            raise ValueError("cursor value must be a string")
+        if sort.lstrip("-") == "created_at":
+            value = datetime.fromisoformat(value)
+        if not isinstance(user_id, str):
+            raise ValueError("cursor id must be a string")
+        return value, UUID(user_id)
+    except (binascii.Error, TypeError, ValueError) as error:
+        raise ValidationError(f"Invalid cursor: {error}")
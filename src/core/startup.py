@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from time import perf_counter
+
+from src import STARTED_AT
+
+
+@dataclass
+class Startup:
+    """Startup timings, in seconds since the first ``src`` import."""
+
+    import_seconds: float = 0.0
+    warmup_seconds: float = 0.0
+    ready_seconds: float = 0.0
+    ready: bool = False
+
+    def mark_imported(self) -> None:
+        self.import_seconds = perf_counter() - STARTED_AT
+
+    def mark_ready(self, warmup_seconds: float) -> None:
+        self.warmup_seconds = warmup_seconds
+        self.ready_seconds = perf_counter() - STARTED_AT
+        self.ready = True
+
+
+startup = Startup()
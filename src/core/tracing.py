@@ -0,0 +1,125 @@
+import random
+from contextvars import ContextVar, Token
+from functools import wraps
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+)
+
+from src.core.metrics import registry
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+span_duration = registry.histogram(
+    "span_duration_seconds",
+    "Duration of traced layers in sampled requests.",
+    ["span"],
+)
+
+
+class Trace:
+    """Span timings collected for a single sampled request."""
+
+    def __init__(self) -> None:
+        self.started_at = perf_counter()
+        self.spans: Dict[str, List[float]] = {}
+        self.marks: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        entry = self.spans.setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+    def mark(self, name: str) -> None:
+        self.marks[name] = perf_counter()
+
+    def elapsed(self) -> float:
+        return perf_counter() - self.started_at
+
+    def finish(self) -> None:
+        for name, (seconds, _) in self.spans.items():
+            span_duration.observe(seconds, name)
+
+    def server_timing(self) -> str:
+        entries = []
+        for name, (seconds, count) in self.spans.items():
+            entry = f"{name};dur={seconds * 1000:.3f}"
+            if count > 1:
+                entry += f';desc="{int(count)} calls"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.elapsed() * 1000:.3f}")
+        return ", ".join(entries)
+
+
+_current: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current.get()
+
+
+def start_trace(sample_rate: float) -> Tuple[Optional[Trace], Token[Any]]:
+    # unsampled requests carry None, so every instrumentation point below
+    # costs a single ContextVar lookup
+    trace = Trace() if random.random() < sample_rate else None
+    return trace, _current.set(trace)
+
+
+def end_trace(token: Token[Any]) -> None:
+    _current.reset(token)
+
+
+class span:
+    """Time a block of code as ``name`` when the current request is traced."""
+
+    __slots__ = ("name", "trace", "started_at")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "span":
+        self.trace = _current.get()
+        if self.trace is not None:
+            self.started_at = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.trace is not None:
+            self.trace.add(self.name, perf_counter() - self.started_at)
+
+
+def traced(
+    name: str,
+) -> Callable[
+    [Callable[P, Awaitable[T]]], Callable[P, Coroutine[Any, Any, T]]
+]:
+    """Record calls to a coroutine function as a ``name`` span."""
+
+    def decorator(
+        func: Callable[P, Awaitable[T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            trace = _current.get()
+            if trace is None:
+                return await func(*args, **kwargs)
+
+            started_at = perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                trace.add(name, perf_counter() - started_at)
+
+        return wrapper
+
+    return decorator
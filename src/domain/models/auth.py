@@ -0,0 +1,11 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Principal(BaseModel):  # type: ignore
+    subject: str
+    scopes: List[str] = Field(default_factory=list)
+    expires_at: Optional[datetime] = None
+    claims: Dict[str, Any] = Field(default_factory=dict)
@@ -1,8 +1,8 @@
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import List, Literal, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 
 
 class BaseUser(BaseModel):  # type: ignore
@@ -20,3 +20,54 @@ class User(BaseUser):
 
 class CreateUser(User):
     password: str
+
+
+UserSort = Literal[
+    "created_at", "-created_at", "name", "-name", "email", "-email"
+]
+
+
+class UserFilter(BaseModel):  # type: ignore
+    is_active: Optional[bool] = None
+    is_superuser: Optional[bool] = None
+    email_domain: Optional[str] = Field(
+        default=None, min_length=1, max_length=253
+    )
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+    @field_validator("created_after", "created_before")
+    @classmethod
+    def _naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # created_at is stored without a time zone, in UTC; asyncpg refuses
+        # to compare it with an aware datetime
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class UserCount(BaseModel):  # type: ignore
+    total: int
+    exact: bool = True
+
+
+class UserPage(BaseModel):  # type: ignore
+    items: List[User]
+    next_cursor: Optional[str] = None
+
+
+class BulkUserResult(BaseModel):  # type: ignore
+    index: int
+    status: Literal["created", "duplicate", "invalid"]
+    user: Optional[User] = None
+    detail: Optional[str] = None
+
+
+class UserBatch(BaseModel):  # type: ignore
+    users: List[User]
+    not_found: List[UUID]
+
+
+class BulkDeleteResult(BaseModel):  # type: ignore
+    deleted: List[UUID]
+    not_found: List[UUID]
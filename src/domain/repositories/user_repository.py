@@ -1,23 +1,68 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from src.domain.models.user import CreateUser, User
+from src.domain.models.user import (
+    BulkDeleteResult,
+    BulkUserResult,
+    CreateUser,
+    User,
+    UserCount,
+    UserFilter,
+    UserPage,
+    UserSort,
+)
 
 
 class UserRepository(ABC):
     @abstractmethod
-    async def get_all_users(self) -> List[User]:
+    async def get_all_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[UserFilter] = None,
+        sort: UserSort = "created_at",
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPage:
+        ...
+
+    @abstractmethod
+    async def count_users(
+        self, filters: Optional[UserFilter] = None, approximate: bool = False
+    ) -> UserCount:
+        ...
+
+    @abstractmethod
+    def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
         ...
 
     @abstractmethod
     async def get_user_by_id(self, user_id: UUID) -> User:
         ...
 
+    @abstractmethod
+    async def get_user_updated_at(self, user_id: UUID) -> datetime:
+        ...
+
+    @abstractmethod
+    async def get_users_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        ...
+
     @abstractmethod
     async def create_user(self, user: CreateUser) -> User:
         ...
 
+    @abstractmethod
+    async def create_users(
+        self, users: List[CreateUser]
+    ) -> List[BulkUserResult]:
+        ...
+
     @abstractmethod
     async def delete_user(self, user_id: UUID) -> Dict[str, str]:
         ...
+
+    @abstractmethod
+    async def delete_users(self, user_ids: List[UUID]) -> BulkDeleteResult:
+        ...
@@ -0,0 +1,115 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from src.core.config import Settings
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        ...
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Set ``key`` only if it is absent; return whether it was set."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, client: Any, prefix: str = "cache:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self.client.get(self.prefix + key)
+        return None if value is None else bytes(value)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        # Redis rejects a zero expiry; like the in-memory backend, a
+        # non-positive ttl leaves nothing behind
+        if ttl <= 0:
+            await self.delete(key)
+            return
+        await self.client.set(self.prefix + key, value, px=_millis(ttl))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        if ttl <= 0:
+            return await self.get(key) is None
+        return bool(
+            await self.client.set(
+                self.prefix + key, value, px=_millis(ttl), nx=True
+            )
+        )
+
+
+def _millis(ttl: float) -> int:
+    # sub-millisecond ttls would round down to Redis' invalid 0
+    return max(1, int(ttl * 1000))
+
+
+def create_cache_backend(
+    config: Settings,
+    prefix: str = "cache:",
+    max_entries: Optional[int] = None,
+) -> Optional[CacheBackend]:
+    if config.CACHE_BACKEND == "memory":
+        return InMemoryCacheBackend(max_entries or config.CACHE_MAX_ENTRIES)
+
+    if config.CACHE_BACKEND == "redis":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as error:  # pragma: no cover
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' extra"
+            ) from error
+        return RedisCacheBackend(Redis.from_url(config.REDIS_URL), prefix)
+
+    return None
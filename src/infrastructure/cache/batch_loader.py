@@ -0,0 +1,79 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Coalesces loads issued in the same event-loop tick into one batch.
+
+    The batch runs in a task created from the context of the caller that
+    opened it and serves every caller in it, so ``load_many`` must not
+    rely on context-bound resources such as a request session. Keys
+    missing from the batch result load as None.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[K]], Awaitable[Mapping[K, V]]],
+        max_batch_size: int = 100,
+    ) -> None:
+        self.load_many = load_many
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._scheduled: Optional[asyncio.Handle] = None
+        self._running: Set["asyncio.Task[None]"] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._scheduled is None:
+                self._scheduled = loop.call_soon(self._dispatch)
+
+        # shield so one cancelled caller does not cancel the shared batch
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+        batch, self._pending = self._pending, {}
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(
+        self, batch: Dict[K, "asyncio.Future[Optional[V]]"]
+    ) -> None:
+        try:
+            values = await self.load_many(list(batch))
+        except asyncio.CancelledError:
+            # a cancelled batch must not leave its callers waiting forever
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in batch.values():
+                future.set_exception(error)
+            return
+
+        for key, future in batch.items():
+            future.set_result(values.get(key))
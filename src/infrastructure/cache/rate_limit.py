@@ -0,0 +1,89 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Tuple
+
+from src.core.config import Settings
+
+
+class RateLimitBackend(ABC):
+    """Token buckets holding up to ``burst`` tokens, refilled at ``rate``
+    tokens per second."""
+
+    @abstractmethod
+    async def acquire(self, key: str, rate: float, burst: int) -> float:
+        """Take one token; return 0 on success, else seconds until one is
+        available."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Per-worker buckets; with N workers a client gets up to N times the
+    budget. Idle keys are evicted least recently used first."""
+
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+
+    async def acquire(self, key: str, rate: float, burst: int) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated_at) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+# Runs atomically on the server, against the server's clock, so every
+# worker shares one bucket per key. Keys expire once they would be full.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    def __init__(self, client: Any, prefix: str = "ratelimit:") -> None:
+        self.client = client
+        self.prefix = prefix
+        # EVALSHA, falling back to loading the script on first use
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    async def acquire(self, key: str, rate: float, burst: int) -> float:
+        wait = await self._script(keys=[self.prefix + key], args=[rate, burst])
+        return float(wait)
+
+
+def create_rate_limit_backend(config: Settings) -> RateLimitBackend:
+    if config.RATE_LIMIT_BACKEND == "redis":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as error:  # pragma: no cover
+            raise RuntimeError(
+                "RATE_LIMIT_BACKEND=redis requires the 'redis' extra"
+            ) from error
+        return RedisRateLimitBackend(Redis.from_url(config.REDIS_URL))
+
+    return InMemoryRateLimitBackend(config.RATE_LIMIT_MAX_KEYS)
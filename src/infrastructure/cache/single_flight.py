@@ -0,0 +1,23 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    def __init__(self) -> None:
+        self._calls: Dict[str, "asyncio.Future[T]"] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._forget(key, done))
+
+        # shield so one cancelled caller does not cancel the shared load
+        return await asyncio.shield(call)
+
+    def _forget(self, key: str, call: "asyncio.Future[T]") -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
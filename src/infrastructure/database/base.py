@@ -1,16 +1,96 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional, cast
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.sql import functions
 
-from src.core.config import settings
+from src.core.config import Settings, settings
+from src.infrastructure.database.pool import InstrumentedQueuePool
+from src.infrastructure.database.replicas import ReplicaSet, RoutingSession
 
 Base = declarative_base()
 
-engine = create_async_engine(settings.DATABASE_URI, echo=True)
-async_session = sessionmaker(
-    bind=engine, class_=AsyncSession, expire_on_commit=False
-)
+
+@compiles(functions.now, "sqlite")
+def _sqlite_now(element: functions.now, compiler: Any, **kw: Any) -> str:
+    # SQLite's CURRENT_TIMESTAMP has second precision, which breaks the
+    # ordering against microsecond-precision bound parameters.
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+def create_engine_from_settings(
+    config: Settings, url: Optional[str] = None
+) -> AsyncEngine:
+    # a computed field, which mypy sees as a method
+    url = url or cast(str, config.DATABASE_URI)
+    connect_args: Dict[str, Any] = {}
+    if make_url(url).get_backend_name() == "postgresql":
+        connect_args[
+            "statement_cache_size"
+        ] = config.DATABASE_STATEMENT_CACHE_SIZE
+        if config.DATABASE_STATEMENT_TIMEOUT_MS:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(config.DATABASE_STATEMENT_TIMEOUT_MS)
+            }
+
+    return create_async_engine(
+        url,
+        echo=config.DATABASE_ECHO,
+        poolclass=InstrumentedQueuePool,
+        pool_size=config.DATABASE_POOL_SIZE,
+        max_overflow=config.DATABASE_MAX_OVERFLOW,
+        pool_timeout=config.DATABASE_POOL_TIMEOUT,
+        pool_recycle=config.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=config.DATABASE_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+
+def create_replica_set(config: Settings) -> Optional[ReplicaSet]:
+    if not config.DATABASE_REPLICA_URLS:
+        return None
+
+    return ReplicaSet(
+        [
+            create_engine_from_settings(config, url)
+            for url in config.DATABASE_REPLICA_URLS
+        ],
+        strategy=config.DATABASE_REPLICA_STRATEGY,
+        retry_after=config.DATABASE_REPLICA_RETRY_SECONDS,
+    )
+
+
+def create_session_factory(
+    primary: AsyncEngine, replicas: Optional[ReplicaSet] = None
+) -> async_sessionmaker[AsyncSession]:
+    if replicas is None:
+        return async_sessionmaker(
+            bind=primary, class_=AsyncSession, expire_on_commit=False
+        )
+
+    return async_sessionmaker(
+        bind=primary,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
+    )
+
+
+engine = create_engine_from_settings(settings)
+replica_set = create_replica_set(settings)
+async_session = create_session_factory(engine, replica_set)
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    return async_session
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -0,0 +1,93 @@
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry, PoolProxiedConnection
+
+from src.core.metrics import registry
+from src.core.tracing import current_trace
+
+query_duration = registry.histogram(
+    "db_query_duration_seconds",
+    "Duration of SQL statements in sampled requests.",
+    ["operation"],
+)
+connection_hold = registry.histogram(
+    "db_connection_hold_seconds",
+    "Time a pooled connection stays checked out.",
+    [],
+)
+queries_total = registry.counter(
+    "db_queries_total",
+    "SQL statements executed in sampled requests.",
+    ["operation"],
+)
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    if current_trace() is not None:
+        context._query_started_at = perf_counter()  # type: ignore
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    started_at = getattr(context, "_query_started_at", None)
+    trace = current_trace()
+    if started_at is None or trace is None:
+        return
+
+    elapsed = perf_counter() - started_at
+    operation = statement.lstrip().split(None, 1)[0].upper()
+    trace.add("db", elapsed)
+    query_duration.observe(elapsed, operation)
+    queries_total.inc(operation)
+
+
+def _checkout(
+    dbapi_connection: Any,
+    record: ConnectionPoolEntry,
+    proxy: PoolProxiedConnection,
+) -> None:
+    record.info["checked_out_at"] = perf_counter()
+
+
+def _checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+    checked_out_at = record.info.pop("checked_out_at", None)
+    if checked_out_at is None:
+        return
+
+    held = perf_counter() - checked_out_at
+    connection_hold.observe(held)
+    trace = current_trace()
+    if trace is not None:
+        trace.add("db_hold", held)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every statement run on ``engine`` into the current trace and
+    record how long each pooled connection is held."""
+    sync_engine = engine.sync_engine
+    if event.contains(
+        sync_engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "checkout", _checkout)
+    event.listen(sync_engine, "checkin", _checkin)
@@ -0,0 +1,84 @@
+import asyncio
+from time import monotonic
+from typing import Awaitable, Callable, Optional
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.core.config import settings
+from src.core.exceptions import NotFoundError
+from src.infrastructure.repositories.user_repository_impl import (
+    UserRepositoryImpl,
+)
+
+Warm = Callable[[AsyncConnection], Awaitable[None]]
+
+
+async def prefill_pool(
+    engine: AsyncEngine, connections: int, warm: Optional[Warm] = None
+) -> None:
+    """Open ``connections`` pool connections at once, warming each one.
+
+    Connections are held until all of them are open, so the pool really
+    ends up with that many, and are then checked back in.
+    """
+    if connections <= 0:
+        return
+    barrier = asyncio.Barrier(connections)
+
+    async def hold() -> None:
+        try:
+            async with engine.connect() as connection:
+                if warm is not None:
+                    await warm(connection)
+                await barrier.wait()
+        except BaseException:
+            # release the connections already waiting at the barrier
+            await barrier.abort()
+            raise
+
+    # wait for every holder, so all connections are back in the pool
+    # before a failure is raised
+    results = await asyncio.gather(
+        *(hold() for _ in range(connections)), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def warm_user_queries(connection: AsyncConnection) -> None:
+    """Run the hot repository queries once on ``connection``.
+
+    This fills SQLAlchemy's compiled-statement cache and, on asyncpg, the
+    connection's prepared-statement cache and type introspection, which
+    the first requests would otherwise pay for.
+    """
+    async with AsyncSession(bind=connection) as session:
+        repository = UserRepositoryImpl(session)
+        await repository.get_all_users(settings.DEFAULT_PAGE_SIZE)
+        await repository.get_all_users(
+            settings.DEFAULT_PAGE_SIZE, fields=["updated_at"]
+        )
+        await repository.get_users_by_ids([uuid4()])
+        for lookup in (
+            repository.get_user_by_id,
+            repository.get_user_updated_at,
+        ):
+            try:
+                await lookup(uuid4())
+            except NotFoundError:
+                pass
+        await session.rollback()
+
+
+async def drain_pool(engine: AsyncEngine, timeout: float) -> int:
+    """Wait up to ``timeout`` seconds for checked-out connections to return.
+
+    Returns how many were still checked out when the wait ended.
+    """
+    pool = engine.sync_engine.pool
+    deadline = monotonic() + timeout
+    while pool.checkedout() and monotonic() < deadline:  # type: ignore
+        await asyncio.sleep(0.05)
+    return pool.checkedout()  # type: ignore[attr-defined, no-any-return]
@@ -1,6 +1,6 @@
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, String, func
+from sqlalchemy import Boolean, Column, DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 
 from src.infrastructure.database.base import Base
@@ -8,7 +8,6 @@ from src.infrastructure.database.base import Base
 
 class User(Base):  # type: ignore
     __tablename__ = "users"
-
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False, index=True)
@@ -19,3 +18,26 @@ class User(Base):  # type: ignore
     )
     is_active = Column(Boolean, nullable=False, default=True)
     is_superuser = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        Index("ix_users_created_at_id", created_at, id),
+        Index("ix_users_name_id", name, id),
+        # Postgres-only: partial indexes for the common list filters and the
+        # expression index behind the email_domain filter
+        Index(
+            "ix_users_active_created_at_id",
+            created_at,
+            id,
+            postgresql_where=is_active,
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_superuser_created_at_id",
+            created_at,
+            id,
+            postgresql_where=is_superuser,
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_email_domain",
+            func.lower(func.split_part(email, "@", 2)),
+        ).ddl_if(dialect="postgresql"),
+    )
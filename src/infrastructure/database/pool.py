@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, cast
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    QueuePool,
+)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    waits: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Counts and times checkouts that had to wait for a connection to be
+    returned; checkouts served at once or by opening a new connection are
+    not waits."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        # the queue only blocks when it is empty and no overflow is left
+        blocks = (
+            self._pool.empty()
+            and self._max_overflow > -1
+            and self._overflow >= self._max_overflow
+        )
+        if not blocks:
+            return super()._do_get()
+
+        started_at = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = perf_counter() - started_at
+            self.waits += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats:
+    pool = cast(QueuePool, engine.sync_engine.pool)
+    return PoolStats(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=pool.overflow(),
+        waits=getattr(pool, "waits", 0),
+        wait_seconds_total=getattr(pool, "wait_seconds_total", 0.0),
+        wait_seconds_max=getattr(pool, "wait_seconds_max", 0.0),
+    )
@@ -0,0 +1,202 @@
+import hashlib
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDERS = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_IN_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class RepeatedQueryError(RuntimeError):
+    pass
+
+
+def normalize(statement: str) -> str:
+    """Reduce a statement to its shape: literals and bind markers become
+    ``?``, IN lists collapse and whitespace/case are folded."""
+    normalized = _COMMENTS.sub(" ", statement)
+    normalized = _STRINGS.sub("?", normalized)
+    normalized = _PLACEHOLDERS.sub("?", normalized)
+    normalized = _NUMBERS.sub("?", normalized)
+    normalized = _IN_LISTS.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip().lower()
+
+
+def fingerprint(statement: str) -> str:
+    return hashlib.sha1(normalize(statement).encode()).hexdigest()[:16]
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> str:
+    """Describe bound parameters by type only, never by value."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameters[0] if parameters else ()
+        return f"{len(parameters)} x {parameter_shape(first)}"
+    if isinstance(parameters, dict):
+        items = ", ".join(
+            f"{key}: {type(value).__name__}"
+            for key, value in parameters.items()
+        )
+        return "{" + items + "}"
+    if isinstance(parameters, (list, tuple)):
+        return (
+            "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+        )
+    return type(parameters).__name__
+
+
+@dataclass
+class QueryProfile:
+    """Queries executed while a profile is active (usually one request)."""
+
+    total: int = 0
+    seconds: float = 0.0
+    counts: Counter[str] = field(default_factory=Counter)
+    statements: Dict[str, str] = field(default_factory=dict)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        key = fingerprint(statement)
+        self.total += 1
+        self.seconds += elapsed
+        self.counts[key] += 1
+        self.statements.setdefault(key, normalize(statement))
+
+    def repeated(self, threshold: int) -> List[str]:
+        return [
+            self.statements[key]
+            for key, count in self.counts.items()
+            if count > threshold
+        ]
+
+    def report(self) -> str:
+        lines = [f"{self.total} queries in {self.seconds * 1000:.1f}ms"]
+        lines.extend(
+            f"  {count:>4} x {self.statements[key]}"
+            for key, count in self.counts.most_common()
+        )
+        return "\n".join(lines)
+
+
+_current: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "query_profile", default=None
+)
+
+
+class QueryProfiler:
+    """Opt-in slow-query log and repeated-query (N+1) detector.
+
+    Attach it to an engine with :meth:`attach`, then wrap units of work
+    (a request, a test) in :meth:`profile`.
+    """
+
+    def __init__(
+        self,
+        slow_threshold_ms: float,
+        repeat_threshold: int,
+        strict: bool = False,
+    ) -> None:
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.repeat_threshold = repeat_threshold
+        self.strict = strict
+
+    def attach(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        if event.contains(sync_engine, "before_cursor_execute", self._before):
+            return
+
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+
+    def detach(self, engine: AsyncEngine) -> None:
+        sync_engine = engine.sync_engine
+        if event.contains(sync_engine, "before_cursor_execute", self._before):
+            event.remove(sync_engine, "before_cursor_execute", self._before)
+            event.remove(sync_engine, "after_cursor_execute", self._after)
+
+    @contextmanager
+    def profile(
+        self,
+        repeat_threshold: Optional[int] = None,
+        strict: Optional[bool] = None,
+    ) -> Iterator[QueryProfile]:
+        profile = QueryProfile()
+        token = _current.set(profile)
+        try:
+            yield profile
+        finally:
+            _current.reset(token)
+
+        threshold = (
+            self.repeat_threshold
+            if repeat_threshold is None
+            else repeat_threshold
+        )
+        repeated = profile.repeated(threshold)
+        if not repeated:
+            return
+
+        message = (
+            f"{len(repeated)} statement(s) ran more than {threshold} times "
+            f"in one unit of work, likely N+1:\n{profile.report()}"
+        )
+        if self.strict if strict is None else strict:
+            raise RepeatedQueryError(message)
+        logger.warning(message)
+
+    def _before(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        context._profiler_started_at = perf_counter()  # type: ignore
+
+    def _after(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        elapsed = perf_counter() - context._profiler_started_at  # type: ignore
+
+        profile = _current.get()
+        if profile is not None:
+            profile.record(statement, elapsed)
+
+        if elapsed >= self.slow_threshold:
+            logger.warning(
+                "slow query %.1fms [%s]: %s params=%s",
+                elapsed * 1000,
+                fingerprint(statement),
+                _WHITESPACE.sub(" ", statement).strip(),
+                parameter_shape(parameters, executemany),
+            )
+
+
+query_profiler = QueryProfiler(
+    settings.SLOW_QUERY_THRESHOLD_MS,
+    settings.QUERY_REPEAT_THRESHOLD,
+    settings.QUERY_PROFILER_STRICT,
+)
@@ -0,0 +1,131 @@
+import asyncio
+import itertools
+from time import monotonic
+from typing import Any, Dict, Literal, Optional, Sequence, Union, cast
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+Strategy = Literal["round_robin", "least_connections"]
+
+
+class ReplicaSet:
+    """Read replicas with round-robin or least-connections selection.
+
+    Health is tracked passively: a replica whose connection fails is taken
+    out of rotation for ``retry_after`` seconds and then tried again.
+    :meth:`check_health` probes every replica actively.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        strategy: Strategy = "round_robin",
+        retry_after: float = 30.0,
+    ) -> None:
+        self.engines = list(engines)
+        self.strategy = strategy
+        self.retry_after = retry_after
+        self._down_until: Dict[int, float] = {}
+        self._turn = itertools.count()
+        for engine in self.engines:
+            event.listen(engine.sync_engine, "handle_error", self._on_error)
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Pick a healthy replica, or None to fall back to the primary."""
+        now = monotonic()
+        healthy = [
+            engine
+            for engine in self.engines
+            if self._down_until.get(id(engine.sync_engine), 0.0) <= now
+        ]
+        if not healthy:
+            return None
+        if self.strategy == "least_connections":
+            return min(
+                healthy,
+                key=lambda engine: cast(
+                    QueuePool, engine.sync_engine.pool
+                ).checkedout(),
+            )
+        return healthy[next(self._turn) % len(healthy)]
+
+    def mark_down(self, engine: Engine) -> None:
+        self._down_until[id(engine)] = monotonic() + self.retry_after
+
+    def mark_up(self, engine: Engine) -> None:
+        self._down_until.pop(id(engine), None)
+
+    async def check_health(self, timeout: float = 2.0) -> Dict[str, bool]:
+        """Ping every replica and update its state, keyed by masked URL."""
+        results = await asyncio.gather(
+            *(self._ping(engine, timeout) for engine in self.engines)
+        )
+        return {
+            engine.url.render_as_string(hide_password=True): healthy
+            for engine, healthy in zip(self.engines, results)
+        }
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+    async def _ping(self, engine: AsyncEngine, timeout: float) -> bool:
+        try:
+            async with asyncio.timeout(timeout):
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except Exception:
+            self.mark_down(engine.sync_engine)
+            return False
+
+        self.mark_up(engine.sync_engine)
+        return True
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        # connect failures arrive without a connection; dropped
+        # connections are flagged as disconnects by the dialect
+        if context.connection is None or context.is_disconnect:
+            self.mark_down(context.engine)  # type: ignore[arg-type]
+
+
+class RoutingSession(Session):
+    """Sends plain SELECTs to a replica and everything else to the primary.
+
+    Once the session has written, later reads stay on the primary so a
+    request always sees its own writes despite replication lag.
+    """
+
+    def __init__(
+        self, replicas: Optional[ReplicaSet] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.replicas = replicas
+        self.wrote = False
+
+    def get_bind(
+        self,
+        mapper: Optional[Any] = None,
+        *,
+        clause: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Union[Engine, Connection]:
+        if (
+            self.replicas is not None
+            and not self.wrote
+            and not self._flushing
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+        ):
+            replica = self.replicas.choose()
+            if replica is not None:
+                return replica.sync_engine
+
+        if self._flushing or clause is None or isinstance(clause, UpdateBase):
+            self.wrote = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
@@ -0,0 +1,112 @@
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import NotFoundError
+from src.domain.models.user import (
+    BulkDeleteResult,
+    BulkUserResult,
+    CreateUser,
+    User,
+    UserCount,
+    UserFilter,
+    UserPage,
+    UserSort,
+)
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.batch_loader import BatchLoader
+from src.infrastructure.repositories.user_repository_impl import (
+    UserRepositoryImpl,
+)
+
+
+class BatchedUserRepository(UserRepository):
+    """Serves concurrent single-user lookups from one batched query.
+
+    A batch mixes lookups from many requests, so it runs on a session of
+    its own from ``sessions`` rather than on any one request's session.
+    A request whose ``session`` has written reads through ``repository``
+    instead, so it keeps seeing its own writes on the primary.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        sessions: Callable[[], AsyncSession],
+        max_batch_size: int = 100,
+        session: Optional[AsyncSession] = None,
+    ) -> None:
+        self.repository = repository
+        self.sessions = sessions
+        self.session = session
+        self.loader: BatchLoader[UUID, User] = BatchLoader(
+            self.__load_many, max_batch_size
+        )
+
+    async def get_all_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[UserFilter] = None,
+        sort: UserSort = "created_at",
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPage:
+        return await self.repository.get_all_users(
+            limit, cursor, filters, sort, fields
+        )
+
+    async def count_users(
+        self, filters: Optional[UserFilter] = None, approximate: bool = False
+    ) -> UserCount:
+        return await self.repository.count_users(filters, approximate)
+
+    def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self.repository.stream_users(batch_size)
+
+    async def get_user_by_id(self, user_id: UUID) -> User:
+        if self.__wrote():
+            return await self.repository.get_user_by_id(user_id)
+
+        user = await self.loader.load(user_id)
+        if user is None:
+            raise NotFoundError(f"User with ID {user_id} not found.")
+        return user
+
+    async def get_user_updated_at(self, user_id: UUID) -> datetime:
+        return await self.repository.get_user_updated_at(user_id)
+
+    async def get_users_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        return await self.repository.get_users_by_ids(user_ids)
+
+    async def create_user(self, user: CreateUser) -> User:
+        return await self.repository.create_user(user)
+
+    async def create_users(
+        self, users: List[CreateUser]
+    ) -> List[BulkUserResult]:
+        return await self.repository.create_users(users)
+
+    async def delete_user(self, user_id: UUID) -> Dict[str, str]:
+        return await self.repository.delete_user(user_id)
+
+    async def delete_users(self, user_ids: List[UUID]) -> BulkDeleteResult:
+        return await self.repository.delete_users(user_ids)
+
+    async def __load_many(self, user_ids: List[UUID]) -> Dict[UUID, User]:
+        async with self.sessions() as session:
+            users = await UserRepositoryImpl(session).get_users_by_ids(
+                user_ids
+            )
+        return {user.id: user for user in users}
+
+    def __wrote(self) -> bool:
+        if self.session is None:
+            return False
+        try:
+            sync_session = self.session.sync_session
+        except RuntimeError:  # no request session bound
+            return False
+        # RoutingSession pins a session to the primary once it writes
+        return bool(getattr(sync_session, "wrote", False))
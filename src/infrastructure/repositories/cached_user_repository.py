@@ -0,0 +1,173 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, cast
+from uuid import UUID
+
+from src.core.exceptions import NotFoundError
+from src.domain.models.user import (
+    BulkDeleteResult,
+    BulkUserResult,
+    CreateUser,
+    User,
+    UserCount,
+    UserFilter,
+    UserPage,
+    UserSort,
+)
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.backend import CacheBackend
+from src.infrastructure.cache.single_flight import SingleFlight
+
+MISSING = b"\x00"
+
+
+class CachedUserRepository(UserRepository):
+    def __init__(
+        self,
+        repository: UserRepository,
+        cache: CacheBackend,
+        loads: SingleFlight[User],
+        ttl: float,
+        negative_ttl: float,
+        count_ttl: float = 0.0,
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.loads = loads
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.count_ttl = count_ttl
+
+    async def get_all_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[UserFilter] = None,
+        sort: UserSort = "created_at",
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPage:
+        return await self.repository.get_all_users(
+            limit, cursor, filters, sort, fields
+        )
+
+    async def count_users(
+        self, filters: Optional[UserFilter] = None, approximate: bool = False
+    ) -> UserCount:
+        # only estimates are cached, exact counts are always fresh
+        if not approximate or not self.count_ttl:
+            return await self.repository.count_users(filters, approximate)
+
+        key = "users:count:" + (filters or UserFilter()).model_dump_json()
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return UserCount.model_validate_json(cached)
+
+        count = await self.repository.count_users(filters, approximate)
+        await self.cache.set(
+            key, count.model_dump_json().encode(), self.count_ttl
+        )
+        return count
+
+    def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self.repository.stream_users(batch_size)
+
+    async def get_user_by_id(self, user_id: UUID) -> User:
+        key = self.__key(user_id)
+        cached = await self.cache.get(key)
+        if cached == MISSING:
+            raise NotFoundError(f"User with ID {user_id} not found.")
+        if cached is not None:
+            return User.model_validate_json(cached)
+
+        return await self.loads.do(key, lambda: self.__load(user_id))
+
+    async def get_user_updated_at(self, user_id: UUID) -> datetime:
+        # a cached body must revalidate against its own updated_at
+        cached = await self.cache.get(self.__key(user_id))
+        if cached == MISSING:
+            raise NotFoundError(f"User with ID {user_id} not found.")
+        if cached is not None:
+            return User.model_validate_json(cached).updated_at  # type: ignore
+        return await self.repository.get_user_updated_at(user_id)
+
+    async def get_users_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        user_ids = list(dict.fromkeys(user_ids))
+        cached = await asyncio.gather(
+            *(self.cache.get(self.__key(user_id)) for user_id in user_ids)
+        )
+        found = {
+            user_id: User.model_validate_json(value)
+            for user_id, value in zip(user_ids, cached)
+            if value is not None and value != MISSING
+        }
+
+        misses = [
+            user_id
+            for user_id, value in zip(user_ids, cached)
+            if value is None
+        ]
+        if misses:
+            loaded = {
+                cast(UUID, user.id): user
+                for user in await self.repository.get_users_by_ids(misses)
+            }
+            found.update(loaded)
+            await asyncio.gather(
+                *(
+                    self.cache.set(
+                        self.__key(user_id),
+                        loaded[user_id].model_dump_json().encode(),
+                        self.ttl,
+                    )
+                    if user_id in loaded
+                    else self.cache.set(
+                        self.__key(user_id), MISSING, self.negative_ttl
+                    )
+                    for user_id in misses
+                )
+            )
+
+        return [found[user_id] for user_id in user_ids if user_id in found]
+
+    async def create_user(self, user: CreateUser) -> User:
+        created = await self.repository.create_user(user)
+        await self.cache.delete(self.__key(created.id))
+        return created
+
+    async def create_users(
+        self, users: List[CreateUser]
+    ) -> List[BulkUserResult]:
+        results = await self.repository.create_users(users)
+        await self.cache.delete(
+            *(self.__key(result.user.id) for result in results if result.user)
+        )
+        return results
+
+    async def delete_user(self, user_id: UUID) -> Dict[str, str]:
+        try:
+            return await self.repository.delete_user(user_id)
+        finally:
+            await self.cache.delete(self.__key(user_id))
+
+    async def delete_users(self, user_ids: List[UUID]) -> BulkDeleteResult:
+        try:
+            return await self.repository.delete_users(user_ids)
+        finally:
+            await self.cache.delete(
+                *(self.__key(user_id) for user_id in user_ids)
+            )
+
+    async def __load(self, user_id: UUID) -> User:
+        key = self.__key(user_id)
+        try:
+            user = await self.repository.get_user_by_id(user_id)
+        except NotFoundError:
+            await self.cache.set(key, MISSING, self.negative_ttl)
+            raise
+
+        await self.cache.set(key, user.model_dump_json().encode(), self.ttl)
+        return user
+
+    @staticmethod
+    def __key(user_id: Optional[UUID]) -> str:
+        return f"user:{user_id}"
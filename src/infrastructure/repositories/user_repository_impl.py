@@ -1,29 +1,231 @@
-from typing import Dict, List
+import json
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 from uuid import UUID
 
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal,
+    literal_column,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Dialect
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.sql.dml import ReturningDelete
 
+from src.core.config import settings
 from src.core.exceptions import DuplicatedError, NotFoundError, ValidationError
-from src.domain.models.user import CreateUser, User
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.tracing import traced
+from src.domain.models.user import (
+    BulkDeleteResult,
+    BulkUserResult,
+    CreateUser,
+    User,
+    UserCount,
+    UserFilter,
+    UserPage,
+    UserSort,
+)
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.database.models.user import User as UserEntity
-from src.infrastructure.security.hash import hash_password
+from src.infrastructure.security.hash import (
+    hash_password_async,
+    hash_passwords_async,
+)
+
+USER_FIELDS = tuple(User.model_fields)
 
 
 class UserRepositoryImpl(UserRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def get_all_users(self) -> List[User]:
-        result = await self.session.execute(select(UserEntity))
-        users = result.scalars().all()
-        return [self.__to_domain(user) for user in users]
+    @traced("repository")
+    async def get_all_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[UserFilter] = None,
+        sort: UserSort = "created_at",
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPage:
+        key = getattr(UserEntity, sort.lstrip("-"))
+        descending = sort.startswith("-")
+        # the sort key and id are always fetched since they form the cursor
+        names = dict.fromkeys([*(fields or USER_FIELDS), "id", key.key])
+        statement = (
+            select(*(getattr(UserEntity, name) for name in names))
+            .where(*self.__conditions(filters))
+            .order_by(
+                *(
+                    (key.desc(), UserEntity.id.desc())
+                    if descending
+                    else (key, UserEntity.id)
+                )
+            )
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            value, user_id = decode_cursor(cursor, sort)
+            position = tuple_(key, UserEntity.id)
+            boundary = tuple_(value, user_id)
+            statement = statement.where(
+                position < boundary if descending else position > boundary
+            )
+
+        result = await self.session.execute(statement)
+        rows = result.all()
+        await self.__release()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(
+                getattr(rows[-1], key.key), rows[-1].id, sort
+            )
+
+        return UserPage(
+            items=[User.model_construct(**row._mapping) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    @traced("repository")
+    async def count_users(
+        self, filters: Optional[UserFilter] = None, approximate: bool = False
+    ) -> UserCount:
+        conditions = self.__conditions(filters)
+        if approximate and self.__dialect().name == "postgresql":
+            estimate = await self.__estimate_count(conditions)
+            # small results are cheap to count exactly, and estimates are
+            # least reliable there
+            if estimate is not None and (
+                estimate >= settings.COUNT_EXACT_THRESHOLD
+            ):
+                await self.__release()
+                return UserCount(total=estimate, exact=False)
+
+        statement = (
+            select(func.count()).select_from(UserEntity).where(*conditions)
+        )
+        total = await self.session.scalar(statement)
+        await self.__release()
+        return UserCount(total=total or 0, exact=True)
+
+    async def __estimate_count(
+        self, conditions: List[ColumnElement[bool]]
+    ) -> Optional[int]:
+        if not conditions:
+            # planner statistics, refreshed by ANALYZE/autovacuum; -1 means
+            # the table has never been analyzed
+            reltuples = await self.session.scalar(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)"
+                ),
+                {"table": UserEntity.__tablename__},
+            )
+            return (
+                reltuples if reltuples is not None and reltuples >= 0 else None
+            )
 
+        # let the planner estimate the filtered row count from the same
+        # predicates (and indexes) the list endpoint uses
+        statement: Select[Any] = select(UserEntity.id).where(*conditions)
+        compiled = statement.compile(
+            dialect=self.__dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+        # sent as-is: text() would read ":word" inside inlined literals
+        # (e.g. a searched domain) as bind parameters
+        connection = await self.session.connection()
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}"
+        )
+        plan: Any = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def __conditions(
+        self, filters: Optional[UserFilter]
+    ) -> List[ColumnElement[bool]]:
+        if filters is None:
+            return []
+
+        conditions: List[ColumnElement[bool]] = []
+        if filters.is_active is not None:
+            conditions.append(UserEntity.is_active == filters.is_active)
+        if filters.is_superuser is not None:
+            conditions.append(UserEntity.is_superuser == filters.is_superuser)
+        if filters.email_domain is not None:
+            domain = filters.email_domain.lower()
+            if self.__dialect().name == "postgresql":
+                # inline literals so the expression matches the
+                # ix_users_email_domain index under generic plans too
+                part = func.split_part(
+                    UserEntity.email,
+                    literal_column("'@'"),
+                    literal_column("2"),
+                )
+                conditions.append(func.lower(part) == domain)
+            else:
+                conditions.append(
+                    func.lower(UserEntity.email).endswith(
+                        f"@{domain}", autoescape=True
+                    )
+                )
+        if filters.created_after is not None:
+            conditions.append(
+                UserEntity.created_at >= literal(filters.created_after)
+            )
+        if filters.created_before is not None:
+            conditions.append(
+                UserEntity.created_at < literal(filters.created_before)
+            )
+        return conditions
+
+    async def stream_users(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[User]:
+        statement = (
+            select(UserEntity)
+            .order_by(UserEntity.created_at, UserEntity.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(statement)
+        try:
+            async for user in result.scalars():
+                yield self.__to_domain(user)
+        finally:
+            await result.close()
+
+    @traced("repository")
     async def get_user_by_id(self, user_id: UUID) -> User:
         try:
             user = await self.session.get(UserEntity, user_id)
+            await self.__release()
             if user is None:
                 raise NotFoundError(f"User with ID {user_id} not found.")
 
@@ -31,40 +233,182 @@ class UserRepositoryImpl(UserRepository):
         except SQLAlchemyError as error:
             raise NotFoundError(str(error))
 
-    async def __is_user_exist(self, user_email: UUID) -> bool:
-        statement = select(UserEntity.id).where(UserEntity.email == user_email)
-        result = await self.session.execute(statement)
-        return result.scalar() is not None
+    @traced("repository")
+    async def get_user_updated_at(self, user_id: UUID) -> datetime:
+        updated_at = await self.session.scalar(
+            select(UserEntity.updated_at).where(UserEntity.id == user_id)
+        )
+        await self.__release()
+        if updated_at is None:
+            raise NotFoundError(f"User with ID {user_id} not found.")
+        return cast(datetime, updated_at)
 
-    async def create_user(self, user: CreateUser) -> User:
-        if await self.__is_user_exist(user.email):
-            raise DuplicatedError(f"User {user.email} already exist")
+    @traced("repository")
+    async def get_users_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return []
+
+        statement = select(UserEntity).where(self.__id_in(user_ids))
+        users = {
+            cast(UUID, user.id): user
+            for user in (await self.session.scalars(statement)).all()
+        }
+        await self.__release()
+        return [
+            self.__to_domain(users[user_id])
+            for user_id in user_ids
+            if user_id in users
+        ]
+
+    def __id_in(self, user_ids: List[UUID]) -> ColumnElement[bool]:
+        return self.__any_of(
+            UserEntity.id, "user_ids", user_ids, postgresql.UUID(as_uuid=True)
+        )
+
+    def __any_of(
+        self,
+        column: ColumnElement[Any],
+        name: str,
+        values: List[Any],
+        item_type: Any,
+    ) -> ColumnElement[bool]:
+        # one array parameter keeps a single prepared statement whatever the
+        # number of values; SQLite has no arrays and expands IN (...) instead
+        if self.__dialect().name == "postgresql":
+            return column == any_(
+                bindparam(name, values, type_=postgresql.ARRAY(item_type))
+            )
+        return column.in_(values)
+
+    def __dialect(self) -> Dialect:
+        # sessions are always bound, to an engine or (in tests) a connection
+        bind = cast(Union[AsyncEngine, AsyncConnection], self.session.bind)
+        return bind.dialect
 
+    def __insert(self) -> Union[postgresql.Insert, sqlite.Insert]:
+        # ON CONFLICT lives on the dialect-specific insert constructs
+        if self.__dialect().name == "sqlite":
+            return sqlite.insert(UserEntity)
+        return postgresql.insert(UserEntity)
+
+    @traced("repository")
+    async def create_user(self, user: CreateUser) -> User:
         try:
             user_data = user.model_dump(
                 exclude={"id", "created_at", "updated_at"}
             )
-            user_data["password"] = hash_password(user_data.pop("password"))
+            user_data["password"] = await hash_password_async(
+                user_data.pop("password")
+            )
+
+            statement = (
+                self.__insert()
+                .values(**user_data)
+                .on_conflict_do_nothing(index_elements=[UserEntity.email])
+                .returning(UserEntity)
+            )
+            user_db = await self.session.scalar(statement)
+            if user_db is None:
+                await self.session.rollback()
+                raise DuplicatedError(f"User {user.email} already exist")
 
-            user_db = UserEntity(**user_data)
-            self.session.add(user_db)
             await self.session.commit()
-            await self.session.refresh(user_db)
             return self.__to_domain(user_db)
         except SQLAlchemyError as error:
             raise ValidationError(str(error))
 
+    async def __existing_emails(self, emails: List[str]) -> Set[str]:
+        statement: Select[Any] = select(UserEntity.email).where(
+            self.__any_of(UserEntity.email, "emails", emails, String)
+        )
+        result = await self.session.execute(statement)
+        return set(result.scalars().all())
+
+    @traced("repository")
+    async def create_users(
+        self, users: List[CreateUser]
+    ) -> List[BulkUserResult]:
+        results: Dict[int, BulkUserResult] = {}
+        pending: List[Tuple[int, CreateUser]] = []
+        seen = await self.__existing_emails([user.email for user in users])
+        # don't pin a connection while the batch is being hashed
+        await self.__release()
+
+        for index, user in enumerate(users):
+            if user.email in seen:
+                results[index] = BulkUserResult(
+                    index=index,
+                    status="duplicate",
+                    detail=f"User {user.email} already exist",
+                )
+            else:
+                seen.add(user.email)
+                pending.append((index, user))
+
+        if pending:
+            hashed = await hash_passwords_async(
+                [user.password for _, user in pending]
+            )
+            rows = [
+                {
+                    **user.model_dump(
+                        exclude={"id", "created_at", "updated_at", "password"}
+                    ),
+                    "password": password,
+                }
+                for (_, user), password in zip(pending, hashed)
+            ]
+
+            try:
+                statement = (
+                    self.__insert()
+                    .on_conflict_do_nothing(index_elements=[UserEntity.email])
+                    .returning(UserEntity)
+                )
+                created = {
+                    cast(str, user_db.email): user_db
+                    for user_db in await self.session.scalars(statement, rows)
+                }
+                await self.session.commit()
+            except SQLAlchemyError as error:
+                await self.session.rollback()
+                raise ValidationError(str(error))
+
+            # rows inserted concurrently by someone else are skipped by
+            # ON CONFLICT and come back as duplicates
+            for index, user in pending:
+                user_db = created.get(user.email)
+                results[index] = (
+                    BulkUserResult(
+                        index=index,
+                        status="created",
+                        user=self.__to_domain(user_db),
+                    )
+                    if user_db is not None
+                    else BulkUserResult(
+                        index=index,
+                        status="duplicate",
+                        detail=f"User {user.email} already exist",
+                    )
+                )
+
+        return [results[index] for index in range(len(users))]
+
+    @traced("repository")
     async def delete_user(self, user_id: UUID) -> Dict[str, str]:
         try:
-            stmt = select(UserEntity).where(UserEntity.id == user_id)
-
-            result = await self.session.execute(stmt)
-            user = result.scalars().first()
+            statement: ReturningDelete[Any] = (
+                delete(UserEntity)
+                .where(UserEntity.id == user_id)
+                .returning(UserEntity.id)
+            )
+            deleted = await self.session.scalar(statement)
 
-            if not user:
+            if deleted is None:
+                await self.session.rollback()
                 raise NotFoundError(f"User with ID {user_id} not found.")
 
-            await self.session.delete(user)
             await self.session.commit()
             return {"message": "User deleted"}
 
@@ -74,8 +418,40 @@ class UserRepositoryImpl(UserRepository):
                 f"Database error while deleting user ID {user_id}: {e}"
             )
 
+    @traced("repository")
+    async def delete_users(self, user_ids: List[UUID]) -> BulkDeleteResult:
+        user_ids = list(dict.fromkeys(user_ids))
+        try:
+            statement: ReturningDelete[Any] = (
+                delete(UserEntity)
+                .where(UserEntity.id.in_(user_ids))
+                .returning(UserEntity.id)
+            )
+            deleted = set((await self.session.scalars(statement)).all())
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ValidationError(f"Database error while deleting users: {e}")
+
+        return BulkDeleteResult(
+            deleted=[user_id for user_id in user_ids if user_id in deleted],
+            not_found=[
+                user_id for user_id in user_ids if user_id not in deleted
+            ],
+        )
+
+    async def __release(self) -> None:
+        # in unit_of_work scope a finished read ends its transaction so the
+        # connection goes back to the pool before hashing or serialization
+        if (
+            settings.DATABASE_SESSION_SCOPE == "unit_of_work"
+            and self.session.in_transaction()
+        ):
+            await self.session.commit()
+
     def __to_domain(self, user: UserEntity) -> User:
-        return User(
+        # rows were validated on the way in, skip re-running EmailStr & co.
+        return User.model_construct(
             id=user.id,
             name=user.name,
             email=user.email,
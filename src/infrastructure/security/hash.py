@@ -1,9 +1,107 @@
-from typing import cast
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, List, Optional, Sequence, TypeVar, cast
 
 from passlib.context import CryptContext
 
+from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableError
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HashPoolStats:
+    workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    wait_seconds_total: float
+    hash_seconds_total: float
+
+
+class HashPool:
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+        self._hash_seconds = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        # bcrypt releases the GIL, so threads give real parallelism here
+        # while _pending bounds how much work can queue up behind them.
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise ServiceUnavailableError(
+                "Password hashing capacity exhausted, retry later",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        submitted_at = perf_counter()
+
+        def job() -> T:
+            started_at = perf_counter()
+            try:
+                return func(*args)
+            finally:
+                finished_at = perf_counter()
+                with self._lock:
+                    self._completed += 1
+                    self._wait_seconds += started_at - submitted_at
+                    self._hash_seconds += finished_at - started_at
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), job)
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> HashPoolStats:
+        with self._lock:
+            return HashPoolStats(
+                workers=self.max_workers,
+                max_pending=self.max_pending,
+                pending=self._pending,
+                completed=self._completed,
+                rejected=self._rejected,
+                wait_seconds_total=self._wait_seconds,
+                hash_seconds_total=self._hash_seconds,
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="hash"
+            )
+        return self._executor
+
+
+hash_pool = HashPool(
+    settings.HASH_POOL_WORKERS, settings.HASH_POOL_MAX_PENDING
+)
+
+
+def load_hash_backend() -> str:
+    # passlib loads and self-tests the bcrypt backend on first use
+    return cast(str, pwd_context.handler().get_backend())
+
 
 def hash_password(password: str) -> str:
     return cast(str, pwd_context.hash(password))
@@ -11,3 +109,32 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return cast(bool, pwd_context.verify(plain_password, hashed_password))
+
+
+async def hash_password_async(password: str) -> str:
+    return await hash_pool.run(hash_password, password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    return await hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def hash_passwords_async(passwords: Sequence[str]) -> List[str]:
+    # hash at most one password per worker at a time so a large batch
+    # does not fill the queue and starve concurrent sign-ups
+    hashed: List[str] = []
+    step = hash_pool.max_workers
+    for start in range(0, len(passwords), step):
+        hashed.extend(
+            await asyncio.gather(
+                *(
+                    hash_password_async(password)
+                    for password in passwords[start : start + step]
+                )
+            )
+        )
+    return hashed
@@ -1,35 +1,147 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, cast
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 import jwt
+from jwt.algorithms import get_default_algorithms
 
-from src.core.config import settings
+from src.core.config import Settings, settings
+from src.domain.models.auth import Principal
+
+
+class KeySet:
+    def __init__(self, config: Settings) -> None:
+        algorithm = get_default_algorithms().get(config.JWT_ALGORITHM)
+        if algorithm is None:
+            raise RuntimeError(
+                f"JWT algorithm {config.JWT_ALGORITHM} is not available, "
+                "asymmetric algorithms require the 'cryptography' package"
+            )
+
+        self.algorithm = config.JWT_ALGORITHM
+        self.algorithms = [config.JWT_ALGORITHM]
+        self.key_id = config.JWT_KEY_ID
+        self.signing_key: Any = None
+        self.verification_keys: Dict[Optional[str], Any] = {}
+
+        # parse key material once instead of on every encode/decode
+        if self.algorithm.startswith("HS"):
+            self.signing_key = algorithm.prepare_key(config.JWT_SECRET)
+            self.verification_keys[None] = self.signing_key
+        else:
+            if config.JWT_PRIVATE_KEY:
+                self.signing_key = algorithm.prepare_key(
+                    config.JWT_PRIVATE_KEY
+                )
+            for kid, public_key in config.JWT_PUBLIC_KEYS.items():
+                self.verification_keys[kid] = algorithm.prepare_key(public_key)
+
+    def verification_key(self, token: str) -> Any:
+        if None in self.verification_keys:
+            return self.verification_keys[None]
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        if kid not in self.verification_keys:
+            raise jwt.InvalidTokenError(f"Unknown key id {kid!r}")
+        return self.verification_keys[kid]
+
+
+class VerifiedTokenCache:
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[
+            bytes, Tuple[Optional[float], Dict[str, Any]]
+        ] = OrderedDict()
+
+    def get(self, digest: bytes) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[digest]
+            return None
+
+        self._entries.move_to_end(digest)
+        return dict(payload)
+
+    def put(self, digest: bytes, payload: Dict[str, Any]) -> None:
+        exp = payload.get("exp")
+        expires_at = float(exp) if isinstance(exp, (int, float)) else None
+        self._entries[digest] = (expires_at, dict(payload))
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+key_set = KeySet(settings)
+token_cache = VerifiedTokenCache(settings.JWT_CACHE_SIZE)
 
 
 def create_access_token(
     data: Dict[str, Any], expires_delta: Optional[timedelta] = None
 ) -> str:
     to_encode = data.copy()
-    expire = datetime.now() + (
+    expire = datetime.now(timezone.utc) + (
         expires_delta
         or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     )
     to_encode.update({"exp": expire})
+    headers = {"kid": key_set.key_id} if key_set.key_id else None
     return cast(
         str,
         jwt.encode(
-            to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+            to_encode,
+            key_set.signing_key,
+            algorithm=key_set.algorithm,
+            headers=headers,
         ),
     )
 
 
 def decode_access_token(token: str) -> Any:
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(digest)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
+            token,
+            key_set.verification_key(token),
+            algorithms=key_set.algorithms,
         )
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
+
+    token_cache.put(digest, payload)
+    return payload
+
+
+def decode_principal(token: str) -> Optional[Principal]:
+    payload = decode_access_token(token)
+    if not payload or "sub" not in payload:
+        return None
+
+    scopes: List[str] = (
+        payload.get("scopes") or str(payload.get("scope", "")).split()
+    )
+    exp = payload.get("exp")
+    return Principal(
+        subject=str(payload["sub"]),
+        scopes=scopes,
+        expires_at=(
+            datetime.fromtimestamp(exp, tz=timezone.utc)
+            if isinstance(exp, (int, float))
+            else None
+        ),
+        claims=payload,
+    )
@@ -0,0 +1,85 @@
+import re
+from dataclasses import dataclass
+from typing import Generic, List, Mapping, Optional, Tuple, TypeVar
+
+from starlette.datastructures import Headers
+from starlette.routing import compile_path
+from starlette.types import Scope
+
+from src.infrastructure.security.jwt import decode_principal
+
+T = TypeVar("T")
+
+PERIODS = {"second": 1.0, "minute": 60.0, "hour": 3600.0}
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    rate: float
+    burst: int
+
+    @classmethod
+    def parse(cls, spec: str) -> "RateLimit":
+        """Parse ``"<requests>/<second|minute|hour>"`` with at least one
+        request; the whole budget may be spent in one burst."""
+        count, _, period = spec.partition("/")
+        if (
+            period not in PERIODS
+            or not count.strip().isdigit()
+            or int(count) < 1
+        ):
+            raise ValueError(f"Invalid rate limit {spec!r}")
+        return cls(rate=int(count) / PERIODS[period], burst=int(count))
+
+
+class RouteRules(Generic[T]):
+    """Values keyed by ``"METHOD /path/template"``, matched before routing
+    so rejected requests never reach the app."""
+
+    def __init__(self, rules: Mapping[str, T]) -> None:
+        self._rules: List[Tuple[str, str, re.Pattern[str], T]] = []
+        for name, value in rules.items():
+            method, _, template = name.partition(" ")
+            pattern, _, _ = compile_path(template)
+            self._rules.append((name, method.upper(), pattern, value))
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def match(self, method: str, path: str) -> Optional[Tuple[str, T]]:
+        for name, rule_method, pattern, value in self._rules:
+            if rule_method == method and pattern.match(path):
+                return name, value
+        return None
+
+
+class ConcurrencyLimiter:
+    """Counts in-flight requests and refuses new ones at ``limit``."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+
+    def try_acquire(self) -> bool:
+        if self.active >= self.limit:
+            return False
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+
+
+def client_key(scope: Scope) -> str:
+    """Identify the caller by a valid bearer token's subject, falling back
+    to the client address (already resolved from X-Forwarded-For by the
+    server's proxy header handling)."""
+    authorization = Headers(scope=scope).get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        principal = decode_principal(token)
+        if principal is not None:
+            return f"sub:{principal.subject}"
+
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
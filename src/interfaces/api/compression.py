@@ -0,0 +1,151 @@
+import gzip
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Response
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Scope
+
+from src.core.config import settings
+
+Codec = Callable[[bytes], bytes]
+
+CODECS: Dict[str, Codec] = {
+    # mtime=0 keeps the output deterministic for identical bodies
+    "gzip": lambda body: gzip.compress(body, compresslevel=6, mtime=0),
+}
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    pass
+else:  # pragma: no cover
+    CODECS["br"] = lambda body: brotli.compress(body, quality=4)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    pass
+else:  # pragma: no cover
+    CODECS["zstd"] = lambda body: zstandard.compress(body, 3)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+)
+
+
+def available_encodings() -> List[str]:
+    """Configured encodings in server preference order, if installed."""
+    return [
+        encoding
+        for encoding in settings.COMPRESSION_ENCODINGS
+        if encoding in CODECS
+    ]
+
+
+def negotiate(
+    accept_encoding: str, encodings: Optional[Sequence[str]] = None
+) -> Optional[str]:
+    """Pick the encoding with the highest q-value, server order on ties."""
+    qualities: Dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for encoding in available_encodings() if encodings is None else encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type.endswith("+json")
+        or media_type in COMPRESSIBLE_TYPES
+    )
+
+
+async def compress(body: bytes, encoding: str) -> bytes:
+    codec = CODECS[encoding]
+    # large bodies would stall every other request on the loop
+    if len(body) >= settings.COMPRESSION_OFFLOAD_BYTES:
+        return await run_in_threadpool(codec, body)
+    return codec(body)
+
+
+def request_key(scope: Scope) -> str:
+    query = parse_qsl(scope.get("query_string", b"").decode("latin-1"))
+    return f"{scope['path']}?{urlencode(sorted(query))}"
+
+
+class PrecompressedCache:
+    """LRU of compressed responses per request and encoding.
+
+    Each entry remembers the ETag it was rendered for; a route that can
+    compute the current ETag cheaply replays the entry on a match and
+    skips both loading/serializing the body and compressing it.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[
+            Tuple[str, str],
+            Tuple[str, int, List[Tuple[bytes, bytes]], bytes],
+        ] = OrderedDict()
+
+    def has(self, scope: Scope, encoding: Optional[str]) -> bool:
+        return (request_key(scope), str(encoding)) in self._entries
+
+    def get(
+        self, scope: Scope, encoding: Optional[str], etag: str
+    ) -> Optional[Response]:
+        key = (request_key(scope), str(encoding))
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != etag:
+            return None
+
+        self._entries.move_to_end(key)
+        _, status, headers, body = entry
+        response = Response(body, status_code=status)
+        response.raw_headers = list(headers)
+        return response
+
+    def put(
+        self,
+        scope: Scope,
+        encoding: str,
+        etag: str,
+        status: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        key = (request_key(scope), encoding)
+        self._entries[key] = (etag, status, list(headers), body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+precompressed = PrecompressedCache(settings.COMPRESSION_CACHE_ENTRIES)
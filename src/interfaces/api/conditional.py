@@ -0,0 +1,75 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+from src.core.config import settings
+
+
+def weak_etag(*parts: Any) -> str:
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:16]
+    return f'W/"{digest}"'
+
+
+def is_conditional(request: Request) -> bool:
+    return (
+        "if-none-match" in request.headers
+        or "if-modified-since" in request.headers
+    )
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime]
+) -> bool:
+    # If-None-Match wins over If-Modified-Since when both are sent
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        return _opaque(etag) in {
+            _opaque(tag) for tag in if_none_match.split(",")
+        }
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have second precision
+    return _utc(last_modified).replace(microsecond=0) <= since
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime]
+) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = settings.HTTP_CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            _utc(last_modified), usegmt=True
+        )
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    # 304s carry the validators but never a body, so nothing is serialized
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def _opaque(tag: str) -> str:
+    # weak comparison: W/"x" matches "x"
+    return tag.strip().removeprefix("W/")
+
+
+def _utc(value: datetime) -> datetime:
+    # updated_at is stored without a time zone, in UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,128 @@
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import Settings
+from src.infrastructure.cache.backend import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    create_cache_backend,
+)
+
+# stored under a key while its first request runs
+IN_PROGRESS = b"in-progress"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyConflict(Exception):
+    """Another worker is still running the first request for a key."""
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    fingerprint: str
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+    def dumps(self) -> bytes:
+        return json.dumps(
+            {
+                "fingerprint": self.fingerprint,
+                "status": self.status,
+                "headers": [
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in self.headers
+                ],
+                "body": base64.b64encode(self.body).decode(),
+            }
+        ).encode()
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "StoredResponse":
+        data = json.loads(raw)
+        return cls(
+            fingerprint=data["fingerprint"],
+            status=data["status"],
+            headers=[
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in data["headers"]
+            ],
+            body=base64.b64decode(data["body"]),
+        )
+
+    async def send(self, send: Send, replayed: bool) -> None:
+        headers = list(self.headers)
+        if replayed:
+            headers.append((b"idempotent-replayed", b"true"))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+def fingerprint(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+async def read_body(receive: Receive) -> Optional[bytes]:
+    """Read the whole request body, or None if the client went away."""
+    chunks: List[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def replay_receive(body: bytes, receive: Receive) -> Receive:
+    """Hand an already-read body to the app, then defer to ``receive``
+    for disconnects."""
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+async def capture(
+    app: ASGIApp, scope: Scope, receive: Receive, digest: str
+) -> StoredResponse:
+    """Run ``app`` and collect its whole response."""
+    status = 500
+    headers: List[Tuple[bytes, bytes]] = []
+    chunks: List[bytes] = []
+
+    async def collect(message: Message) -> None:
+        nonlocal status, headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, collect)
+    return StoredResponse(digest, status, headers, b"".join(chunks))
+
+
+def create_idempotency_store(config: Settings) -> CacheBackend:
+    # shares the cache's backend so keys are seen by every worker when
+    # that is Redis; kept in memory even when response caching is off
+    return create_cache_backend(
+        config, "idempotency:", config.IDEMPOTENCY_MAX_ENTRIES
+    ) or InMemoryCacheBackend(config.IDEMPOTENCY_MAX_ENTRIES)
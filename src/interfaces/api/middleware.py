@@ -0,0 +1,450 @@
+import asyncio
+import logging
+import math
+from time import perf_counter
+from typing import Mapping, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.metrics import registry
+from src.core.tracing import end_trace, start_trace
+from src.infrastructure.cache.backend import CacheBackend
+from src.infrastructure.cache.rate_limit import (
+    RateLimitBackend,
+    create_rate_limit_backend,
+)
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.database.profiler import QueryProfiler
+from src.interfaces.api.admission import (
+    ConcurrencyLimiter,
+    RateLimit,
+    RouteRules,
+    client_key,
+)
+from src.interfaces.api.compression import (
+    PrecompressedCache,
+    compress,
+    is_compressible,
+    negotiate,
+    precompressed,
+)
+from src.interfaces.api.idempotency import (
+    IN_PROGRESS,
+    MAX_KEY_LENGTH,
+    IdempotencyConflict,
+    StoredResponse,
+    capture,
+    create_idempotency_store,
+    fingerprint,
+    read_body,
+    replay_receive,
+)
+
+logger = logging.getLogger(__name__)
+
+request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    ["method", "route", "status"],
+)
+rejected_requests = registry.counter(
+    "http_requests_rejected_total",
+    "Requests refused by admission control, by rule and reason.",
+    ["rule", "reason"],
+)
+
+
+class TimingMiddleware:
+    """Pure ASGI timing middleware.
+
+    Every request feeds ``http_request_duration_seconds``; sampled requests
+    additionally collect per-layer spans and return them in a
+    ``Server-Timing`` header.
+    """
+
+    def __init__(
+        self, app: ASGIApp, sample_rate: Optional[float] = None
+    ) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        sample_rate = (
+            settings.TRACE_SAMPLE_RATE
+            if self.sample_rate is None
+            else self.sample_rate
+        )
+        trace, token = start_trace(sample_rate)
+        started_at = perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if trace is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", trace.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            end_trace(token)
+            # the router stores the matched route in the scope; label by
+            # its template so path parameters don't explode cardinality
+            route = getattr(scope.get("route"), "path", "unmatched")
+            request_duration.observe(
+                perf_counter() - started_at,
+                scope["method"],
+                route,
+                str(status),
+            )
+            if trace is not None:
+                trace.finish()
+
+
+class QueryProfilerMiddleware:
+    """Profiles the SQL run by each request and reports an X-Query-Count."""
+
+    def __init__(self, app: ASGIApp, profiler: QueryProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.profiler.profile() as profile:
+
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-Query-Count", str(profile.total))
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
+
+
+class CompressionMiddleware:
+    """Compresses complete response bodies for clients that accept it.
+
+    Streaming bodies (``more_body``) and bodies that already carry a
+    ``Content-Encoding`` pass through untouched. Compressed responses with
+    an ETag are stored in a :class:`PrecompressedCache` for routes to
+    replay.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: Optional[int] = None,
+        cache: Optional[PrecompressedCache] = precompressed,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = cache
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        minimum_size = (
+            settings.COMPRESSION_MIN_BYTES
+            if self.minimum_size is None
+            else self.minimum_size
+        )
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if passthrough or start is None:
+                await send(message)
+                return
+
+            passthrough = True
+            body = message.get("body", b"")
+            headers = MutableHeaders(scope=start)
+            if (
+                message.get("more_body", False)
+                or start["status"] in (204, 304)
+                or "content-encoding" in headers
+                or len(body) < minimum_size
+                or not is_compressible(headers.get("content-type", ""))
+            ):
+                await send(start)
+                await send(message)
+                return
+
+            compressed = await compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if self.cache is not None and etag and start["status"] == 200:
+                self.cache.put(
+                    scope,
+                    encoding,
+                    etag,
+                    start["status"],
+                    start["headers"],
+                    compressed,
+                )
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class AdmissionMiddleware:
+    """Refuses requests before any work starts: 429 once a client has
+    spent its rate budget for a route, 503 while a route is at its
+    concurrency limit. Both carry ``Retry-After``.
+
+    Requests over a limit are rejected rather than queued, so a flood on
+    one endpoint cannot pile up on the event loop and starve the others.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_limits: Optional[Mapping[str, str]] = None,
+        concurrency_limits: Optional[Mapping[str, int]] = None,
+        backend: Optional[RateLimitBackend] = None,
+    ) -> None:
+        self.app = app
+        if rate_limits is None:
+            rate_limits = settings.RATE_LIMITS
+        if concurrency_limits is None:
+            concurrency_limits = settings.CONCURRENCY_LIMITS
+        self.rate_limits = RouteRules(
+            {name: RateLimit.parse(spec) for name, spec in rate_limits.items()}
+        )
+        self.concurrency_limits = RouteRules(
+            {
+                name: ConcurrencyLimiter(limit)
+                for name, limit in concurrency_limits.items()
+            }
+        )
+        self.backend = backend
+        if backend is None and self.rate_limits:
+            self.backend = create_rate_limit_backend(settings)
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        rate_rule = self.rate_limits.match(method, path)
+        if rate_rule is not None:
+            name, limit = rate_rule
+            wait = await self._acquire(f"{name}:{client_key(scope)}", limit)
+            if wait > 0:
+                rejected_requests.inc(name, "rate_limit")
+                response = _rejection(429, "Rate limit exceeded", wait)
+                await response(scope, receive, send)
+                return
+
+        concurrency_rule = self.concurrency_limits.match(method, path)
+        if concurrency_rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        name, limiter = concurrency_rule
+        if not limiter.try_acquire():
+            rejected_requests.inc(name, "concurrency")
+            response = _rejection(503, "Server busy", 1)
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    async def _acquire(self, key: str, limit: RateLimit) -> float:
+        assert self.backend is not None
+        try:
+            return await self.backend.acquire(key, limit.rate, limit.burst)
+        except Exception:
+            # fail open: an unreachable shared store must not take the
+            # endpoints it protects down with it
+            logger.warning("Rate limit backend failed", exc_info=True)
+            return 0.0
+
+
+class IdempotencyMiddleware:
+    """Replays the first response for requests repeating an
+    ``Idempotency-Key`` (per client and route), so retried writes are not
+    run twice.
+
+    Concurrent repeats in this worker wait for the first request and share
+    its response; a repeat seen by another worker while the first is
+    still running gets 409. Reusing a key with a different body is 422.
+    Server errors are not stored, so those requests can be retried.
+
+    Keys are only shared between workers through a Redis store; with the
+    in-memory fallback each worker has its own keys and a retry landing
+    on another worker runs again.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Optional[Sequence[str]] = None,
+        store: Optional[CacheBackend] = None,
+    ) -> None:
+        self.app = app
+        if routes is None:
+            routes = settings.IDEMPOTENT_ROUTES
+        self.routes = RouteRules(dict.fromkeys(routes, True))
+        self.store = store or create_idempotency_store(settings)
+        self.flights: SingleFlight[StoredResponse] = SingleFlight()
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        key = Headers(scope=scope).get("idempotency-key")
+        rule = self.routes.match(scope["method"], scope["path"])
+        if key is None or rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        if len(key) > MAX_KEY_LENGTH:
+            response = _error(
+                422,
+                f"Idempotency-Key must be at most {MAX_KEY_LENGTH} "
+                "characters",
+            )
+            await response(scope, receive, send)
+            return
+
+        # idempotent requests are buffered to fingerprint their body
+        body = await read_body(receive)
+        if body is None:
+            return
+        digest = fingerprint(body)
+        store_key = f"{client_key(scope)}:{rule[0]}:{key}"
+        executed = False
+
+        async def execute() -> StoredResponse:
+            nonlocal executed
+            stored = await self.store.get(store_key)
+            if stored is None and await self.store.add(
+                store_key, IN_PROGRESS, settings.IDEMPOTENCY_LOCK_SECONDS
+            ):
+                executed = True
+                return await self._run(
+                    scope, replay_receive(body, receive), digest, store_key
+                )
+
+            stored = stored or await self.store.get(store_key)
+            if stored is None or stored == IN_PROGRESS:
+                raise IdempotencyConflict(store_key)
+            return StoredResponse.loads(stored)
+
+        try:
+            stored_response = await self.flights.do(store_key, execute)
+        except IdempotencyConflict:
+            response = _error(
+                409,
+                "A request with this Idempotency-Key is in progress",
+                {"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        if stored_response.fingerprint != digest:
+            response = _error(
+                422,
+                "Idempotency-Key was already used with a different request",
+            )
+            await response(scope, receive, send)
+            return
+        await stored_response.send(send, replayed=not executed)
+
+    async def _run(
+        self, scope: Scope, receive: Receive, digest: str, store_key: str
+    ) -> StoredResponse:
+        # the lock is renewed for as long as the request runs, so a long
+        # bulk import keeps its key; the lock only expires on its own if
+        # this worker dies
+        renewal = asyncio.create_task(self._renew_lock(store_key))
+        try:
+            response = await capture(self.app, scope, receive, digest)
+        except BaseException:
+            await _stop(renewal)
+            await self.store.delete(store_key)
+            raise
+        await _stop(renewal)
+
+        if response.status >= 500:
+            await self.store.delete(store_key)
+        else:
+            await self.store.set(
+                store_key, response.dumps(), settings.IDEMPOTENCY_TTL_SECONDS
+            )
+        return response
+
+    async def _renew_lock(self, store_key: str) -> None:
+        lock = settings.IDEMPOTENCY_LOCK_SECONDS
+        while True:
+            await asyncio.sleep(lock / 3)
+            try:
+                await self.store.set(store_key, IN_PROGRESS, lock)
+            except Exception:
+                logger.warning(
+                    "Idempotency lock renewal failed", exc_info=True
+                )
+
+
+async def _stop(task: "asyncio.Task[None]") -> None:
+    task.cancel()
+    # wait() lets a cancellation of the caller itself propagate
+    await asyncio.wait([task])
+
+
+def _error(
+    status: int, detail: str, headers: Optional[Mapping[str, str]] = None
+) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail}, status_code=status, headers=headers
+    )
+
+
+def _rejection(status: int, reason: str, wait: float) -> JSONResponse:
+    return _error(
+        status,
+        f"{reason}, retry later",
+        {"Retry-After": str(max(1, math.ceil(wait)))},
+    )
@@ -0,0 +1,49 @@
+import json
+from typing import Any, AsyncIterator, Type, TypeVar
+
+from fastapi import Request
+from pydantic import BaseModel, ValidationError as PydanticValidationError
+
+from src.core.exceptions import ValidationError
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+async def iter_json_records(request: Request) -> AsyncIterator[Any]:
+    content_type = request.headers.get("content-type", "")
+    if content_type.split(";")[0].strip() in NDJSON_MEDIA_TYPES:
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+        return
+
+    try:
+        records = json.loads(await request.body())
+    except ValueError as error:
+        raise ValidationError(f"Invalid JSON body: {error}")
+    if not isinstance(records, list):
+        raise ValidationError("Expected a JSON array")
+    for record in records:
+        yield record
+
+
+def parse_record(model: Type[ModelT], record: Any) -> ModelT:
+    if isinstance(record, bytes):
+        return model.model_validate_json(record)
+    return model.model_validate(record)
+
+
+def describe_validation_error(error: PydanticValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'body'}: "
+        f"{item['msg']}"
+        for item in error.errors()
+    )
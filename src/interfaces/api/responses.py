@@ -0,0 +1,128 @@
+import csv
+import io
+import zlib
+from typing import Any, AsyncIterator, Collection, Literal, TypeVar, Union
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic_core import to_json
+
+from src.core.config import settings
+from src.domain.models.user import User
+from src.interfaces.api.compression import negotiate
+
+T = TypeVar("T")
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def respond(content: T, response: Response) -> Union[T, Response]:
+    if not settings.FAST_JSON_RESPONSES:
+        return content
+
+    # returning a Response directly bypasses response_model validation
+    return FastJSONResponse(
+        content,
+        status_code=response.status_code or 200,
+        headers=dict(response.headers),
+    )
+
+
+def respond_fields(
+    content: Any, fields: Collection[str], response: Response
+) -> Response:
+    # sparse fieldsets can't satisfy response_model, render them directly
+    return Response(
+        to_json(content, include={"__all__": set(fields)}),
+        status_code=response.status_code or 200,
+        headers=dict(response.headers),
+        media_type="application/json",
+    )
+
+
+def export_response(
+    users: AsyncIterator[User], format: ExportFormat, gzip: bool = False
+) -> StreamingResponse:
+    chunks = _buffered(
+        _csv_lines(users) if format == "csv" else _ndjson_lines(users),
+        settings.EXPORT_CHUNK_BYTES,
+    )
+    headers = {
+        "Content-Disposition": f'attachment; filename="users.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if gzip:
+        chunks = _gzip(chunks, settings.EXPORT_GZIP_LEVEL)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        chunks, media_type=EXPORT_MEDIA_TYPES[format], headers=headers
+    )
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    return negotiate(accept_encoding, ["gzip"]) == "gzip"
+
+
+async def _ndjson_lines(users: AsyncIterator[User]) -> AsyncIterator[bytes]:
+    async for user in users:
+        yield to_json(user) + b"\n"
+
+
+async def _csv_lines(users: AsyncIterator[User]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    columns = list(User.model_fields)
+    writer.writerow(columns)
+    async for user in users:
+        row = user.model_dump(mode="json")
+        writer.writerow([_csv_cell(row[column]) for column in columns])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    # an empty export still gets its header row
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    # keep spreadsheets from evaluating user-supplied text as a formula
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+
+async def _buffered(
+    lines: AsyncIterator[bytes], size: int
+) -> AsyncIterator[bytes]:
+    # one send per chunk instead of one per row; the first chunk goes out
+    # after ``size`` bytes, however large the table is
+    buffer = bytearray()
+    async for line in lines:
+        buffer += line
+        if len(buffer) >= size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _gzip(
+    chunks: AsyncIterator[bytes], level: int
+) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        # sync flush so every chunk reaches the client as soon as it is ready
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
@@ -0,0 +1,68 @@
+import asyncio
+from functools import wraps
+from typing import Any, Callable, Coroutine
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from src.core.tracing import current_trace
+
+
+class TracedRoute(APIRoute):
+    """Splits a traced request into dependency, endpoint and serialize spans.
+
+    FastAPI resolves dependencies, calls the endpoint and validates and
+    renders the response inside one handler; marking when the endpoint
+    starts and returns is enough to attribute the time around it.
+    """
+
+    def __init__(
+        self, path: str, endpoint: Callable[..., Any], **kwargs: Any
+    ) -> None:
+        super().__init__(path, _mark_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def traced_handler(request: Request) -> Response:
+            trace = current_trace()
+            if trace is None:
+                return await handler(request)
+
+            trace.mark("handler")
+            response = await handler(request)
+            trace.mark("response")
+
+            marks = trace.marks
+            if "endpoint" in marks and "endpoint_done" in marks:
+                trace.add("deps", marks["endpoint"] - marks["handler"])
+                trace.add(
+                    "endpoint", marks["endpoint_done"] - marks["endpoint"]
+                )
+                trace.add(
+                    "serialize", marks["response"] - marks["endpoint_done"]
+                )
+            return response
+
+        return traced_handler
+
+
+def _mark_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if not asyncio.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @wraps(endpoint)
+    async def marked(*args: Any, **kwargs: Any) -> Any:
+        trace = current_trace()
+        if trace is None:
+            return await endpoint(*args, **kwargs)
+
+        trace.mark("endpoint")
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            trace.mark("endpoint_done")
+
+    return marked
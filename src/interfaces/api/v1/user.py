@@ -1,27 +1,217 @@
-from typing import List
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.dependencies import get_user_controller
-from src.domain.models.user import CreateUser, User
+from src.core.config import settings
+from src.core.container import bound_session
+from src.core.dependencies import (
+    get_streaming_user_controller,
+    get_user_controller,
+)
+from src.core.exceptions import ValidationError
+from src.domain.models.user import (
+    BulkDeleteResult,
+    BulkUserResult,
+    CreateUser,
+    User,
+    UserBatch,
+    UserCount,
+    UserFilter,
+    UserPage,
+    UserSort,
+)
+from src.infrastructure.database.base import get_session_factory
+from src.interfaces.api.compression import negotiate, precompressed
+from src.interfaces.api.conditional import (
+    is_conditional,
+    is_not_modified,
+    not_modified,
+    set_validators,
+    weak_etag,
+)
+from src.interfaces.api.payloads import (
+    describe_validation_error,
+    iter_json_records,
+    parse_record,
+)
+from src.interfaces.api.responses import (
+    ExportFormat,
+    accepts_gzip,
+    export_response,
+    respond,
+    respond_fields,
+)
+from src.interfaces.api.routing import TracedRoute
 from src.interfaces.controllers.user_controller import UserController
 
-router = APIRouter(prefix="/user", tags=["user"])
+router = APIRouter(prefix="/user", tags=["user"], route_class=TracedRoute)
+
+
+async def get_user_filter(
+    is_active: Optional[bool] = None,
+    is_superuser: Optional[bool] = None,
+    email_domain: Optional[str] = Query(None, min_length=1, max_length=253),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+) -> UserFilter:
+    return UserFilter(
+        is_active=is_active,
+        is_superuser=is_superuser,
+        email_domain=email_domain,
+        created_after=created_after,
+        created_before=created_before,
+    )
 
 
 @router.get("/", response_model=List[User])
 async def get_users(
+    request: Request,
+    response: Response,
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE
+    ),
+    cursor: Optional[str] = None,
+    filters: UserFilter = Depends(get_user_filter),
+    sort: UserSort = "created_at",
+    fields: Optional[str] = Query(
+        None, description="Comma-separated subset of user fields to return"
+    ),
+    count: Optional[Literal["exact", "approximate"]] = Query(
+        None, description="Return the filtered total in X-Total-Count"
+    ),
     controller: UserController = Depends(get_user_controller),
-) -> List[User]:
-    return await controller.get_users()
+) -> Union[List[User], Response]:
+    selected = _parse_fields(fields)
+    total = None
+    if count is not None:
+        total = await controller.count_users(
+            filters, approximate=count == "approximate"
+        )
+        response.headers["X-Total-Count"] = str(total.total)
+        response.headers["X-Total-Count-Exact"] = str(total.exact).lower()
+
+    encoding = negotiate(request.headers.get("accept-encoding", ""))
+    if is_conditional(request) or precompressed.has(request.scope, encoding):
+        # revalidate against the page's ids and timestamps only
+        versions = await controller.get_users(
+            limit, cursor, filters, sort, ["updated_at"]
+        )
+        etag = _page_etag(request, versions, total)
+        if is_not_modified(request, etag, None):
+            return not_modified(etag, None)
+        # the same page was already rendered and compressed for this
+        # encoding, replay it
+        cached = precompressed.get(request.scope, encoding, etag)
+        if cached is not None:
+            return cached
+
+    fetch = selected and list(dict.fromkeys([*selected, "updated_at"]))
+    page = await controller.get_users(limit, cursor, filters, sort, fetch)
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    set_validators(response, _page_etag(request, page, total), None)
+    if selected is not None:
+        return respond_fields(page.items, selected, response)
+    return respond(page.items, response)
+
+
+def _page_etag(
+    request: Request, page: UserPage, total: Optional[UserCount]
+) -> str:
+    # no Last-Modified for pages: deleting a row leaves the newest
+    # remaining updated_at unchanged, so only the ids can tell
+    return weak_etag(
+        sorted(request.query_params.multi_items()),
+        [(user.id, user.updated_at) for user in page.items],
+        page.next_cursor is not None,
+        total,
+    )
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if fields is None:
+        return None
+
+    selected = list(
+        dict.fromkeys(
+            name.strip() for name in fields.split(",") if name.strip()
+        )
+    )
+    unknown = [name for name in selected if name not in User.model_fields]
+    if not selected or unknown:
+        raise ValidationError(
+            f"Unknown fields: {', '.join(unknown) or fields!r}, "
+            f"choose from {', '.join(User.model_fields)}"
+        )
+    return selected
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_users(
+    request: Request,
+    format: ExportFormat = "ndjson",
+    sessions: Callable[[], AsyncSession] = Depends(get_session_factory),
+    controller: UserController = Depends(get_streaming_user_controller),
+) -> StreamingResponse:
+    return export_response(
+        _export_rows(sessions, controller),
+        format,
+        gzip=accepts_gzip(request.headers.get("accept-encoding", "")),
+    )
+
+
+async def _export_rows(
+    sessions: Callable[[], AsyncSession], controller: UserController
+) -> AsyncIterator[User]:
+    async with bound_session(sessions):
+        async for user in controller.export_users(settings.EXPORT_BATCH_SIZE):
+            yield user
 
 
 @router.get("/{user_id}", response_model=User)
 async def get_user(
-    user_id: UUID, controller: UserController = Depends(get_user_controller)
-) -> User:
-    return await controller.get_user(user_id)
+    user_id: UUID,
+    request: Request,
+    response: Response,
+    controller: UserController = Depends(get_user_controller),
+) -> Union[User, Response]:
+    if is_conditional(request):
+        # a single-column lookup decides the 304 before the row is loaded
+        updated_at = await controller.get_user_updated_at(user_id)
+        etag = weak_etag(user_id, updated_at)
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at)
+
+    user = await controller.get_user(user_id)
+    set_validators(
+        response, weak_etag(user.id, user.updated_at), user.updated_at
+    )
+    return respond(user, response)
+
+
+@router.post("/batch", response_model=UserBatch)
+async def get_users_by_ids(
+    response: Response,
+    user_ids: List[UUID] = Body(
+        ..., min_length=1, max_length=settings.BULK_BATCH_SIZE
+    ),
+    controller: UserController = Depends(get_user_controller),
+) -> Union[UserBatch, Response]:
+    return respond(await controller.get_users_by_ids(user_ids), response)
 
 
 @router.post("/", response_model=User)
@@ -29,3 +219,62 @@ async def create_user(
     user: CreateUser, controller: UserController = Depends(get_user_controller)
 ) -> User:
     return await controller.create_user(user)
+
+
+@router.post("/bulk", response_model=List[BulkUserResult])
+async def create_users(
+    request: Request,
+    controller: UserController = Depends(get_user_controller),
+) -> List[BulkUserResult]:
+    results: List[BulkUserResult] = []
+    batch: List[Tuple[int, CreateUser]] = []
+    index = 0
+
+    async for record in iter_json_records(request):
+        try:
+            batch.append((index, parse_record(CreateUser, record)))
+        except PydanticValidationError as error:
+            results.append(
+                BulkUserResult(
+                    index=index,
+                    status="invalid",
+                    detail=describe_validation_error(error),
+                )
+            )
+        index += 1
+
+        if len(batch) >= settings.BULK_BATCH_SIZE:
+            results.extend(await _create_batch(controller, batch))
+            batch = []
+
+    if batch:
+        results.extend(await _create_batch(controller, batch))
+
+    return sorted(results, key=lambda result: result.index)
+
+
+async def _create_batch(
+    controller: UserController, batch: List[Tuple[int, CreateUser]]
+) -> List[BulkUserResult]:
+    results = await controller.create_users([user for _, user in batch])
+    return [
+        result.model_copy(update={"index": index})
+        for (index, _), result in zip(batch, results)
+    ]
+
+
+@router.delete("/", response_model=BulkDeleteResult)
+async def delete_users(
+    user_ids: List[UUID] = Body(
+        ..., min_length=1, max_length=settings.BULK_BATCH_SIZE
+    ),
+    controller: UserController = Depends(get_user_controller),
+) -> BulkDeleteResult:
+    return await controller.delete_users(user_ids)
+
+
+@router.delete("/{user_id}", response_model=Dict[str, str])
+async def delete_user(
+    user_id: UUID, controller: UserController = Depends(get_user_controller)
+) -> Dict[str, str]:
+    return await controller.delete_user(user_id)
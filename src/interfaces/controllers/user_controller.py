@@ -1,22 +1,74 @@
-from typing import Dict, List
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 
 from src.application.use_cases.user_use_case import UserUseCase
-from src.domain.models.user import CreateUser, User
+from src.core.tracing import traced
+from src.domain.models.user import (
+    BulkDeleteResult,
+    BulkUserResult,
+    CreateUser,
+    User,
+    UserBatch,
+    UserCount,
+    UserFilter,
+    UserPage,
+    UserSort,
+)
 
 
 class UserController:
     def __init__(self, user_use_case: UserUseCase) -> None:
         self.user_use_case = user_use_case
 
-    async def get_users(self) -> List[User]:
-        return await self.user_use_case.list_users()
+    @traced("controller")
+    async def get_users(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[UserFilter] = None,
+        sort: UserSort = "created_at",
+        fields: Optional[Sequence[str]] = None,
+    ) -> UserPage:
+        return await self.user_use_case.list_users(
+            limit, cursor, filters, sort, fields
+        )
 
+    @traced("controller")
+    async def count_users(
+        self, filters: Optional[UserFilter] = None, approximate: bool = False
+    ) -> UserCount:
+        return await self.user_use_case.count_users(filters, approximate)
+
+    def export_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self.user_use_case.export_users(batch_size)
+
+    @traced("controller")
     async def get_user(self, user_id: UUID) -> User:
         return await self.user_use_case.get_user(user_id)
 
+    @traced("controller")
+    async def get_user_updated_at(self, user_id: UUID) -> datetime:
+        return await self.user_use_case.get_user_updated_at(user_id)
+
+    @traced("controller")
+    async def get_users_by_ids(self, user_ids: List[UUID]) -> UserBatch:
+        return await self.user_use_case.get_users(user_ids)
+
+    @traced("controller")
     async def create_user(self, user_data: CreateUser) -> User:
         return await self.user_use_case.register_user(user_data)
 
+    @traced("controller")
+    async def create_users(
+        self, users_data: List[CreateUser]
+    ) -> List[BulkUserResult]:
+        return await self.user_use_case.register_users(users_data)
+
+    @traced("controller")
     async def delete_user(self, user_id: UUID) -> Dict[str, str]:
         return await self.user_use_case.delete_user(user_id)
+
+    @traced("controller")
+    async def delete_users(self, user_ids: List[UUID]) -> BulkDeleteResult:
+        return await self.user_use_case.delete_users(user_ids)
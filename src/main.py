@@ -1,10 +1,142 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import asdict, fields
+from time import perf_counter
+from typing import Any, AsyncIterator, Dict, List
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 
 from src.core.config import settings
+from src.core.metrics import registry
+from src.core.startup import startup
+from src.infrastructure.database.base import engine, replica_set
+from src.infrastructure.database.instrumentation import instrument_engine
+from src.infrastructure.database.lifecycle import (
+    drain_pool,
+    prefill_pool,
+    warm_user_queries,
+)
+from src.infrastructure.database.pool import PoolStats, get_pool_stats
+from src.infrastructure.database.profiler import query_profiler
+from src.infrastructure.security.hash import (
+    HashPoolStats,
+    hash_pool,
+    load_hash_backend,
+)
+from src.interfaces.api.middleware import (
+    AdmissionMiddleware,
+    CompressionMiddleware,
+    IdempotencyMiddleware,
+    QueryProfilerMiddleware,
+    TimingMiddleware,
+)
 from src.interfaces.api.router import router
 
-app = FastAPI(title=settings.APP_NAME, version=settings.APP_VERSION)
+logger = logging.getLogger(__name__)
+
+
+def all_engines() -> List[AsyncEngine]:
+    """The primary followed by every read replica."""
+    return [engine, *(replica_set.engines if replica_set else [])]
+
+
+async def warm_up() -> None:
+    """Pay the lazy first-use costs before the first request does."""
+    await hash_pool.run(load_hash_backend)
+
+    connections = (
+        settings.STARTUP_PREFILL_CONNECTIONS or settings.DATABASE_POOL_SIZE
+    )
+    for target in all_engines():
+        await prefill_pool(target, connections, warm_user_queries)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    started_at = perf_counter()
+    if settings.STARTUP_WARMUP_ENABLED:
+        try:
+            await warm_up()
+        except Exception:
+            # a cold start is slower, not broken; requests still connect
+            # and surface database errors on their own
+            logger.warning("Startup warm-up failed", exc_info=True)
+    startup.mark_ready(perf_counter() - started_at)
+    logger.info(
+        "Ready in %.3fs (imports %.3fs, warm-up %.3fs)",
+        startup.ready_seconds,
+        startup.import_seconds,
+        startup.warmup_seconds,
+    )
+
+    yield
+
+    startup.ready = False
+    left = sum(
+        await asyncio.gather(
+            *(
+                drain_pool(target, settings.SHUTDOWN_DRAIN_SECONDS)
+                for target in all_engines()
+            )
+        )
+    )
+    if left:
+        logger.warning("Closing %d connections still checked out", left)
+    await engine.dispose()
+    if replica_set is not None:
+        await replica_set.dispose()
+    await run_in_threadpool(hash_pool.shutdown)
+
+
+app = FastAPI(
+    title=settings.APP_NAME, version=settings.APP_VERSION, lifespan=lifespan
+)
+
+for target in all_engines():
+    instrument_engine(target)
+
+for field in fields(PoolStats):
+    registry.gauge(
+        f"db_pool_{field.name}",
+        f"Database connection pool {field.name.replace('_', ' ')}.",
+        lambda name=field.name: getattr(get_pool_stats(engine), name),
+    )
+for field in fields(HashPoolStats):
+    registry.gauge(
+        f"hash_pool_{field.name}",
+        f"Password hashing pool {field.name.replace('_', ' ')}.",
+        lambda name=field.name: getattr(hash_pool.stats(), name),
+    )
+for name, description in (
+    ("import", "Seconds from process start until the app was imported."),
+    ("warmup", "Seconds spent warming pools and caches at startup."),
+    ("ready", "Seconds from process start until the app was ready."),
+):
+    registry.gauge(
+        f"app_{name}_seconds",
+        description,
+        lambda name=name: getattr(startup, f"{name}_seconds"),
+    )
+
+# stored responses are kept uncompressed and replays still go through
+# compression, so each client gets the encoding it accepts
+app.add_middleware(IdempotencyMiddleware)
+# next, so replayed precompressed responses carry no headers that the
+# outer middlewares add per request
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+if settings.QUERY_PROFILER_ENABLED:
+    for target in all_engines():
+        query_profiler.attach(target)
+    app.add_middleware(QueryProfilerMiddleware, profiler=query_profiler)
+# outside the app's own work but inside timing, so rejections are measured
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(TimingMiddleware)
 
 # set CORS
 if settings.BACKEND_CORS_ORIGINS:
@@ -24,4 +156,26 @@ def root() -> str:
     return "service is working"
 
 
+@app.get("/system/pool", tags=["System"])  # type: ignore[misc]
+def pool_stats() -> Dict[str, Any]:
+    return asdict(get_pool_stats(engine))
+
+
+@app.get("/system/ready", tags=["System"])  # type: ignore[misc]
+def ready() -> JSONResponse:
+    # readiness, unlike "/", fails until warm-up is done and during drain
+    return JSONResponse(
+        {"ready": startup.ready}, status_code=200 if startup.ready else 503
+    )
+
+
+@app.get("/metrics", tags=["System"])  # type: ignore[misc]
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4"
+    )
+
+
 app.include_router(router, prefix=settings.API_V1_STR)
+
+startup.mark_imported()
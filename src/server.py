@@ -0,0 +1,143 @@
+import logging
+import math
+import os
+from dataclasses import dataclass
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import uvicorn
+
+from src.core.config import Settings, settings
+
+logger = logging.getLogger(__name__)
+
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+
+@dataclass(frozen=True)
+class PoolBudget:
+    pool_size: int
+    max_overflow: int
+
+
+def available_cpus(cpu_max: Path = CGROUP_CPU_MAX) -> int:
+    """CPUs this process may use, honouring affinity and a cgroup v2 quota
+    (a container's ``--cpus`` limit)."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - macOS and Windows
+        cpus = os.cpu_count() or 1
+
+    try:
+        quota, period = cpu_max.read_text().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+
+
+def worker_count(config: Settings) -> int:
+    # the app is async and hashing runs on its own threads, so one
+    # worker per CPU keeps every core busy without oversubscribing
+    return config.SERVER_WORKERS or available_cpus()
+
+
+def pool_budget(config: Settings, workers: int) -> PoolBudget:
+    """Shrink each worker's pool so all of them together stay within
+    ``DATABASE_MAX_CONNECTIONS``; the configured sizes are upper bounds."""
+    if config.DATABASE_MAX_CONNECTIONS is None:
+        return PoolBudget(
+            config.DATABASE_POOL_SIZE, config.DATABASE_MAX_OVERFLOW
+        )
+
+    available = (
+        config.DATABASE_MAX_CONNECTIONS - config.DATABASE_RESERVED_CONNECTIONS
+    )
+    per_worker = available // workers
+    if per_worker < 1:
+        raise ValueError(
+            f"{workers} workers need at least one database connection "
+            f"each, but only {available} of DATABASE_MAX_CONNECTIONS="
+            f"{config.DATABASE_MAX_CONNECTIONS} are available"
+        )
+
+    pool_size = min(config.DATABASE_POOL_SIZE, per_worker)
+    return PoolBudget(
+        pool_size, min(config.DATABASE_MAX_OVERFLOW, per_worker - pool_size)
+    )
+
+
+def uvicorn_options(config: Settings, workers: int) -> Dict[str, Any]:
+    max_requests: Optional[int] = None
+    if workers > 1:
+        # the supervisor replaces recycled workers; a lone worker would
+        # just exit, so recycling is left to the orchestrator there
+        max_requests = config.SERVER_MAX_REQUESTS
+
+    return {
+        "host": config.SERVER_HOST,
+        "port": config.SERVER_PORT,
+        "workers": workers,
+        # "auto" picks uvloop and httptools when they are installed
+        "loop": "auto",
+        "http": "auto",
+        "lifespan": "on",
+        "backlog": config.SERVER_BACKLOG,
+        "timeout_keep_alive": config.SERVER_KEEPALIVE_SECONDS,
+        "timeout_graceful_shutdown": config.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+        "limit_max_requests": max_requests,
+        "access_log": config.SERVER_ACCESS_LOG,
+        "proxy_headers": True,
+        "forwarded_allow_ips": config.SERVER_FORWARDED_ALLOW_IPS,
+        "server_header": False,
+    }
+
+
+def main() -> None:
+    # uvicorn only configures logging once it runs
+    logging.basicConfig(
+        level=logging.INFO, format="%(levelname)s:  %(message)s"
+    )
+    workers = worker_count(settings)
+    budget = pool_budget(settings, workers)
+    if workers > 1 and settings.CACHE_BACKEND == "memory":
+        logger.warning(
+            "CACHE_BACKEND=memory is per worker: the %d workers may serve "
+            "changed or deleted users for up to %ss; use CACHE_BACKEND=redis "
+            "to share one cache",
+            workers,
+            settings.CACHE_TTL_SECONDS,
+        )
+    if (
+        workers > 1
+        and settings.IDEMPOTENT_ROUTES
+        and settings.CACHE_BACKEND != "redis"
+    ):
+        # the idempotency store falls back to memory without a Redis cache
+        logger.warning(
+            "Idempotency keys are per worker without CACHE_BACKEND=redis: "
+            "a retry that reaches another of the %d workers runs again",
+            workers,
+        )
+
+    # workers are spawned and rebuild Settings from the environment;
+    # the in-process single worker reads the settings object directly
+    for name, value in (
+        ("DATABASE_POOL_SIZE", budget.pool_size),
+        ("DATABASE_MAX_OVERFLOW", budget.max_overflow),
+    ):
+        os.environ[name] = str(value)
+        setattr(settings, name, value)
+
+    logger.info(
+        "Starting %d worker(s) with loop=%s http=%s, %d+%d database "
+        "connections each",
+        workers,
+        "uvloop" if find_spec("uvloop") else "asyncio",
+        "httptools" if find_spec("httptools") else "h11",
+        budget.pool_size,
+        budget.max_overflow,
+    )
+    uvicorn.run("src.main:app", **uvicorn_options(settings, workers))
@@ -0,0 +1,76 @@
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List
+
+import pytest
+
+RESULTS: List["BenchmarkResult"] = []
+
+
+@dataclass
+class BenchmarkResult:
+    group: str
+    name: str
+    rounds: int
+    median_us: float
+    p95_us: float
+
+
+class Bench:
+    """Time a callable repeatedly and record the result for the summary."""
+
+    def __init__(self, group: str):
+        self.group = group
+
+    def run(self, name: str, func: Callable[[], object], rounds: int = 200, warmup: int = 5) -> BenchmarkResult:
+        for _ in range(warmup):
+            func()
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - started)
+        return self.record(name, samples)
+
+    async def run_async(
+        self, name: str, func: Callable[[], Awaitable[object]], rounds: int = 50, warmup: int = 3
+    ) -> BenchmarkResult:
+        for _ in range(warmup):
+            await func()
+        samples = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            await func()
+            samples.append(time.perf_counter() - started)
+        return self.record(name, samples)
+
+    def record(self, name: str, samples: List[float]) -> BenchmarkResult:
+        ordered = sorted(samples)
+        result = BenchmarkResult(
+            group=self.group,
+            name=name,
+            rounds=len(samples),
+            median_us=statistics.median(ordered) * 1e6,
+            p95_us=ordered[int(0.95 * (len(ordered) - 1))] * 1e6,
+        )
+        RESULTS.append(result)
+        return result
+
+
+@pytest.fixture
+def bench(request) -> Bench:
+    """Benchmark helper grouped under the current test name."""
+    return Bench(request.node.name)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'benchmark':<90} {'rounds':>7} {'median us':>12} {'p95 us':>12}")
+    for result in RESULTS:
+        label = f"{result.group} :: {result.name}"
+        terminalreporter.write_line(
+            f"{label:<90} {result.rounds:>7} {result.median_us:>12.1f} {result.p95_us:>12.1f}"
+        )
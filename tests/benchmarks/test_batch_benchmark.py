@@ -0,0 +1,44 @@
+import asyncio
+import pytest
+from sqlalchemy import insert
+from uuid import uuid4
+from src.infrastructure.database.models.user import User as UserEntity
+from src.infrastructure.repositories.batched_user_repository import BatchedUserRepository
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from tests.conftest import TestSession
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.asyncio
+async def test_resolving_many_ids(bench):
+    """Report resolving 100 ids one by one, in one batch, and through the coalescing loader."""
+    user_ids = [uuid4() for _ in range(100)]
+    async with TestSession() as session:
+        await session.execute(
+            insert(UserEntity),
+            [{"id": user_id, "name": "Batch", "email": f"{user_id}@example.com", "password": "x"} for user_id in user_ids],
+        )
+        await session.commit()
+
+    async def one_by_one():
+        async with TestSession() as session:
+            repository = UserRepositoryImpl(session)
+            for user_id in user_ids:
+                await repository.get_user_by_id(user_id)
+
+    async def batched():
+        async with TestSession() as session:
+            await UserRepositoryImpl(session).get_users_by_ids(user_ids)
+
+    async def coalesced():
+        async with TestSession() as session:
+            repository = BatchedUserRepository(UserRepositoryImpl(session), TestSession)
+            await asyncio.gather(*(repository.get_user_by_id(user_id) for user_id in user_ids))
+
+    before = await bench.run_async("100 x session.get", one_by_one, rounds=20)
+    after = await bench.run_async("get_users_by_ids(100)", batched, rounds=20)
+    loader = await bench.run_async("100 concurrent get_user_by_id via loader", coalesced, rounds=20)
+
+    assert after.median_us < before.median_us
+    assert loader.median_us < before.median_us
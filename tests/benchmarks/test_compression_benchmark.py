@@ -0,0 +1,62 @@
+import gzip
+import pytest
+from httpx import ASGITransport, AsyncClient
+from pydantic_core import to_json
+from sqlalchemy import insert
+from uuid import uuid4
+from src.domain.models.user import User
+from src.infrastructure.database.models.user import User as UserEntity
+from src.interfaces.api.compression import PrecompressedCache, compress, precompressed
+from src.main import app
+from tests.conftest import TestSession
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.asyncio
+async def test_repeated_list_page(bench, monkeypatch):
+    """Report a repeated 500-row gzip list page rendered each time vs replayed from the precompressed cache.
+
+    On SQLite the version probe costs about as much as the page query itself, so the
+    end-to-end numbers are reported only; the replay skips serialization and compression.
+    """
+    async with TestSession() as session:
+        await session.execute(
+            insert(UserEntity),
+            [{"id": uuid4(), "name": f"Page {index}", "email": f"page{index}@example.com", "password": "x"} for index in range(500)],
+        )
+        await session.commit()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        def get():
+            return client.get("/api/v1/user/", params={"limit": 500}, headers={"Accept-Encoding": "gzip"})
+
+        monkeypatch.setattr(precompressed, "max_entries", 0)
+        await bench.run_async("query + serialize + gzip", get, rounds=30)
+        rendered = await get()
+        monkeypatch.setattr(precompressed, "max_entries", 256)
+        await bench.run_async("version probe + precompressed replay", get, rounds=30)
+        replayed = await get()
+
+    assert replayed.content == rendered.content
+    assert replayed.headers["content-encoding"] == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_precompressed_replay_skips_rendering(bench):
+    """Report serializing and gzipping a 500-user page vs replaying it from the cache."""
+    users = [User(name=f"Page {index}", email=f"page{index}@example.com") for index in range(500)]
+    cache = PrecompressedCache(1)
+    scope = {"path": "/api/v1/user/", "query_string": b"limit=500"}
+    cache.put(scope, "gzip", 'W/"page"', 200, [(b"content-encoding", b"gzip")], gzip.compress(to_json(users)))
+
+    async def render():
+        return await compress(to_json(users), "gzip")
+
+    async def replay():
+        return cache.get(scope, "gzip", 'W/"page"')
+
+    rendered = await bench.run_async("to_json + gzip, 500 users", render, rounds=100)
+    replayed = await bench.run_async("precompressed cache hit", replay, rounds=100)
+
+    assert replayed.median_us < rendered.median_us
@@ -0,0 +1,73 @@
+import itertools
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.models.user import CreateUser
+from src.infrastructure.database.models.user import User as UserEntity
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from tests.conftest import test_engine
+
+pytestmark = pytest.mark.benchmark
+
+
+async def legacy_create_user(session: AsyncSession, user: CreateUser) -> UserEntity:
+    """The previous create_user path: existence SELECT, INSERT, commit, refresh."""
+    exists = await session.execute(select(UserEntity.id).where(UserEntity.email == user.email))
+    assert exists.scalar() is None
+    user_db = UserEntity(**user.model_dump(exclude={"id", "created_at", "updated_at"}))
+    session.add(user_db)
+    await session.commit()
+    await session.refresh(user_db)
+    return user_db
+
+
+@pytest.fixture
+def statements():
+    """Record every statement sent to the test database."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(autouse=True)
+def fast_hash(mocker):
+    """Take bcrypt out of the measurement so only the DB path is compared."""
+
+    async def fake_hash(password):
+        return f"hashed-{password}"
+
+    mocker.patch(
+        "src.infrastructure.repositories.user_repository_impl.hash_password_async",
+        side_effect=fake_hash,
+    )
+
+
+async def test_create_user_round_trips(db_session: AsyncSession, statements, bench):
+    """Compare the old multi-statement create path with INSERT ... RETURNING."""
+    counter = itertools.count()
+    repository = UserRepositoryImpl(db_session)
+
+    def new_user():
+        index = next(counter)
+        return CreateUser(name=f"Bench{index}", email=f"bench{index}@example.com", password="pass")
+
+    await legacy_create_user(db_session, new_user())
+    legacy_statements = [s for s in statements if not s.startswith(("BEGIN", "COMMIT"))]
+    statements.clear()
+
+    await repository.create_user(new_user())
+    new_statements = [s for s in statements if not s.startswith(("BEGIN", "COMMIT"))]
+
+    assert len(legacy_statements) == 3
+    assert len(new_statements) == 1
+    assert "ON CONFLICT" in new_statements[0] and "RETURNING" in new_statements[0]
+
+    legacy = await bench.run_async("legacy select+insert+refresh", lambda: legacy_create_user(db_session, new_user()))
+    single = await bench.run_async("insert on conflict returning", lambda: repository.create_user(new_user()))
+
+    assert legacy.rounds == single.rounds
@@ -0,0 +1,56 @@
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+from src.application.use_cases.user_use_case import UserUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.dependencies import get_user_controller
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.backend import InMemoryCacheBackend
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.database.base import get_db
+from src.infrastructure.repositories.cached_user_repository import CachedUserRepository
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from src.interfaces.controllers.user_controller import UserController
+from tests.conftest import override_get_db
+
+pytestmark = pytest.mark.benchmark
+
+
+legacy_cache = InMemoryCacheBackend(100)
+
+
+def legacy_repository(session: AsyncSession = Depends(get_db)) -> UserRepository:
+    return CachedUserRepository(UserRepositoryImpl(session), legacy_cache, SingleFlight(), ttl=60.0, negative_ttl=5.0)
+
+
+def legacy_use_case(repository: UserRepository = Depends(legacy_repository)) -> UserUseCase:
+    return UserUseCase(repository)
+
+
+def legacy_controller(use_case: UserUseCase = Depends(legacy_use_case)) -> UserController:
+    return UserController(use_case)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/legacy")
+    async def legacy(controller: UserController = Depends(legacy_controller)) -> str:
+        return "ok"
+
+    @app.get("/container")
+    async def container(controller: UserController = Depends(get_user_controller)) -> str:
+        return "ok"
+
+    app.dependency_overrides[get_db] = override_get_db
+    return app
+
+
+@pytest.mark.asyncio
+async def test_dependency_resolution_overhead(bench):
+    """Report per-request cost of the nested per-request chain vs container singletons."""
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as client:
+        before = await bench.run_async("per-request repository/use case/controller", lambda: client.get("/legacy"), rounds=300)
+        after = await bench.run_async("container singletons + session proxy", lambda: client.get("/container"), rounds=300)
+
+    assert after.median_us < before.median_us
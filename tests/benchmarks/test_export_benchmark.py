@@ -0,0 +1,74 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from src.infrastructure.database.models.user import User as UserEntity
+from src.main import app
+from tests.conftest import TestSession
+
+pytestmark = pytest.mark.benchmark
+
+
+async def seed(count: int):
+    started = datetime(2025, 1, 1)
+    async with TestSession() as session:
+        await session.execute(
+            insert(UserEntity),
+            [
+                {
+                    "id": uuid4(),
+                    "name": f"Export{index}",
+                    "email": f"export{index}@example.com",
+                    "password": "x",
+                    "created_at": started + timedelta(seconds=index),
+                    "updated_at": started,
+                }
+                for index in range(count)
+            ],
+        )
+        await session.commit()
+
+
+async def export(query: bytes):
+    """Drive the ASGI app directly, timing the first body chunk and the whole response."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/api/v1/user/export", "raw_path": b"/api/v1/user/export", "root_path": "", "query_string": query,
+        "headers": [(b"host", b"test")], "client": ("test", 1), "server": ("test", 80),
+    }
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+    started = time.perf_counter()
+    first_byte = None
+    size = 0
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # StreamingResponse listens for a disconnect that never comes
+        await asyncio.Event().wait()
+
+    async def send(message):
+        nonlocal first_byte, size
+        if message["type"] == "http.response.body" and message.get("body"):
+            first_byte = first_byte or time.perf_counter() - started
+            size += len(message["body"])
+
+    await app(scope, receive, send)
+    return first_byte, time.perf_counter() - started, size
+
+
+@pytest.mark.asyncio
+async def test_export_time_to_first_byte(bench):
+    """Report export time-to-first-byte against total time on a 20k-row table."""
+    await seed(20_000)
+
+    first_byte, total, size = await export(b"format=ndjson")
+    bench.record("ndjson first byte, 20k rows", [first_byte])
+    bench.record("ndjson full body, 20k rows", [total])
+
+    assert size > 20_000 * 100
+    # streaming: the first chunk does not wait for the rest of the table
+    assert first_byte < total / 5
@@ -0,0 +1,73 @@
+import json
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+import pytest
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from src.domain.models.user import User
+from src.infrastructure.database.models.user import User as UserEntity
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 500
+
+users_adapter = TypeAdapter(List[User])
+
+
+@pytest.fixture(scope="module")
+def rows():
+    """Detached ORM rows shaped like what get_all_users reads from the DB."""
+    now = datetime.now()
+    return [
+        UserEntity(
+            id=uuid4(),
+            name=f"User {index}",
+            email=f"user{index}@example.com",
+            password="hashed",
+            created_at=now,
+            updated_at=now,
+            is_active=True,
+            is_superuser=False,
+        )
+        for index in range(ROWS)
+    ]
+
+
+def validated_path(rows) -> bytes:
+    """Previous path: validated User(...) per row, then FastAPI's response_model
+    validation + dump_python and the stdlib encoder used by JSONResponse."""
+    items = [
+        User(
+            id=row.id,
+            name=row.name,
+            email=row.email,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            is_active=row.is_active,
+            is_superuser=row.is_superuser,
+        )
+        for row in rows
+    ]
+    content = users_adapter.dump_python(users_adapter.validate_python(items), mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def trusted_path(rows) -> bytes:
+    """Fast path: model_construct from ORM attributes and FastJSONResponse.render."""
+    to_domain = UserRepositoryImpl._UserRepositoryImpl__to_domain
+    return to_json([to_domain(None, row) for row in rows])
+
+
+def test_user_list_serialization_per_row(rows, bench):
+    """Report per-row cost of building and rendering a user list response."""
+    assert json.loads(validated_path(rows)) == json.loads(trusted_path(rows))
+
+    before = bench.run(f"validated construct + json.dumps ({ROWS} rows)", lambda: validated_path(rows), rounds=30)
+    after = bench.run(f"model_construct + to_json ({ROWS} rows)", lambda: trusted_path(rows), rounds=30)
+
+    bench.run("per row: validated", lambda: validated_path(rows[:1]), rounds=500)
+    bench.run("per row: trusted", lambda: trusted_path(rows[:1]), rounds=500)
+
+    assert before.rounds == after.rounds
@@ -1,9 +1,13 @@
 import pytest
-from typing import AsyncGenerator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from src.main import app
-from src.infrastructure.database.base import Base, get_db
+from src.infrastructure.database import base
+from src.infrastructure.database.base import Base, get_db, get_session_factory
+from src.infrastructure.database.profiler import query_profiler
+from src.interfaces.api.compression import precompressed
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 TEST_DB_FILE = "test.db"
@@ -17,6 +21,10 @@ async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_session_factory] = lambda: TestSession
+# code outside request dependencies (e.g. batched lookups) calls the
+# factory directly
+base.async_session = TestSession
 
 @pytest.fixture(autouse=True, scope="session")
 async def setup_database():
@@ -39,3 +47,27 @@ async def clean_database(db_session: AsyncSession):
     for table in reversed(Base.metadata.sorted_tables):
         await db_session.execute(table.delete())
     await db_session.commit()
+
+@pytest.fixture(autouse=True)
+def clear_precompressed():
+    """Start every test without replayable compressed responses."""
+    precompressed._entries.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """Assert the SQL a block may run, e.g. ``with query_budget(1): await client.get(...)``.
+
+    Fails when the block runs more than ``max_queries`` statements or repeats
+    one statement more than ``repeat_threshold`` times (N+1).
+    """
+    query_profiler.attach(test_engine)
+
+    @contextmanager
+    def budget(max_queries: int, repeat_threshold: Optional[int] = None):
+        with query_profiler.profile(repeat_threshold=repeat_threshold, strict=True) as profile:
+            yield profile
+        assert profile.total <= max_queries, f"query budget of {max_queries} exceeded:\n{profile.report()}"
+
+    yield budget
+    query_profiler.detach(test_engine)
@@ -35,6 +35,46 @@ async def test_get_users(client: AsyncClient, db_session: AsyncSession):
 
 
 
+@pytest.mark.anyio
+async def test_get_users_paginated(client: AsyncClient, db_session: AsyncSession):
+    """Test GET /user follows X-Next-Cursor across pages."""
+    user_repo = UserRepositoryImpl(db_session)
+    for name in ("Nami", "Zoro", "Sanji"):
+        await user_repo.create_user(CreateUser(name=name, email=f"{name.lower()}@example.com", password="pass123"))
+
+    response = await client.get("/api/v1/user/", params={"limit": 2})
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get("/api/v1/user/", params={"limit": 2, "cursor": cursor})
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.anyio
+async def test_get_users_invalid_limit(client: AsyncClient):
+    """Test GET /user rejects limits outside the allowed range."""
+    response = await client.get("/api/v1/user/", params={"limit": 0})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_get_users_cursor_with_non_string_id(client: AsyncClient):
+    """Test GET /user answers 422, not 500, for a well-formed cursor whose id is not a string."""
+    import base64, json
+
+    cursor = base64.urlsafe_b64encode(json.dumps(["created_at", "2025-03-05T01:07:36", 1]).encode()).decode()
+
+    response = await client.get("/api/v1/user/", params={"cursor": cursor})
+
+    assert response.status_code == 422
+
+
 @pytest.mark.anyio
 async def test_get_user_by_id(client: AsyncClient, db_session: AsyncSession):
     """Test GET /user/{user_id} retrieves a specific user."""
@@ -58,6 +98,121 @@ async def test_get_user_by_id_not_found(client: AsyncClient):
     assert response.status_code == 404
 
 
+@pytest.mark.anyio
+async def test_get_user_conditional(client: AsyncClient, db_session: AsyncSession):
+    """Test GET /user/{id} sends validators and answers matching revalidations with 304."""
+    user_repo = UserRepositoryImpl(db_session)
+    user = await user_repo.create_user(CreateUser(name="Etag", email="etag@example.com", password="pass123"))
+
+    response = await client.get(f"/api/v1/user/{user.id}")
+    etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+    assert etag.startswith('W/"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    response = await client.get(f"/api/v1/user/{user.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = await client.get(f"/api/v1/user/{user.id}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    response = await client.get(f"/api/v1/user/{user.id}", headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200
+    assert response.json()["email"] == "etag@example.com"
+
+    response = await client.get(f"/api/v1/user/{uuid4()}", headers={"If-None-Match": etag})
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_get_users_conditional(client: AsyncClient, db_session: AsyncSession, query_budget):
+    """Test GET /user revalidates a page from ids and timestamps alone."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_user(CreateUser(name="Page", email="page@example.com", password="pass123"))
+
+    response = await client.get("/api/v1/user/", params={"fields": "name"})
+    etag = response.headers["ETag"]
+    assert response.json() == [{"name": "Page"}]
+    assert "Last-Modified" not in response.headers
+
+    with query_budget(1) as profile:
+        response = await client.get("/api/v1/user/", params={"fields": "name"}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert next(iter(profile.statements.values())).startswith("select users.updated_at, users.id, users.created_at")
+
+    response = await client.get("/api/v1/user/", params={"fields": "email"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+    await user_repo.create_user(CreateUser(name="Page 2", email="page2@example.com", password="pass123"))
+    response = await client.get("/api/v1/user/", params={"fields": "name"}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+
+@pytest.mark.anyio
+async def test_get_users_conditional_after_delete(client: AsyncClient, db_session: AsyncSession):
+    """Test GET /user does not answer 304 for a page that lost a row, whichever validator is sent."""
+    user_repo = UserRepositoryImpl(db_session)
+    users = [
+        await user_repo.create_user(CreateUser(name=f"Gone {index}", email=f"gone{index}@example.com", password="pass123"))
+        for index in range(3)
+    ]
+    etag = (await client.get("/api/v1/user/")).headers["ETag"]
+
+    await user_repo.delete_user(users[1].id)
+    by_etag = await client.get("/api/v1/user/", headers={"If-None-Match": etag})
+    by_date = await client.get("/api/v1/user/", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+
+    assert by_etag.status_code == by_date.status_code == 200
+    assert len(by_etag.json()) == len(by_date.json()) == 2
+
+
+@pytest.mark.anyio
+async def test_get_users_compressed_and_replayed(client: AsyncClient, db_session: AsyncSession, query_budget):
+    """Test GET /user compresses large pages and replays unchanged ones without reloading them."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_users([
+        CreateUser(name=f"Compressed {index}", email=f"compressed{index}@example.com", password="pass123")
+        for index in range(20)
+    ])
+
+    first = await client.get("/api/v1/user/", params={"limit": 20}, headers={"Accept-Encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    assert len(first.json()) == 20
+
+    with query_budget(1) as profile:
+        second = await client.get("/api/v1/user/", params={"limit": 20}, headers={"Accept-Encoding": "gzip"})
+    assert next(iter(profile.statements.values())).startswith("select users.updated_at, users.id, users.created_at")
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["content-encoding"] == "gzip"
+
+    await user_repo.create_user(CreateUser(name="Compressed new", email="compressed-new@example.com", password="pass123"))
+    third = await client.get("/api/v1/user/", params={"limit": 20}, headers={"Accept-Encoding": "gzip"})
+    assert third.headers["ETag"] != first.headers["ETag"]
+    assert "X-Next-Cursor" in third.headers
+
+
+@pytest.mark.anyio
+async def test_get_users_by_ids(client: AsyncClient, db_session: AsyncSession):
+    """Test POST /user/batch resolves many ids in one call."""
+    user_repo = UserRepositoryImpl(db_session)
+    user = await user_repo.create_user(CreateUser(name="Batch", email="batch@example.com", password="pass123"))
+    missing = str(uuid4())
+
+    response = await client.post("/api/v1/user/batch", json=[str(user.id), missing])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [found["email"] for found in body["users"]] == ["batch@example.com"]
+    assert body["not_found"] == [missing]
+
+    response = await client.post("/api/v1/user/batch", json=[])
+    assert response.status_code == 422
+
+
 @pytest.mark.anyio
 async def test_create_user(client: AsyncClient):
     """Test POST /api/v1/user successfully creates a user."""
@@ -77,6 +232,27 @@ async def test_create_user(client: AsyncClient):
     assert data["name"] == "Adam"
 
 
+@pytest.mark.anyio
+async def test_create_user_idempotent_retry(client: AsyncClient, db_session: AsyncSession, monkeypatch):
+    """Test that a retried POST /user with the same Idempotency-Key replays the first response without hashing again."""
+    from src.infrastructure.security import hash as hashing
+
+    hashed = []
+    original = hashing.hash_password
+    monkeypatch.setattr(hashing, "hash_password", lambda password: hashed.append(password) or original(password))
+    payload = {"name": "Ida", "email": "ida@example.com", "password": "securepass"}
+    key = {"Idempotency-Key": str(uuid4())}
+
+    first = await client.post("/api/v1/user/", json=payload, headers=key)
+    retry = await client.post("/api/v1/user/", json=payload, headers=key)
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(hashed) == 1
+    assert (await UserRepositoryImpl(db_session).count_users()).total == 1
+
+
 @pytest.mark.anyio
 async def test_create_user_duplicate(client: AsyncClient, db_session: AsyncSession):
     """Test POST /user returns 400 for duplicate users."""
@@ -89,3 +265,212 @@ async def test_create_user_duplicate(client: AsyncClient, db_session: AsyncSessi
     )
 
     assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_create_users_bulk_json(client: AsyncClient, db_session: AsyncSession):
+    """Test POST /user/bulk with a JSON array returns per-row results."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_user(CreateUser(name="Kid", email="kid@example.com", password="pass123"))
+
+    response = await client.post(
+        "/api/v1/user/bulk",
+        json=[
+            {"name": "Law", "email": "law@example.com", "password": "pass123"},
+            {"name": "Kid", "email": "kid@example.com", "password": "pass123"},
+            {"name": "Broken", "email": "not-an-email", "password": "pass123"},
+        ],
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["status"] for result in results] == ["created", "duplicate", "invalid"]
+    assert results[0]["user"]["email"] == "law@example.com"
+    assert "email" in results[2]["detail"]
+
+
+@pytest.mark.anyio
+async def test_create_users_bulk_ndjson(client: AsyncClient, monkeypatch):
+    """Test POST /user/bulk with an NDJSON stream spanning several batches."""
+    monkeypatch.setattr("src.interfaces.api.v1.user.settings.BULK_BATCH_SIZE", 2)
+    lines = [
+        '{"name": "Ace", "email": "ace@example.com", "password": "pass123"}',
+        "{not json",
+        '{"name": "Sabo", "email": "sabo@example.com", "password": "pass123"}',
+        "",
+        '{"name": "Ace", "email": "ace@example.com", "password": "pass123"}',
+        '{"name": "Yamato", "email": "yamato@example.com", "password": "pass123"}',
+    ]
+
+    response = await client.post(
+        "/api/v1/user/bulk",
+        content="\n".join(lines).encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    assert [result["status"] for result in results] == ["created", "invalid", "created", "duplicate", "created"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("body", [b"{not json", b'{"name": "Solo"}'])
+async def test_create_users_bulk_rejects_non_array(client: AsyncClient, body: bytes):
+    """Test POST /user/bulk rejects bodies that are not a JSON array."""
+    response = await client.post(
+        "/api/v1/user/bulk", content=body, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_delete_user(client: AsyncClient, db_session: AsyncSession):
+    """Test DELETE /user/{user_id} removes the user."""
+    user_repo = UserRepositoryImpl(db_session)
+    user = await user_repo.create_user(CreateUser(name="Brook", email="brook@example.com", password="pass123"))
+
+    response = await client.delete(f"/api/v1/user/{user.id}")
+
+    assert response.status_code == 200
+    assert response.json() == {"message": "User deleted"}
+
+    response = await client.delete(f"/api/v1/user/{user.id}")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_delete_users_bulk(client: AsyncClient, db_session: AsyncSession):
+    """Test DELETE /user with a list of IDs runs one bulk delete."""
+    user_repo = UserRepositoryImpl(db_session)
+    user = await user_repo.create_user(CreateUser(name="Franky", email="franky@example.com", password="pass123"))
+    missing = uuid4()
+
+    response = await client.request("DELETE", "/api/v1/user/", json=[str(user.id), str(missing)])
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted": [str(user.id)], "not_found": [str(missing)]}
+
+    response = await client.request("DELETE", "/api/v1/user/", json=[])
+
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_fast_json_responses_match_default(client: AsyncClient, db_session: AsyncSession, monkeypatch):
+    """Test that the fast JSON path returns the same payloads and headers."""
+    user_repo = UserRepositoryImpl(db_session)
+    for name in ("Chopper", "Usopp"):
+        await user_repo.create_user(CreateUser(name=name, email=f"{name.lower()}@example.com", password="pass123"))
+
+    default_list = await client.get("/api/v1/user/", params={"limit": 1})
+    user_id = default_list.json()[0]["id"]
+    default_user = await client.get(f"/api/v1/user/{user_id}")
+
+    monkeypatch.setattr("src.interfaces.api.responses.settings.FAST_JSON_RESPONSES", True)
+    fast_list = await client.get("/api/v1/user/", params={"limit": 1})
+    fast_user = await client.get(f"/api/v1/user/{user_id}")
+
+    assert fast_list.json() == default_list.json()
+    assert fast_list.headers["X-Next-Cursor"] == default_list.headers["X-Next-Cursor"]
+    assert fast_user.json() == default_user.json()
+
+
+@pytest.mark.anyio
+async def test_user_endpoints_query_budget(client: AsyncClient, db_session: AsyncSession, query_budget):
+    """Test that listing and fetching users stay within their query budgets."""
+    user_repo = UserRepositoryImpl(db_session)
+    users = [
+        await user_repo.create_user(CreateUser(name=f"Budget {index}", email=f"budget{index}@example.com", password="pass123"))
+        for index in range(3)
+    ]
+
+    with query_budget(1, repeat_threshold=1) as profile:
+        response = await client.get("/api/v1/user/")
+    assert response.status_code == 200
+    assert profile.total == 1
+
+    with query_budget(3):
+        for user in users:
+            await client.get(f"/api/v1/user/{user.id}")
+
+
+@pytest.mark.anyio
+async def test_get_users_filters_sort_and_fields(client: AsyncClient, db_session: AsyncSession):
+    """Test GET /user pushes filters, sort and a sparse fieldset to the server."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_users([
+        CreateUser(name="Ann", email="ann@corp.example.com", password="pass123"),
+        CreateUser(name="Ben", email="ben@corp.example.com", password="pass123", is_active=False),
+        CreateUser(name="Cid", email="cid@other.example.com", password="pass123"),
+    ])
+
+    response = await client.get(
+        "/api/v1/user/",
+        params={"email_domain": "corp.example.com", "is_active": "true", "sort": "-name", "fields": "name, email"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [{"name": "Ann", "email": "ann@corp.example.com"}]
+
+    response = await client.get("/api/v1/user/", params={"sort": "-name", "fields": "name", "limit": 2})
+    assert response.json() == [{"name": "Cid"}, {"name": "Ben"}]
+    response = await client.get(
+        "/api/v1/user/", params={"sort": "-name", "fields": "name", "limit": 2, "cursor": response.headers["X-Next-Cursor"]}
+    )
+    assert response.json() == [{"name": "Ann"}]
+
+
+@pytest.mark.anyio
+async def test_get_users_total_count(client: AsyncClient, db_session: AsyncSession):
+    """Test GET /user reports the filtered total only when asked for it."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_users([
+        CreateUser(name=f"Count{index}", email=f"count{index}@example.com", password="pass123", is_active=index != 0)
+        for index in range(3)
+    ])
+
+    response = await client.get("/api/v1/user/", params={"limit": 1})
+    assert "X-Total-Count" not in response.headers
+
+    response = await client.get("/api/v1/user/", params={"limit": 1, "is_active": "true", "count": "approximate"})
+    assert response.headers["X-Total-Count"] == "2"
+    assert response.headers["X-Total-Count-Exact"] == "true"
+
+    response = await client.get("/api/v1/user/", params={"count": "rough"})
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_export_users(client: AsyncClient, db_session: AsyncSession):
+    """Test GET /user/export streams every user as NDJSON or CSV, optionally gzipped."""
+    import csv, io, json
+
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_users([
+        CreateUser(name=f"Export{index}", email=f"export{index}@example.com", password="pass123") for index in range(3)
+    ])
+
+    response = await client.get("/api/v1/user/export", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert sorted(json.loads(line)["name"] for line in response.text.splitlines()) == ["Export0", "Export1", "Export2"]
+    assert "password" not in response.text
+
+    response = await client.get("/api/v1/user/export", params={"format": "csv"}, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(row["email"] for row in rows) == ["export0@example.com", "export1@example.com", "export2@example.com"]
+
+    response = await client.get("/api/v1/user/export", params={"format": "xml"})
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("params", [{"fields": "name,password"}, {"fields": " , "}, {"sort": "password"}])
+async def test_get_users_rejects_unknown_fields_and_sorts(client: AsyncClient, params):
+    """Test GET /user rejects fields and sort keys outside the user model."""
+    response = await client.get("/api/v1/user/", params=params)
+
+    assert response.status_code == 422
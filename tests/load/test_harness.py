@@ -0,0 +1,40 @@
+import json
+import pytest
+from src.main import app
+from tests.load.harness import asgi_target, find_regressions, percentile, run_load
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 95) == 0.0
+
+
+def test_find_regressions_honours_threshold():
+    baseline = {"get": {"p95_ms": 10.0, "rps": 100.0, "errors": 0}}
+
+    assert find_regressions({"get": {"p95_ms": 11.0, "rps": 90.0, "errors": 0}}, baseline, 0.2) == []
+    assert find_regressions({"list": {"p95_ms": 99.0, "rps": 1.0, "errors": 3}}, baseline, 0.2) == []
+
+    regressions = find_regressions({"get": {"p95_ms": 13.0, "rps": 70.0, "errors": 1}}, baseline, 0.2)
+    assert len(regressions) == 3
+
+
+@pytest.mark.benchmark
+async def test_run_load_in_process(tmp_path):
+    async with asgi_target(app) as client:
+        results = await run_load(client, requests=4, concurrency=2, seed=3)
+
+    assert set(results) == {"list", "get", "create", "delete"}
+    for result in results.values():
+        assert result.errors == 0
+        assert result.requests == 4
+        assert 0 < result.p50_ms <= result.p95_ms <= result.p99_ms
+
+    summary = {name: vars(result) for name, result in results.items()}
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"scenarios": summary}))
+    assert find_regressions(summary, json.loads(baseline.read_text())["scenarios"], 0.0) == []
@@ -1,9 +1,10 @@
 import pytest
+from datetime import datetime
 import pytest_asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 from src.application.use_cases.user_use_case import UserUseCase
-from src.domain.models.user import CreateUser, User
+from src.domain.models.user import BulkDeleteResult, BulkUserResult, CreateUser, User, UserBatch, UserCount, UserFilter, UserPage
 from src.domain.repositories.user_repository import UserRepository
 
 
@@ -23,17 +24,51 @@ async def user_use_case(user_repo_mock):
 @pytest.mark.asyncio
 async def test_list_users(user_use_case, user_repo_mock):
     """Test that list_users() returns a list of users."""
-    user_repo_mock.get_all_users.return_value = [
-        User(id=uuid4(), name="Alice", email="alice@example.com"),
-        User(id=uuid4(), name="Bob", email="bob@example.com"),
-    ]
+    user_repo_mock.get_all_users.return_value = UserPage(
+        items=[
+            User(id=uuid4(), name="Alice", email="alice@example.com"),
+            User(id=uuid4(), name="Bob", email="bob@example.com"),
+        ],
+        next_cursor="next",
+    )
+
+    page = await user_use_case.list_users(2, "cursor")
+
+    assert len(page.items) == 2
+    assert page.items[0].name == "Alice"
+    assert page.items[1].name == "Bob"
+    assert page.next_cursor == "next"
+    user_repo_mock.get_all_users.assert_called_once_with(2, "cursor", None, "created_at", None)
+
+
+@pytest.mark.asyncio
+async def test_count_users(user_use_case, user_repo_mock):
+    """Test that count_users() passes filters and the approximate flag through."""
+    filters = UserFilter(is_active=True)
+    user_repo_mock.count_users.return_value = UserCount(total=42, exact=False)
+
+    count = await user_use_case.count_users(filters, approximate=True)
 
-    users = await user_use_case.list_users()
+    assert count == UserCount(total=42, exact=False)
+    user_repo_mock.count_users.assert_called_once_with(filters, True)
 
-    assert len(users) == 2
-    assert users[0].name == "Alice"
-    assert users[1].name == "Bob"
-    user_repo_mock.get_all_users.assert_called_once()
+
+def test_export_users(user_use_case, user_repo_mock):
+    """Test that export_users() hands back the underlying row stream."""
+    user_repo_mock.stream_users = MagicMock(return_value="iterator")
+
+    assert user_use_case.export_users(500) == "iterator"
+    user_repo_mock.stream_users.assert_called_once_with(500)
+
+
+@pytest.mark.asyncio
+async def test_get_user_updated_at(user_use_case, user_repo_mock):
+    """Test that get_user_updated_at() passes the lookup through."""
+    user_id = uuid4()
+    user_repo_mock.get_user_updated_at.return_value = datetime(2025, 1, 1)
+
+    assert await user_use_case.get_user_updated_at(user_id) == datetime(2025, 1, 1)
+    user_repo_mock.get_user_updated_at.assert_called_once_with(user_id)
 
 
 @pytest.mark.asyncio
@@ -52,6 +87,19 @@ async def test_get_user(user_use_case, user_repo_mock):
     user_repo_mock.get_user_by_id.assert_called_once_with(user_id)
 
 
+@pytest.mark.asyncio
+async def test_get_users(user_use_case, user_repo_mock):
+    """Test that get_users() reports the ids it could not find, once each."""
+    user = User(id=uuid4(), name="Alice", email="alice@example.com")
+    missing = uuid4()
+    user_repo_mock.get_users_by_ids.return_value = [user]
+
+    batch = await user_use_case.get_users([user.id, missing, missing])
+
+    assert batch == UserBatch(users=[user], not_found=[missing])
+    user_repo_mock.get_users_by_ids.assert_called_once_with([user.id, missing, missing])
+
+
 @pytest.mark.asyncio
 async def test_register_user(user_use_case, user_repo_mock):
     """Test that register_user() creates and returns a new user."""
@@ -67,6 +115,20 @@ async def test_register_user(user_use_case, user_repo_mock):
     user_repo_mock.create_user.assert_called_once_with(new_user)
 
 
+@pytest.mark.asyncio
+async def test_register_users(user_use_case, user_repo_mock):
+    """Test that register_users() forwards the batch to the repository."""
+    new_users = [CreateUser(name="Dana", email="dana@example.com", password="pass")]
+    user_repo_mock.create_users.return_value = [
+        BulkUserResult(index=0, status="created", user=User(id=uuid4(), name="Dana", email="dana@example.com"))
+    ]
+
+    results = await user_use_case.register_users(new_users)
+
+    assert results[0].status == "created"
+    user_repo_mock.create_users.assert_called_once_with(new_users)
+
+
 @pytest.mark.asyncio
 async def test_delete_user(user_use_case, user_repo_mock):
     """Test that delete_user() successfully removes a user."""
@@ -77,3 +139,16 @@ async def test_delete_user(user_use_case, user_repo_mock):
 
     assert response == {"message": "User deleted"}
     user_repo_mock.delete_user.assert_called_once_with(user_id)
+
+
+@pytest.mark.asyncio
+async def test_delete_users(user_use_case, user_repo_mock):
+    """Test that delete_users() removes users in one call."""
+    user_ids = [uuid4(), uuid4()]
+    user_repo_mock.delete_users.return_value = BulkDeleteResult(deleted=user_ids[:1], not_found=user_ids[1:])
+
+    response = await user_use_case.delete_users(user_ids)
+
+    assert response.deleted == user_ids[:1]
+    assert response.not_found == user_ids[1:]
+    user_repo_mock.delete_users.assert_called_once_with(user_ids)
@@ -0,0 +1,18 @@
+from src.core.config import settings
+
+
+def test_database_uri_from_parts():
+    """Test that the Postgres URI is assembled from the DATABASE_* parts."""
+    config = settings.model_copy(update={"DATABASE_URL": None})
+
+    assert config.DATABASE_URI == (
+        f"postgresql+asyncpg://{config.DATABASE_USER}:{config.DATABASE_PASSWORD}"
+        f"@{config.DATABASE_HOST}:{config.DATABASE_PORT}/{config.DATABASE_NAME}"
+    )
+
+
+def test_database_url_overrides_parts():
+    """Test that DATABASE_URL takes precedence over the individual parts."""
+    config = settings.model_copy(update={"DATABASE_URL": "sqlite+aiosqlite:///./bench.db"})
+
+    assert config.DATABASE_URI == "sqlite+aiosqlite:///./bench.db"
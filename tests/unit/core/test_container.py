@@ -0,0 +1,47 @@
+from src.core.config import settings
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.core.container import Container, bound_session
+from src.infrastructure.cache.backend import InMemoryCacheBackend
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.repositories.batched_user_repository import BatchedUserRepository
+from src.infrastructure.repositories.cached_user_repository import CachedUserRepository
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+
+def test_container_wires_singletons_around_the_session_proxy():
+    """Test that the container builds one graph sharing the session proxy."""
+    container = Container(settings, InMemoryCacheBackend(max_entries=10), SingleFlight())
+
+    assert isinstance(container.user_repository, CachedUserRepository)
+    assert isinstance(container.user_repository.repository, BatchedUserRepository)
+    assert container.user_repository.repository.repository.session is container.session
+    assert container.user_use_case.user_repository is container.user_repository
+    assert container.user_controller.user_use_case is container.user_use_case
+
+
+def test_container_without_cache_uses_raw_repository(monkeypatch):
+    """Test that the repository is not wrapped when caching and batching are disabled."""
+    monkeypatch.setattr(settings, "USER_LOADER_ENABLED", False)
+    container = Container(settings, None, SingleFlight())
+
+    assert isinstance(container.user_repository, UserRepositoryImpl)
+    assert container.user_repository.session is container.session
+
+
+@pytest.mark.asyncio
+async def test_bound_session_binds_for_the_block():
+    """Test that bound_session opens a session, binds it and unbinds on exit."""
+    container = Container(settings, None, SingleFlight())
+    session = MagicMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+
+    async with bound_session(factory) as bound:
+        assert bound is session
+        assert container.session.commit is session.commit
+
+    factory.return_value.__aexit__.assert_awaited_once()
+    with pytest.raises(RuntimeError):
+        container.session.commit
@@ -1,13 +1,20 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import dependencies
 from src.core.dependencies import (
-    get_user_respository,
+    bind_request_session,
+    get_current_principal,
     get_user_use_case,
     get_user_controller,
+    get_streaming_user_controller,
 )
 from src.application.use_cases.user_use_case import UserUseCase
+from src.core.exceptions import AuthError
+from src.infrastructure.security.jwt import create_access_token
+from src.infrastructure.repositories.cached_user_repository import CachedUserRepository
 from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 from src.interfaces.controllers.user_controller import UserController
 
@@ -42,22 +49,67 @@ def mock_user_controller(mock_user_use_case):
     return mock_controller
 
 
-def test_get_user_respository(mock_session):
-    """Test the user repository dependency injection."""
-    repository = get_user_respository(session=mock_session)
-    assert isinstance(repository, UserRepositoryImpl)
-    assert repository.session == mock_session
+def test_container_builds_the_cached_repository():
+    """Test that the dependencies' container wraps the repository with the shared cache."""
+    repository = dependencies.container.user_repository
+    assert isinstance(repository, CachedUserRepository)
+    assert repository.cache is dependencies.user_cache
 
 
-def test_get_user_use_case(mock_user_repository):
-    """Test the user use case dependency injection."""
-    use_case = get_user_use_case(repository=mock_user_repository)
-    assert isinstance(use_case, UserUseCase)
-    assert use_case.user_repository == mock_user_repository
+@pytest.mark.asyncio
+async def test_get_user_use_case(mock_session):
+    """Test that the use case is the container's app singleton."""
+    use_case = await get_user_use_case(session=mock_session)
+    assert use_case is dependencies.container.user_use_case
+    assert use_case is await get_user_use_case(session=mock_session)
 
 
-def test_get_user_controller(mock_user_use_case):
-    """Test the user controller dependency injection."""
-    controller = get_user_controller(use_case=mock_user_use_case)
+@pytest.mark.asyncio
+async def test_get_user_controller(mock_session):
+    """Test that the controller is the container's app singleton."""
+    controller = await get_user_controller(session=mock_session)
     assert isinstance(controller, UserController)
-    assert controller.user_use_case == mock_user_use_case
+    assert controller is dependencies.container.user_controller
+    assert controller.user_use_case is dependencies.container.user_use_case
+
+
+@pytest.mark.asyncio
+async def test_get_streaming_user_controller():
+    """Test that streaming routes get the container controller without a request session."""
+    assert await get_streaming_user_controller() is dependencies.container.user_controller
+
+
+@pytest.mark.asyncio
+async def test_bind_request_session(mock_session):
+    """Test that the request session is visible through the container's proxy."""
+    proxy = dependencies.container.session
+    provider = bind_request_session(session=mock_session)
+
+    assert await anext(provider) is mock_session
+    assert proxy.commit is mock_session.commit
+
+    await provider.aclose()
+    with pytest.raises(RuntimeError):
+        proxy.commit
+
+
+@pytest.mark.asyncio
+async def test_get_current_principal():
+    """Test that a valid bearer token resolves to a Principal."""
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": "user-1"}))
+
+    principal = await get_current_principal(credentials=credentials)
+
+    assert principal.subject == "user-1"
+
+
+@pytest.mark.asyncio
+async def test_get_current_principal_rejects_missing_or_invalid_token():
+    """Test that missing or invalid bearer tokens raise AuthError."""
+    with pytest.raises(AuthError):
+        await get_current_principal(credentials=None)
+
+    with pytest.raises(AuthError):
+        await get_current_principal(
+            credentials=HTTPAuthorizationCredentials(scheme="Bearer", credentials="invalid")
+        )
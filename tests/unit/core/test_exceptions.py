@@ -1,6 +1,6 @@
 import pytest
 from fastapi import HTTPException
-from src.core.exceptions import DuplicatedError, AuthError, NotFoundError, ValidationError
+from src.core.exceptions import DuplicatedError, AuthError, NotFoundError, ServiceUnavailableError, ValidationError
 
 
 def test_duplicated_error():
@@ -37,3 +37,12 @@ def test_validation_error():
     
     assert exc_info.value.status_code == 422
     assert exc_info.value.detail == "Invalid data format"
+
+
+def test_service_unavailable_error():
+    """Test that ServiceUnavailableError raises the correct HTTPException."""
+    with pytest.raises(HTTPException) as exc_info:
+        raise ServiceUnavailableError("Try again later")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.detail == "Try again later"
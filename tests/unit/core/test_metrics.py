@@ -0,0 +1,44 @@
+from src.core.metrics import Registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test that histograms render cumulative buckets, sum and count."""
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ["route"], buckets=(0.1, 1.0))
+
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(5.0, "/a")
+
+    lines = registry.render().splitlines()
+    assert lines[:2] == ["# HELP latency_seconds Latency.", "# TYPE latency_seconds histogram"]
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{route="/a"} 5.15' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+
+
+def test_counter_and_gauge_render():
+    """Test counters, callback gauges and label escaping."""
+    registry = Registry()
+    counter = registry.counter("queries_total", "Queries.", ["operation"])
+    registry.gauge("pool_size", "Pool size.", lambda: 5)
+
+    counter.inc('SEL"ECT')
+    counter.inc('SEL"ECT', amount=2)
+
+    output = registry.render()
+    assert "# TYPE queries_total counter" in output
+    assert 'queries_total{operation="SEL\\"ECT"} 3.0' in output
+    assert "# TYPE pool_size gauge\npool_size 5" in output
+
+
+def test_registering_twice_returns_existing_metric():
+    """Test that re-registering a name keeps the first metric and its series."""
+    registry = Registry()
+    first = registry.counter("hits_total", "Hits.", [])
+    first.inc()
+
+    assert registry.counter("hits_total", "Hits.", []) is first
+    assert "hits_total 1.0" in registry.render()
@@ -0,0 +1,64 @@
+import base64
+import json
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from src.core.exceptions import ValidationError
+from src.core.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    """Test that an encoded cursor decodes back to the same key."""
+    created_at = datetime(2025, 3, 5, 1, 7, 36, 869288)
+    user_id = uuid4()
+
+    cursor = encode_cursor(created_at, user_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, user_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", "WyJ4IiwgInkiXQ"])
+def test_decode_invalid_cursor(cursor):
+    """Test that malformed cursors raise ValidationError."""
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+def raw_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.mark.parametrize("user_id", [1, None, ["id"], {"id": 1}])
+def test_decode_cursor_rejects_non_string_id(user_id):
+    """Test that a well-formed cursor whose id is not a string raises ValidationError."""
+    with pytest.raises(ValidationError):
+        decode_cursor(raw_cursor(["created_at", "2025-03-05T01:07:36", user_id]))
+
+
+@pytest.mark.parametrize(
+    ("sort", "value"),
+    [
+        ("name", {"a": 1}),
+        ("-email", ["alice@example.com"]),
+        ("name", 7),
+        ("created_at", 1741136856),
+        ("-created_at", {"at": "2025-03-05T01:07:36"}),
+        ("created_at", "yesterday"),
+    ],
+)
+def test_decode_cursor_rejects_values_of_the_wrong_type(sort, value):
+    """Test that name/email cursors need a string and created_at cursors a timestamp."""
+    with pytest.raises(ValidationError):
+        decode_cursor(raw_cursor([sort, value, str(uuid4())]), sort=sort)
+
+
+def test_cursor_carries_sort_order():
+    """Test that cursors round-trip string keys and reject a different sort."""
+    user_id = uuid4()
+
+    cursor = encode_cursor("alice@example.com", user_id, sort="-email")
+
+    assert decode_cursor(cursor, sort="-email") == ("alice@example.com", user_id)
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
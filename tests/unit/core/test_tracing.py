@@ -0,0 +1,52 @@
+import pytest
+from src.core.tracing import current_trace, end_trace, span, start_trace, traced
+
+
+@traced("work")
+async def work(value: int) -> int:
+    return value * 2
+
+
+def test_unsampled_requests_carry_no_trace():
+    """Test that a zero sample rate leaves no trace in the context."""
+    trace, token = start_trace(0.0)
+    try:
+        assert trace is None
+        assert current_trace() is None
+        with span("noop"):
+            pass
+    finally:
+        end_trace(token)
+
+
+@pytest.mark.asyncio
+async def test_unsampled_traced_call_passes_through():
+    """Test that traced functions still run when nothing is sampled."""
+    trace, token = start_trace(0.0)
+    try:
+        assert await work(2) == 4
+    finally:
+        end_trace(token)
+
+
+@pytest.mark.asyncio
+async def test_sampled_trace_collects_spans():
+    """Test that spans and traced calls accumulate into Server-Timing."""
+    trace, token = start_trace(1.0)
+    try:
+        assert current_trace() is trace
+        assert await work(1) == 2
+        assert await work(2) == 4
+        with span("block"):
+            pass
+    finally:
+        end_trace(token)
+
+    assert current_trace() is None
+    assert trace.spans["work"][1] == 2
+    header = trace.server_timing()
+    assert 'work;dur=' in header and 'desc="2 calls"' in header
+    assert "block;dur=" in header
+    assert header.split(", ")[-1].startswith("total;dur=")
+
+    trace.finish()
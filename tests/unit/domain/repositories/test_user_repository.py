@@ -1,44 +1,84 @@
 import pytest
+from datetime import datetime
 from uuid import uuid4, UUID
-from typing import Dict, List
-from src.domain.models.user import CreateUser, User
+from typing import AsyncIterator, Dict, List, Optional
+from src.domain.models.user import BulkDeleteResult, BulkUserResult, CreateUser, User, UserCount, UserPage
 from src.domain.repositories.user_repository import UserRepository
 
 
 class TestUserRepository(UserRepository):
     """Concrete class for testing UserRepository abstract methods."""
     
-    async def get_all_users(self) -> List[User]:
-        return [User(id=uuid4(), name="Test User", email="test@example.com")]
+    async def get_all_users(self, limit: int, cursor: Optional[str] = None) -> UserPage:
+        return UserPage(items=[User(id=uuid4(), name="Test User", email="test@example.com")])
+
+    async def count_users(self, filters=None, approximate: bool = False) -> UserCount:
+        return UserCount(total=1, exact=not approximate)
+
+    async def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        yield User(id=uuid4(), name="Streamed User", email="stream@example.com")
 
     async def get_user_by_id(self, user_id: UUID) -> User:
         return User(id=user_id, name="Found User", email="found@example.com")
 
+    async def get_user_updated_at(self, user_id: UUID) -> datetime:
+        return datetime(2025, 1, 1)
+
+    async def get_users_by_ids(self, user_ids: List[UUID]) -> List[User]:
+        return [User(id=user_id, name="Batched User", email="batch@example.com") for user_id in user_ids]
+
     async def create_user(self, user: CreateUser) -> User:
         return User(id=uuid4(), name=user.name, email=user.email)
 
+    async def create_users(self, users: List[CreateUser]) -> List[BulkUserResult]:
+        return [
+            BulkUserResult(index=index, status="created", user=User(id=uuid4(), name=user.name, email=user.email))
+            for index, user in enumerate(users)
+        ]
+
     async def delete_user(self, user_id: UUID) -> Dict[str, str]:
         return {"message": f"User {user_id} deleted"}
 
+    async def delete_users(self, user_ids: List[UUID]) -> BulkDeleteResult:
+        return BulkDeleteResult(deleted=user_ids, not_found=[])
+
 
 @pytest.mark.asyncio
 async def test_user_repository_methods():
     """Test all abstract methods in UserRepository using a concrete implementation."""
     repo = TestUserRepository()
 
-    users = await repo.get_all_users()
-    assert len(users) == 1
-    assert users[0].name == "Test User"
+    page = await repo.get_all_users(10)
+    assert len(page.items) == 1
+    assert page.items[0].name == "Test User"
+
+    count = await repo.count_users(approximate=True)
+    assert (count.total, count.exact) == (1, False)
+
+    streamed = [user async for user in repo.stream_users()]
+    assert streamed[0].name == "Streamed User"
 
     user = await repo.get_user_by_id(uuid4())
     assert user.name == "Found User"
 
+    assert await repo.get_user_updated_at(uuid4()) == datetime(2025, 1, 1)
+
+    batch = await repo.get_users_by_ids([uuid4()])
+    assert batch[0].name == "Batched User"
+
     new_user = await repo.create_user(CreateUser(name="MockUser", email="mock@example.com", password="password"))
     assert new_user.name == "MockUser"
 
+    results = await repo.create_users([CreateUser(name="BulkUser", email="bulk@example.com", password="password")])
+    assert results[0].status == "created"
+
     response = await repo.delete_user(uuid4())
     assert "deleted" in response["message"]
 
+    user_ids = [uuid4(), uuid4()]
+    bulk_response = await repo.delete_users(user_ids)
+    assert bulk_response.deleted == user_ids
+
 
 def test_user_repository_cannot_be_instantiated():
     """Ensure UserRepository cannot be instantiated directly."""
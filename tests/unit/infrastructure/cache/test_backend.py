@@ -0,0 +1,155 @@
+import sys
+import types
+import pytest
+from src.core.config import settings
+from src.infrastructure.cache.backend import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    create_cache_backend,
+)
+
+
+class FakeRedis:
+    """Local stand-in for the subset of the Redis protocol the cache uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, px=None, nx=False):
+        if px is not None and px <= 0:
+            raise ValueError("invalid expire time in 'set' command")
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        self.expiry[key] = px
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+            self.expiry.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_get_set_delete():
+    """Test basic operations on the in-process cache."""
+    cache = InMemoryCacheBackend(max_entries=10)
+
+    await cache.set("a", b"1", ttl=60)
+
+    assert await cache.get("a") == b"1"
+    assert await cache.get("missing") is None
+
+    await cache.delete("a", "missing")
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_expires_entries():
+    """Test that entries older than their TTL are dropped."""
+    cache = InMemoryCacheBackend(max_entries=10)
+
+    await cache.set("a", b"1", ttl=0)
+
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_least_recently_used():
+    """Test that the oldest untouched entry is evicted past max_entries."""
+    cache = InMemoryCacheBackend(max_entries=2)
+
+    await cache.set("a", b"1", ttl=60)
+    await cache.set("b", b"2", ttl=60)
+    await cache.get("a")
+    await cache.set("c", b"3", ttl=60)
+
+    assert await cache.get("a") == b"1"
+    assert await cache.get("b") is None
+    assert await cache.get("c") == b"3"
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_add_only_sets_absent_keys():
+    """Test that add refuses live keys but reuses expired ones."""
+    cache = InMemoryCacheBackend(max_entries=10)
+
+    assert await cache.add("a", b"1", ttl=60)
+    assert not await cache.add("a", b"2", ttl=60)
+    assert await cache.get("a") == b"1"
+
+    await cache.set("b", b"1", ttl=0)
+    assert await cache.add("b", b"2", ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_add_uses_set_nx():
+    client = FakeRedis()
+    cache = RedisCacheBackend(client, prefix="test:")
+
+    assert await cache.add("a", b"1", ttl=2)
+    assert not await cache.add("a", b"2", ttl=2)
+    assert (client.store["test:a"], client.expiry["test:a"]) == (b"1", 2000)
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_uses_prefixed_keys_and_millisecond_ttl():
+    """Test the Redis backend against a local protocol stand-in."""
+    client = FakeRedis()
+    cache = RedisCacheBackend(client, prefix="test:")
+
+    await cache.set("a", b"1", ttl=1.5)
+
+    assert (client.store["test:a"], client.expiry["test:a"]) == (b"1", 1500)
+    assert await cache.get("a") == b"1"
+    assert await cache.get("missing") is None
+
+    await cache.delete()
+    await cache.delete("a")
+    assert "test:a" not in client.store
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_handles_tiny_and_non_positive_ttls():
+    """Test that sub-millisecond ttls still expire and non-positive ones store nothing, as in memory."""
+    client = FakeRedis()
+    cache = RedisCacheBackend(client, prefix="test:")
+
+    await cache.set("tiny", b"1", ttl=0.0004)
+    assert client.expiry["test:tiny"] == 1
+
+    await cache.set("tiny", b"2", ttl=0)
+    assert await cache.get("tiny") is None
+
+    assert await cache.add("gone", b"1", ttl=-1)
+    assert "test:gone" not in client.store
+    await cache.set("live", b"1", ttl=60)
+    assert not await cache.add("live", b"2", ttl=0)
+    assert await cache.get("live") == b"1"
+
+
+def test_create_cache_backend_variants(monkeypatch):
+    """Test that CACHE_BACKEND selects the matching implementation."""
+    assert create_cache_backend(settings.model_copy(update={"CACHE_BACKEND": "none"})) is None
+
+    memory = create_cache_backend(settings.model_copy(update={"CACHE_BACKEND": "memory"}))
+    assert isinstance(memory, InMemoryCacheBackend)
+    assert memory.max_entries == settings.CACHE_MAX_ENTRIES
+    sized = create_cache_backend(settings.model_copy(update={"CACHE_BACKEND": "memory"}), max_entries=3)
+    assert sized.max_entries == 3
+
+    redis_asyncio = types.ModuleType("redis.asyncio")
+    redis_asyncio.Redis = types.SimpleNamespace(from_url=lambda url: FakeRedis())
+    monkeypatch.setitem(sys.modules, "redis", types.ModuleType("redis"))
+    monkeypatch.setitem(sys.modules, "redis.asyncio", redis_asyncio)
+
+    redis = create_cache_backend(settings.model_copy(update={"CACHE_BACKEND": "redis"}))
+    assert isinstance(redis, RedisCacheBackend)
+    assert isinstance(redis.client, FakeRedis)
+    assert redis.prefix == "cache:"
+    redis_config = settings.model_copy(update={"CACHE_BACKEND": "redis"})
+    assert create_cache_backend(redis_config, prefix="other:").prefix == "other:"
@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from src.infrastructure.cache.batch_loader import BatchLoader
+
+
+@pytest.mark.asyncio
+async def test_loads_in_one_tick_share_one_batch():
+    """Test that concurrent loads are coalesced and duplicate keys are sent once."""
+    batches = []
+
+    async def load_many(keys):
+        batches.append(keys)
+        return {key: key * 10 for key in keys if key != 3}
+
+    loader = BatchLoader(load_many)
+
+    results = await asyncio.gather(*(loader.load(key) for key in [1, 2, 2, 3]))
+
+    assert results == [10, 20, 20, None]
+    assert batches == [[1, 2, 3]]
+
+    assert await loader.load(1) == 10
+    assert batches == [[1, 2, 3], [1]]
+
+
+@pytest.mark.asyncio
+async def test_full_batches_dispatch_immediately():
+    """Test that max_batch_size splits a large burst into several batches."""
+    batches = []
+
+    async def load_many(keys):
+        batches.append(keys)
+        return {key: key for key in keys}
+
+    loader = BatchLoader(load_many, max_batch_size=2)
+
+    assert await asyncio.gather(*(loader.load(key) for key in range(5))) == [0, 1, 2, 3, 4]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_with_the_batch():
+    """Test that a failed batch raises for every caller in it."""
+    async def load_many(keys):
+        raise RuntimeError("db down")
+
+    loader = BatchLoader(load_many)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    assert [str(result) for result in results] == ["db down", "db down"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_batch_cancels_its_callers():
+    """Test that callers do not hang when the batch task is cancelled."""
+    started = asyncio.Event()
+
+    async def load_many(keys):
+        started.set()
+        await asyncio.sleep(10)
+
+    loader = BatchLoader(load_many)
+    caller = asyncio.ensure_future(loader.load(1))
+    await started.wait()
+
+    for task in loader._running:
+        task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await caller
@@ -0,0 +1,116 @@
+import sys
+import time
+import types
+import pytest
+from src.core.config import settings
+from src.infrastructure.cache.rate_limit import (
+    TOKEN_BUCKET_SCRIPT,
+    InMemoryRateLimitBackend,
+    RedisRateLimitBackend,
+    create_rate_limit_backend,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """Records script calls; the bucket maths is only exercised on a real
+    Lua interpreter (see test_token_bucket_script_on_fakeredis)."""
+
+    def __init__(self, reply=b"0"):
+        self.reply = reply
+        self.scripts = []
+        self.calls = []
+
+    def register_script(self, script):
+        self.scripts.append(script)
+
+        async def run(keys, args):
+            self.calls.append((keys, args))
+            return self.reply
+
+        return run
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_in_memory_bucket_allows_burst_then_refills(clock):
+    """Test that a bucket spends its burst, reports the wait and refills at the rate."""
+    backend = InMemoryRateLimitBackend(max_keys=10)
+
+    assert [await backend.acquire("a", 1.0, 3) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert await backend.acquire("a", 1.0, 3) == pytest.approx(1.0)
+    assert await backend.acquire("b", 1.0, 3) == 0.0
+
+    clock.now += 0.5
+    assert await backend.acquire("a", 1.0, 3) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert await backend.acquire("a", 1.0, 3) == 0.0
+
+    clock.now += 60
+    assert [await backend.acquire("a", 1.0, 3) for _ in range(4)][-1] > 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_evicts_idle_keys(clock):
+    """Test that the least recently used bucket is dropped past max_keys."""
+    backend = InMemoryRateLimitBackend(max_keys=2)
+
+    for key in ("a", "b", "a", "c"):
+        await backend.acquire(key, 1.0, 1)
+
+    assert list(backend._buckets) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_runs_the_script_on_prefixed_keys():
+    """Test that the backend passes KEYS=[prefix + key], ARGV=[rate, burst] and parses the reply."""
+    client = FakeRedis(reply=b"0.25")
+    backend = RedisRateLimitBackend(client, prefix="test:")
+
+    assert client.scripts == [TOKEN_BUCKET_SCRIPT]
+    assert await backend.acquire("a", 2.0, 3) == 0.25
+    assert client.calls == [(["test:a"], [2.0, 3])]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_script_on_fakeredis():
+    """Test the Lua script itself; skipped unless fakeredis and lupa are installed."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeAsyncRedis()
+    backend = RedisRateLimitBackend(client, prefix="test:")
+
+    assert await backend.acquire("a", 2.0, 1) == 0.0
+    # the server clock moves on between calls, so the wait is just under 0.5s
+    assert await backend.acquire("a", 2.0, 1) == pytest.approx(0.5, abs=0.05)
+    assert 0 < await client.pttl("test:a") <= 500
+    assert await backend.acquire("b", 2.0, 1) == 0.0
+
+
+def test_create_rate_limit_backend_variants(monkeypatch):
+    """Test that RATE_LIMIT_BACKEND selects the matching implementation."""
+    memory = create_rate_limit_backend(settings.model_copy(update={"RATE_LIMIT_MAX_KEYS": 5}))
+    assert isinstance(memory, InMemoryRateLimitBackend)
+    assert memory.max_keys == 5
+
+    redis_asyncio = types.ModuleType("redis.asyncio")
+    redis_asyncio.Redis = types.SimpleNamespace(from_url=lambda url: FakeRedis())
+    monkeypatch.setitem(sys.modules, "redis", types.ModuleType("redis"))
+    monkeypatch.setitem(sys.modules, "redis.asyncio", redis_asyncio)
+
+    redis = create_rate_limit_backend(settings.model_copy(update={"RATE_LIMIT_BACKEND": "redis"}))
+    assert isinstance(redis, RedisRateLimitBackend)
+    assert isinstance(redis.client, FakeRedis)
@@ -0,0 +1,39 @@
+import asyncio
+import pytest
+from src.infrastructure.cache.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_load():
+    """Test that concurrent callers for one key trigger a single load."""
+    loads = SingleFlight()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(loads.do("key", load) for _ in range(5)))
+
+    assert results == [1, 1, 1, 1, 1]
+    assert calls == 1
+
+    assert await loads.do("key", load) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_with_waiters():
+    """Test that a failed load raises for every waiting caller."""
+    loads = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise LookupError("boom")
+
+    results = await asyncio.gather(
+        loads.do("key", load), loads.do("key", load), return_exceptions=True
+    )
+
+    assert all(isinstance(result, LookupError) for result in results)
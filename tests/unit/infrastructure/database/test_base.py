@@ -1,6 +1,8 @@
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.infrastructure.database.base import get_db
+from src.core.config import settings
+from src.infrastructure.database.base import async_session, create_engine_from_settings, engine, get_db, get_session_factory
+from src.infrastructure.database.pool import InstrumentedQueuePool
 
 
 @pytest.mark.asyncio
@@ -12,3 +14,55 @@ async def test_get_db():
     assert isinstance(session, AsyncSession)
 
     await db_generator.aclose()
+
+
+def test_get_session_factory():
+    """Test that streaming routes get the app's session factory."""
+    assert get_session_factory() is async_session
+
+
+def test_create_engine_from_settings_postgres(mocker):
+    """Test that Postgres engines get pool sizing and asyncpg tuning."""
+    create_async_engine = mocker.patch("src.infrastructure.database.base.create_async_engine")
+    config = settings.model_copy(
+        update={"DATABASE_STATEMENT_CACHE_SIZE": 0, "DATABASE_STATEMENT_TIMEOUT_MS": 5000}
+    )
+
+    create_engine_from_settings(config)
+
+    kwargs = create_async_engine.call_args.kwargs
+    assert kwargs["echo"] is False
+    assert kwargs["poolclass"] is InstrumentedQueuePool
+    assert kwargs["pool_size"] == config.DATABASE_POOL_SIZE
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["connect_args"] == {
+        "statement_cache_size": 0,
+        "server_settings": {"statement_timeout": "5000"},
+    }
+
+
+def test_engine_echo_disabled_by_default():
+    """Test that the application engine does not echo SQL by default."""
+    assert engine.echo is False
+    assert isinstance(engine.sync_engine.pool, InstrumentedQueuePool)
+
+
+@pytest.mark.asyncio
+async def test_create_replica_set_from_settings():
+    """Test that replica URLs produce a ReplicaSet with the configured strategy."""
+    from src.infrastructure.database.base import create_replica_set
+
+    assert create_replica_set(settings.model_copy(update={"DATABASE_REPLICA_URLS": []})) is None
+
+    config = settings.model_copy(
+        update={
+            "DATABASE_REPLICA_URLS": ["sqlite+aiosqlite:///./test.db"],
+            "DATABASE_REPLICA_STRATEGY": "least_connections",
+        }
+    )
+    replica_set = create_replica_set(config)
+
+    assert len(replica_set.engines) == 1
+    assert str(replica_set.engines[0].url) == "sqlite+aiosqlite:///./test.db"
+    assert replica_set.strategy == "least_connections"
+    await replica_set.dispose()
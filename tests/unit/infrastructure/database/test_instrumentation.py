@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.core.tracing import end_trace, start_trace
+from src.infrastructure.database.instrumentation import (
+    _before_cursor_execute,
+    instrument_engine,
+    queries_total,
+)
+
+
+@pytest.mark.asyncio
+async def test_instrumented_engine_times_queries_into_the_trace():
+    """Test that cursor events add a db span only for sampled requests."""
+    engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+    instrument_engine(engine)
+    instrument_engine(engine)
+    assert event.contains(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+    trace, token = start_trace(0.0)
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    finally:
+        end_trace(token)
+
+    before = queries_total.values.get(("SELECT",), 0.0)
+    trace, token = start_trace(1.0)
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            await connection.execute(text("  select 2"))
+    finally:
+        end_trace(token)
+
+    assert trace.spans["db"][1] == 2
+    assert queries_total.values[("SELECT",)] == before + 2
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_instrumented_engine_records_connection_hold_time():
+    """Test that pool checkout/checkin feed the hold-time histogram and trace."""
+    from src.infrastructure.database.instrumentation import connection_hold
+
+    engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+    instrument_engine(engine)
+    before = sum(connection_hold.values.get((), [0.0])[:-1])
+
+    trace, token = start_trace(1.0)
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    finally:
+        end_trace(token)
+
+    assert sum(connection_hold.values[()][:-1]) == before + 1
+    assert trace.spans["db_hold"][1] == 1
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+    assert sum(connection_hold.values[()][:-1]) == before + 2
+
+    await engine.dispose()
+
+
+def test_checkin_without_checkout_is_ignored():
+    """Test that connections checked out before instrumenting are skipped."""
+    from types import SimpleNamespace
+    from src.infrastructure.database.instrumentation import _checkin
+
+    _checkin(None, SimpleNamespace(info={}))
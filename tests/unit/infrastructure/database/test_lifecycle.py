@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.infrastructure.database.base import Base
+from src.infrastructure.database.lifecycle import drain_pool, prefill_pool, warm_user_queries
+from src.infrastructure.database.profiler import QueryProfiler
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", pool_size=3)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_prefill_pool_opens_connections_concurrently(engine):
+    """Test that every requested connection is open at once and then returned to the pool."""
+    warmed = []
+
+    async def warm(connection):
+        warmed.append(connection)
+
+    await prefill_pool(engine, 3, warm)
+
+    pool = engine.sync_engine.pool
+    assert len({id(connection) for connection in warmed}) == 3
+    assert pool.checkedin() == 3
+    assert pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_prefill_pool_releases_waiters_on_failure(engine):
+    """Test that one failing connection does not leave the others stuck at the barrier."""
+    calls = 0
+
+    async def warm(connection):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(prefill_pool(engine, 3, warm), timeout=5)
+    assert engine.sync_engine.pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_prefill_pool_without_connections(engine):
+    before = engine.sync_engine.pool.checkedin()
+
+    await prefill_pool(engine, 0)
+
+    assert engine.sync_engine.pool.checkedin() == before
+
+
+@pytest.mark.asyncio
+async def test_warm_user_queries_runs_the_hot_statements(engine):
+    """Test that warm-up runs the list, lookup and batch queries without writing."""
+    profiler = QueryProfiler(slow_threshold_ms=1000, repeat_threshold=10)
+    profiler.attach(engine)
+    try:
+        with profiler.profile() as profile:
+            async with engine.connect() as connection:
+                await warm_user_queries(connection)
+    finally:
+        profiler.detach(engine)
+
+    statements = list(profile.statements.values())
+    assert profile.total == 5
+    assert any("limit" in statement for statement in statements)
+    assert all(statement.startswith("select") for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_drain_pool_waits_for_checked_out_connections(engine):
+    """Test that draining returns once connections are checked back in, or gives up at the timeout."""
+    connection = await engine.connect()
+    assert await drain_pool(engine, 0.01) == 1
+
+    async def release():
+        await asyncio.sleep(0.05)
+        await connection.close()
+
+    releasing = asyncio.create_task(release())
+    assert await drain_pool(engine, 5) == 0
+    await releasing
@@ -0,0 +1,53 @@
+import asyncio
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.infrastructure.database.pool import InstrumentedQueuePool, get_pool_stats
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts_and_waits():
+    """Test that the instrumented pool reports checkouts and that an immediate checkout is not a wait."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///./test.db", poolclass=InstrumentedQueuePool, pool_size=2
+    )
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+        stats = get_pool_stats(engine)
+
+        assert stats.size == 2
+        assert stats.checked_out == 1
+        assert stats.waits == 0
+        assert stats.wait_seconds_total == 0
+
+    stats = get_pool_stats(engine)
+    assert stats.checked_out == 0
+    assert stats.checked_in == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_count_only_blocked_checkouts():
+    """Test that a checkout is counted as a wait only when it blocks on an exhausted pool."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///./test.db", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0
+    )
+
+    async def hold():
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            await asyncio.sleep(0.05)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0.01)
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+    await holder
+
+    stats = get_pool_stats(engine)
+    assert stats.waits == 1
+    assert 0.02 <= stats.wait_seconds_max == stats.wait_seconds_total
+
+    await engine.dispose()
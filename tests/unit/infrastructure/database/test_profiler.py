@@ -0,0 +1,117 @@
+import logging
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.infrastructure.database.profiler import (
+    QueryProfiler,
+    RepeatedQueryError,
+    fingerprint,
+    normalize,
+    parameter_shape,
+)
+from src.interfaces.api.middleware import QueryProfilerMiddleware
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+    yield engine
+    await engine.dispose()
+
+
+def test_normalize_folds_literals_placeholders_and_in_lists():
+    """Test that statements differing only in values share a fingerprint."""
+    first = "SELECT * FROM users /* hint */ WHERE id = $1 AND name = 'a''b' AND n IN ($2, $3)"
+    second = "select *  from users where id = :id_1 and name = 'x' and n in (?, ?, ?, ?)"
+
+    assert normalize(first) == "select * from users where id = ? and name = ? and n in (...)"
+    assert fingerprint(first) == fingerprint(second)
+    assert normalize("SELECT x::uuid -- trailing") == "select x::uuid"
+    assert fingerprint("SELECT 1") != fingerprint("SELECT name FROM users")
+
+
+def test_parameter_shape_never_includes_values():
+    """Test that parameters are logged by type only."""
+    assert parameter_shape({"id": 1, "email": "secret@example.com"}) == "{id: int, email: str}"
+    assert parameter_shape(("secret", 2.5)) == "(str, float)"
+    assert parameter_shape([{"id": 1}, {"id": 2}], executemany=True) == "2 x {id: int}"
+    assert parameter_shape([], executemany=True) == "0 x ()"
+    assert parameter_shape(None) == "NoneType"
+
+
+@pytest.mark.asyncio
+async def test_profile_counts_and_flags_repeated_statements(engine, caplog):
+    """Test per-unit counts, N+1 warnings and strict failures."""
+    profiler = QueryProfiler(slow_threshold_ms=10_000, repeat_threshold=2)
+    profiler.attach(engine)
+    profiler.attach(engine)
+
+    with caplog.at_level(logging.WARNING):
+        with profiler.profile() as profile:
+            async with engine.connect() as connection:
+                for value in range(3):
+                    await connection.execute(text(f"SELECT {value}"))
+    assert profile.total == 3
+    assert list(profile.counts.values()) == [3]
+    assert "likely N+1" in caplog.text
+
+    with pytest.raises(RepeatedQueryError):
+        with profiler.profile(repeat_threshold=1, strict=True):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+                await connection.execute(text("SELECT 2"))
+
+    profiler.detach(engine)
+    profiler.detach(engine)
+    with profiler.profile() as profile:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    assert profile.total == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_with_parameter_shapes(engine, caplog):
+    """Test that statements over the threshold are logged without values."""
+    profiler = QueryProfiler(slow_threshold_ms=0, repeat_threshold=10)
+    profiler.attach(engine)
+
+    with caplog.at_level(logging.WARNING):
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT :value"), {"value": "secret"})
+
+    assert "slow query" in caplog.text
+    assert "params=(str)" in caplog.text
+    assert "secret" not in caplog.text
+    profiler.detach(engine)
+
+
+@pytest.mark.asyncio
+async def test_middleware_reports_query_count(engine):
+    """Test that the middleware profiles each request and sets X-Query-Count."""
+    profiler = QueryProfiler(slow_threshold_ms=10_000, repeat_threshold=10)
+    profiler.attach(engine)
+    app = FastAPI()
+
+    @app.get("/")
+    async def endpoint():
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            await connection.execute(text("SELECT 2"))
+        return "ok"
+
+    app.add_middleware(QueryProfilerMiddleware, profiler=profiler)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/")
+
+    assert response.headers["X-Query-Count"] == "2"
+    profiler.detach(engine)
+
+    calls = []
+
+    async def inner(scope, receive, send):
+        calls.append(scope["type"])
+
+    await QueryProfilerMiddleware(inner, profiler)({"type": "lifespan"}, None, None)
+    assert calls == ["lifespan"]
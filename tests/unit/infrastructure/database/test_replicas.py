@@ -0,0 +1,113 @@
+import pytest
+from uuid import UUID
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.core.exceptions import NotFoundError
+from src.domain.models.user import CreateUser
+from src.infrastructure.database.base import Base, create_session_factory
+from src.infrastructure.database.models.user import User as UserEntity
+from src.infrastructure.database.replicas import ReplicaSet, RoutingSession
+from src.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+
+USER_ID = UUID("8f7c1a5e-0a8c-4a53-9a43-7d1f6f0b8f11")
+
+
+async def make_engine(path, name):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            insert(UserEntity).values(id=USER_ID, name=name, email="shared@example.com", password="x")
+        )
+    return engine
+
+
+@pytest.fixture
+async def engines(tmp_path):
+    primary = await make_engine(tmp_path / "primary.db", "primary")
+    replicas = [await make_engine(tmp_path / f"replica{index}.db", f"replica-{index}") for index in (1, 2)]
+    yield primary, replicas
+    for engine in (primary, *replicas):
+        await engine.dispose()
+
+
+async def read_name(session_factory):
+    async with session_factory() as session:
+        user = await UserRepositoryImpl(session).get_user_by_id(USER_ID)
+        return user.name
+
+
+@pytest.mark.asyncio
+async def test_reads_round_robin_across_replicas(engines):
+    """Test that plain reads rotate across the replicas."""
+    primary, replicas = engines
+    session_factory = create_session_factory(primary, ReplicaSet(replicas))
+
+    names = [await read_name(session_factory) for _ in range(4)]
+
+    assert names == ["replica-1", "replica-2", "replica-1", "replica-2"]
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_stay_on_the_primary(engines):
+    """Test that a session sticks to the primary once it has written."""
+    primary, replicas = engines
+    session_factory = create_session_factory(primary, ReplicaSet(replicas))
+
+    async with session_factory() as session:
+        repository = UserRepositoryImpl(session)
+        assert isinstance(session.sync_session, RoutingSession)
+        assert (await repository.get_user_by_id(USER_ID)).name == "replica-1"
+
+        await repository.create_user(CreateUser(name="New", email="new@example.com", password="pass123"))
+        session.expunge_all()
+
+        assert (await repository.get_user_by_id(USER_ID)).name == "primary"
+        locked = await session.scalar(select(UserEntity.name).where(UserEntity.id == USER_ID).with_for_update())
+        assert locked == "primary"
+
+    async with primary.connect() as connection:
+        assert await connection.scalar(text("SELECT count(*) FROM users")) == 2
+
+
+@pytest.mark.asyncio
+async def test_least_connections_prefers_idle_replica(engines):
+    """Test that least-connections skips a replica with checked-out connections."""
+    primary, replicas = engines
+    replica_set = ReplicaSet(replicas, strategy="least_connections")
+
+    async with replicas[0].connect():
+        assert replica_set.choose() is replicas[1]
+    async with replicas[1].connect():
+        assert replica_set.choose() is replicas[0]
+
+
+@pytest.mark.asyncio
+async def test_failed_replica_is_taken_out_of_rotation(engines, tmp_path):
+    """Test passive and active health checks with a broken replica."""
+    primary, replicas = engines
+    broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/missing/replica.db")
+    replica_set = ReplicaSet([broken, replicas[0]], retry_after=60)
+    session_factory = create_session_factory(primary, replica_set)
+
+    with pytest.raises(NotFoundError):
+        await read_name(session_factory)
+
+    assert [replica_set.choose() for _ in range(2)] == [replicas[0], replicas[0]]
+    assert await read_name(session_factory) == "replica-1"
+
+    health = await replica_set.check_health()
+    assert list(health.values()) == [False, True]
+
+    replica_set.retry_after = 0
+    replica_set.mark_down(replicas[0].sync_engine)
+    replica_set.mark_down(broken.sync_engine)
+    assert replica_set.choose() in (broken, replicas[0])
+
+    replica_set.retry_after = 60
+    replica_set.mark_down(replicas[0].sync_engine)
+    replica_set.mark_down(broken.sync_engine)
+    assert replica_set.choose() is None
+    assert await read_name(session_factory) == "primary"
+
+    await replica_set.dispose()
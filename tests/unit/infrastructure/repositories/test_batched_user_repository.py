@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
+from uuid import uuid4
+from src.core.exceptions import NotFoundError
+from src.domain.models.user import CreateUser, User, UserCount, UserPage
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.repositories import batched_user_repository
+from src.infrastructure.repositories.batched_user_repository import BatchedUserRepository
+
+
+@pytest.fixture
+def inner_repo():
+    """Mock the wrapped UserRepository."""
+    return AsyncMock(spec=UserRepository)
+
+
+@pytest.fixture
+def batch_repo(monkeypatch):
+    """Mock the repository each batch builds on its own session."""
+    repository = AsyncMock(spec=UserRepository)
+    monkeypatch.setattr(batched_user_repository, "UserRepositoryImpl", MagicMock(return_value=repository))
+    return repository
+
+
+@pytest.fixture
+def sessions():
+    """Mock the session factory batches draw from."""
+    return MagicMock()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_query(inner_repo, batch_repo, sessions):
+    """Test that concurrent get_user_by_id calls become one get_users_by_ids on a session of their own."""
+    users = [User(id=uuid4(), name=f"User{index}", email=f"user{index}@example.com") for index in range(3)]
+    batch_repo.get_users_by_ids.return_value = users
+
+    repository = BatchedUserRepository(inner_repo, sessions)
+
+    found = await asyncio.gather(*(repository.get_user_by_id(user.id) for user in users))
+
+    assert found == users
+    sessions.assert_called_once_with()
+    batched_user_repository.UserRepositoryImpl.assert_called_once_with(sessions.return_value.__aenter__.return_value)
+    sessions.return_value.__aexit__.assert_awaited_once()
+    batch_repo.get_users_by_ids.assert_awaited_once_with([user.id for user in users])
+    inner_repo.get_user_by_id.assert_not_called()
+    inner_repo.get_users_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_missing_users_raise_not_found(inner_repo, batch_repo, sessions):
+    """Test that ids absent from the batch raise NotFoundError."""
+    batch_repo.get_users_by_ids.return_value = []
+
+    with pytest.raises(NotFoundError):
+        await BatchedUserRepository(inner_repo, sessions).get_user_by_id(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_lookup_after_write_reads_through(inner_repo, batch_repo, sessions):
+    """Test that a request whose session has written skips the batch and reads on its own session."""
+    user = User(id=uuid4(), name="Written", email="written@example.com")
+    inner_repo.get_user_by_id.return_value = user
+    session = MagicMock()
+    session.sync_session.wrote = True
+
+    repository = BatchedUserRepository(inner_repo, sessions, session=session)
+
+    assert await repository.get_user_by_id(user.id) == user
+    inner_repo.get_user_by_id.assert_awaited_once_with(user.id)
+    sessions.assert_not_called()
+    batch_repo.get_users_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("wrote", [False, RuntimeError("no session")])
+async def test_lookup_without_write_is_batched(inner_repo, batch_repo, sessions, wrote):
+    """Test that a clean or unbound request session still goes through the batch."""
+    user = User(id=uuid4(), name="Clean", email="clean@example.com")
+    batch_repo.get_users_by_ids.return_value = [user]
+    session = MagicMock()
+    if isinstance(wrote, Exception):
+        type(session).sync_session = PropertyMock(side_effect=wrote)
+    else:
+        session.sync_session.wrote = wrote
+
+    repository = BatchedUserRepository(inner_repo, sessions, session=session)
+
+    assert await repository.get_user_by_id(user.id) == user
+    inner_repo.get_user_by_id.assert_not_called()
+    batch_repo.get_users_by_ids.assert_awaited_once_with([user.id])
+
+
+@pytest.mark.asyncio
+async def test_other_calls_are_delegated(inner_repo, sessions):
+    """Test that every other repository call goes straight to the wrapped one."""
+    repository = BatchedUserRepository(inner_repo, sessions)
+    user_ids = [uuid4()]
+    inner_repo.get_all_users.return_value = UserPage(items=[])
+    inner_repo.count_users.return_value = UserCount(total=0)
+    inner_repo.stream_users = MagicMock(return_value="iterator")
+
+    assert await repository.get_all_users(10) == UserPage(items=[])
+    assert await repository.count_users(None, True) == UserCount(total=0)
+    assert repository.stream_users(5) == "iterator"
+    await repository.get_users_by_ids(user_ids)
+    await repository.get_user_updated_at(user_ids[0])
+    await repository.create_user(CreateUser(name="New", email="new@example.com", password="pass"))
+    await repository.create_users([])
+    await repository.delete_user(user_ids[0])
+    await repository.delete_users(user_ids)
+
+    inner_repo.get_all_users.assert_awaited_once_with(10, None, None, "created_at", None)
+    inner_repo.count_users.assert_awaited_once_with(None, True)
+    inner_repo.get_users_by_ids.assert_awaited_once_with(user_ids)
+    inner_repo.get_user_updated_at.assert_awaited_once_with(user_ids[0])
+    inner_repo.create_user.assert_awaited_once()
+    inner_repo.create_users.assert_awaited_once_with([])
+    inner_repo.delete_user.assert_awaited_once_with(user_ids[0])
+    inner_repo.delete_users.assert_awaited_once_with(user_ids)
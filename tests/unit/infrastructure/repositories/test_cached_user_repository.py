@@ -0,0 +1,219 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from src.core.exceptions import NotFoundError
+from src.domain.models.user import BulkDeleteResult, BulkUserResult, CreateUser, User, UserCount, UserFilter, UserPage
+from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.backend import InMemoryCacheBackend
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.repositories.cached_user_repository import CachedUserRepository
+
+
+@pytest.fixture
+def inner_repo():
+    """Mock the wrapped UserRepository."""
+    return AsyncMock(spec=UserRepository)
+
+
+@pytest.fixture
+def cached_repo(inner_repo):
+    """Wrap the mocked repository with an in-memory cache."""
+    return CachedUserRepository(
+        inner_repo, InMemoryCacheBackend(100), SingleFlight(), ttl=60, negative_ttl=60
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_reads_through_cache(cached_repo, inner_repo):
+    """Test that repeated lookups are served from the cache."""
+    user = User(id=uuid4(), name="Alice", email="alice@example.com")
+    inner_repo.get_user_by_id.return_value = user
+
+    first = await cached_repo.get_user_by_id(user.id)
+    second = await cached_repo.get_user_by_id(user.id)
+
+    assert first == user
+    assert second == user
+    inner_repo.get_user_by_id.assert_called_once_with(user.id)
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_caches_not_found(cached_repo, inner_repo):
+    """Test that misses are negatively cached."""
+    user_id = uuid4()
+    inner_repo.get_user_by_id.side_effect = NotFoundError("missing")
+
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_by_id(user_id)
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_by_id(user_id)
+
+    inner_repo.get_user_by_id.assert_called_once_with(user_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_trigger_single_query(cached_repo, inner_repo):
+    """Test stampede protection for concurrent misses on one key."""
+    user = User(id=uuid4(), name="Bob", email="bob@example.com")
+
+    async def slow_get(user_id):
+        await asyncio.sleep(0.01)
+        return user
+
+    inner_repo.get_user_by_id.side_effect = slow_get
+
+    results = await asyncio.gather(*(cached_repo.get_user_by_id(user.id) for _ in range(10)))
+
+    assert all(result == user for result in results)
+    inner_repo.get_user_by_id.assert_called_once_with(user.id)
+
+
+@pytest.mark.asyncio
+async def test_create_user_invalidates_negative_entry(cached_repo, inner_repo):
+    """Test that creating a user evicts a cached 404 for its ID."""
+    user = User(id=uuid4(), name="Carol", email="carol@example.com")
+    inner_repo.get_user_by_id.side_effect = NotFoundError("missing")
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_by_id(user.id)
+
+    inner_repo.create_user.return_value = user
+    created = await cached_repo.create_user(CreateUser(name="Carol", email="carol@example.com", password="pass"))
+
+    inner_repo.get_user_by_id.side_effect = None
+    inner_repo.get_user_by_id.return_value = user
+
+    assert created == user
+    assert await cached_repo.get_user_by_id(user.id) == user
+
+
+@pytest.mark.asyncio
+async def test_create_users_invalidates_created_entries(cached_repo, inner_repo):
+    """Test that bulk creation evicts cached 404s for the new IDs."""
+    user = User(id=uuid4(), name="Cleo", email="cleo@example.com")
+    inner_repo.get_user_by_id.side_effect = NotFoundError("missing")
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_by_id(user.id)
+
+    inner_repo.create_users.return_value = [
+        BulkUserResult(index=0, status="created", user=user),
+        BulkUserResult(index=1, status="duplicate"),
+    ]
+    results = await cached_repo.create_users([])
+
+    inner_repo.get_user_by_id.side_effect = None
+    inner_repo.get_user_by_id.return_value = user
+
+    assert len(results) == 2
+    assert await cached_repo.get_user_by_id(user.id) == user
+
+
+@pytest.mark.asyncio
+async def test_delete_user_invalidates_entry(cached_repo, inner_repo):
+    """Test that deleting a user evicts its cached entry."""
+    user = User(id=uuid4(), name="Dan", email="dan@example.com")
+    inner_repo.get_user_by_id.return_value = user
+    await cached_repo.get_user_by_id(user.id)
+
+    inner_repo.delete_user.return_value = {"message": "User deleted"}
+    assert await cached_repo.delete_user(user.id) == {"message": "User deleted"}
+
+    inner_repo.get_user_by_id.side_effect = NotFoundError("missing")
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_by_id(user.id)
+
+
+@pytest.mark.asyncio
+async def test_delete_users_invalidates_entries(cached_repo, inner_repo):
+    """Test that bulk deletion evicts every requested ID."""
+    user = User(id=uuid4(), name="Eli", email="eli@example.com")
+    inner_repo.get_user_by_id.return_value = user
+    await cached_repo.get_user_by_id(user.id)
+
+    inner_repo.delete_users.return_value = BulkDeleteResult(deleted=[user.id], not_found=[])
+    assert (await cached_repo.delete_users([user.id])).deleted == [user.id]
+
+    inner_repo.get_user_by_id.side_effect = NotFoundError("missing")
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_by_id(user.id)
+
+
+@pytest.mark.asyncio
+async def test_list_and_stream_are_delegated(cached_repo, inner_repo):
+    """Test that list and stream calls bypass the cache."""
+    page = UserPage(items=[])
+    inner_repo.get_all_users.return_value = page
+    inner_repo.stream_users = MagicMock(return_value="iterator")
+
+    assert await cached_repo.get_all_users(10, "cursor") == page
+    assert cached_repo.stream_users(5) == "iterator"
+    inner_repo.get_all_users.assert_called_once_with(10, "cursor", None, "created_at", None)
+    inner_repo.stream_users.assert_called_once_with(5)
+
+
+@pytest.mark.asyncio
+async def test_approximate_counts_are_cached_per_filter(inner_repo):
+    """Test that estimates are cached for count_ttl while exact counts are not."""
+    cached_repo = CachedUserRepository(
+        inner_repo, InMemoryCacheBackend(100), SingleFlight(), ttl=60, negative_ttl=60, count_ttl=10
+    )
+    inner_repo.count_users.return_value = UserCount(total=50_000, exact=False)
+
+    first = await cached_repo.count_users(None, approximate=True)
+    second = await cached_repo.count_users(UserFilter(), approximate=True)
+    await cached_repo.count_users(UserFilter(is_active=True), approximate=True)
+    await cached_repo.count_users(None)
+
+    assert first == second == UserCount(total=50_000, exact=False)
+    assert inner_repo.count_users.await_count == 3
+    inner_repo.count_users.assert_awaited_with(None, False)
+
+
+@pytest.mark.asyncio
+async def test_counts_bypass_cache_without_count_ttl(cached_repo, inner_repo):
+    """Test that approximate counts are not cached when count_ttl is unset."""
+    inner_repo.count_users.return_value = UserCount(total=3)
+
+    await cached_repo.count_users(None, approximate=True)
+    await cached_repo.count_users(None, approximate=True)
+
+    assert inner_repo.count_users.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids_reads_through_cache(cached_repo, inner_repo):
+    """Test that batch lookups only query the ids missing from the cache."""
+    cached, loaded = (User(id=uuid4(), name=name, email=f"{name}@example.com") for name in ("hit", "miss"))
+    missing = uuid4()
+    inner_repo.get_user_by_id.return_value = cached
+    await cached_repo.get_user_by_id(cached.id)
+    inner_repo.get_users_by_ids.return_value = [loaded]
+
+    first = await cached_repo.get_users_by_ids([missing, loaded.id, cached.id, loaded.id])
+    second = await cached_repo.get_users_by_ids([cached.id, missing, loaded.id])
+
+    assert first == [loaded, cached]
+    assert second == [cached, loaded]
+    inner_repo.get_users_by_ids.assert_awaited_once_with([missing, loaded.id])
+
+
+@pytest.mark.asyncio
+async def test_get_user_updated_at_prefers_the_cached_body(cached_repo, inner_repo):
+    """Test that revalidation uses the cached row's timestamp and falls back to the repository."""
+    user = User(id=uuid4(), name="Fay", email="fay@example.com")
+    missing = uuid4()
+    inner_repo.get_user_updated_at.return_value = user.updated_at
+
+    assert await cached_repo.get_user_updated_at(user.id) == user.updated_at
+    inner_repo.get_user_updated_at.assert_awaited_once_with(user.id)
+
+    inner_repo.get_user_by_id.return_value = user
+    await cached_repo.get_user_by_id(user.id)
+    assert await cached_repo.get_user_updated_at(user.id) == user.updated_at
+    assert inner_repo.get_user_updated_at.await_count == 1
+
+    inner_repo.get_user_by_id.side_effect = NotFoundError("missing")
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_by_id(missing)
+    with pytest.raises(NotFoundError):
+        await cached_repo.get_user_updated_at(missing)
@@ -5,6 +5,7 @@ from src.infrastructure.repositories.user_repository_impl import UserRepositoryI
 from src.domain.models.user import CreateUser
 from src.core.exceptions import DuplicatedError, NotFoundError, ValidationError
 from sqlalchemy.exc import SQLAlchemyError
+from src.core.pagination import encode_cursor
 
 @pytest.mark.asyncio
 async def test_create_user_success(db_session: AsyncSession):
@@ -67,11 +68,306 @@ async def test_get_all_users(db_session: AsyncSession):
     await user_repo.create_user(CreateUser(name="John", email="john@example.com", password="pass1"))
     await user_repo.create_user(CreateUser(name="Doe", email="doe@example.com", password="pass2"))
 
-    users = await user_repo.get_all_users()
+    page = await user_repo.get_all_users(limit=10)
 
-    assert len(users) >= 2
-    assert any(user.email == "john@example.com" for user in users)
-    assert any(user.email == "doe@example.com" for user in users)
+    assert len(page.items) >= 2
+    assert page.next_cursor is None
+    assert any(user.email == "john@example.com" for user in page.items)
+    assert any(user.email == "doe@example.com" for user in page.items)
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_paginates_with_cursor(db_session: AsyncSession):
+    """Test walking the user list page by page with keyset cursors."""
+    user_repo = UserRepositoryImpl(db_session)
+
+    for index in range(5):
+        await user_repo.create_user(CreateUser(name=f"User{index}", email=f"user{index}@example.com", password="pass"))
+
+    first_page = await user_repo.get_all_users(limit=2)
+    assert len(first_page.items) == 2
+    assert first_page.next_cursor is not None
+
+    second_page = await user_repo.get_all_users(limit=2, cursor=first_page.next_cursor)
+    third_page = await user_repo.get_all_users(limit=2, cursor=second_page.next_cursor)
+
+    assert len(second_page.items) == 2
+    assert len(third_page.items) == 1
+    assert third_page.next_cursor is None
+
+    seen = [user.id for page in (first_page, second_page, third_page) for user in page.items]
+    assert len(set(seen)) == 5
+
+
+async def seed_users(db_session: AsyncSession):
+    from datetime import datetime
+    from src.infrastructure.database.models.user import User as UserEntity
+
+    rows = [
+        UserEntity(name="Carol", email="carol@Acme.io", password="x", is_active=True, is_superuser=True, created_at=datetime(2025, 1, 1)),
+        UserEntity(name="alice", email="alice@acme.io", password="x", is_active=False, is_superuser=False, created_at=datetime(2025, 2, 1)),
+        UserEntity(name="Bob", email="bob@example.com", password="x", is_active=True, is_superuser=False, created_at=datetime(2025, 3, 1)),
+        UserEntity(name="Dave", email="dave@acme_io.com", password="x", is_active=True, is_superuser=False, created_at=datetime(2025, 4, 1)),
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        ({"is_active": True}, ["Carol", "Bob", "Dave"]),
+        ({"is_active": False}, ["alice"]),
+        ({"is_superuser": True}, ["Carol"]),
+        ({"email_domain": "ACME.io"}, ["Carol", "alice"]),
+        ({"email_domain": "acme_io.com"}, ["Dave"]),
+        ({"created_after": "2025-02-01", "created_before": "2025-04-01"}, ["alice", "Bob"]),
+        ({"is_active": True, "created_after": "2025-02-01"}, ["Bob", "Dave"]),
+        ({"created_after": "2025-01-31T21:00:00-03:00", "created_before": "2025-04-01T00:00:00Z"}, ["alice", "Bob"]),
+    ],
+)
+async def test_get_all_users_filters(db_session: AsyncSession, filters, expected):
+    """Test that list filters are pushed down into the query."""
+    from src.domain.models.user import UserFilter
+
+    await seed_users(db_session)
+
+    user_filter = UserFilter(**filters)
+    assert user_filter.created_after is None or user_filter.created_after.tzinfo is None
+
+    page = await UserRepositoryImpl(db_session).get_all_users(limit=10, filters=user_filter)
+
+    assert [user.name for user in page.items] == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sort, expected",
+    [
+        ("name", ["Bob", "Carol", "Dave", "alice"]),
+        ("-name", ["alice", "Dave", "Carol", "Bob"]),
+        ("-created_at", ["Dave", "Bob", "alice", "Carol"]),
+        ("email", ["alice", "bob", "carol", "dave"]),
+    ],
+)
+async def test_get_all_users_sorted_pages(db_session: AsyncSession, sort, expected):
+    """Test keyset pagination over every sort order."""
+    await seed_users(db_session)
+    user_repo = UserRepositoryImpl(db_session)
+
+    names, cursor = [], None
+    while True:
+        page = await user_repo.get_all_users(limit=3, cursor=cursor, sort=sort)
+        names.extend(user.name if sort != "email" else user.email.split("@")[0] for user in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert names == expected
+
+    with pytest.raises(ValidationError):
+        await user_repo.get_all_users(limit=3, cursor=page.next_cursor or encode_cursor("x", uuid4(), "name"), sort="created_at")
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_fetches_only_requested_fields(db_session: AsyncSession):
+    """Test that a projection selects the requested columns plus the cursor key."""
+    await seed_users(db_session)
+    statements = []
+
+    from sqlalchemy import event
+    from tests.conftest import test_engine
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        page = await UserRepositoryImpl(db_session).get_all_users(limit=2, sort="name", fields=["email"])
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+    select_list = statements[0].split("FROM")[0]
+    assert "users.email" in select_list and "users.id" in select_list and "users.name" in select_list
+    assert "users.created_at" not in select_list and "password" not in select_list
+    assert page.items[0].model_dump(include={"email"}) == {"email": "bob@example.com"}
+
+
+def test_email_domain_filter_uses_expression_on_postgres(mocker):
+    """Test that Postgres gets the split_part expression matching its index."""
+    from sqlalchemy.dialects import postgresql
+    from src.domain.models.user import UserFilter
+
+    session = mocker.MagicMock()
+    session.bind.dialect.name = "postgresql"
+    user_repo = UserRepositoryImpl(session)
+
+    (condition,) = user_repo._UserRepositoryImpl__conditions(UserFilter(email_domain="Acme.io"))
+
+    assert str(condition.compile(dialect=postgresql.dialect())).startswith(
+        "lower(split_part(users.email, '@', 2)) = "
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("approximate", [False, True])
+async def test_count_users_is_exact_on_sqlite(db_session: AsyncSession, approximate):
+    """Test filtered counts; SQLite has no planner estimates so counts stay exact."""
+    from src.domain.models.user import UserFilter
+
+    await seed_users(db_session)
+    user_repo = UserRepositoryImpl(db_session)
+
+    total = await user_repo.count_users(approximate=approximate)
+    active = await user_repo.count_users(UserFilter(is_active=True, email_domain="acme.io"), approximate)
+
+    assert (total.total, total.exact) == (4, True)
+    assert (active.total, active.exact) == (1, True)
+
+
+def postgres_session(mocker, *scalars):
+    from sqlalchemy.dialects import postgresql
+
+    session = mocker.MagicMock()
+    session.bind.dialect = postgresql.asyncpg.dialect()
+    session.scalar = mocker.AsyncMock(side_effect=list(scalars))
+    session.commit = mocker.AsyncMock()
+    return session
+
+
+@pytest.mark.asyncio
+async def test_count_users_estimates_from_pg_class(mocker):
+    """Test that an unfiltered approximate count reads reltuples."""
+    session = postgres_session(mocker, 2_500_000)
+
+    count = await UserRepositoryImpl(session).count_users(approximate=True)
+
+    assert (count.total, count.exact) == (2_500_000, False)
+    (statement, parameters), _ = session.scalar.call_args
+    assert "pg_class" in str(statement)
+    assert parameters == {"table": "users"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("domain", ["acme.io", "x :evil"])
+async def test_count_users_estimates_filtered_counts_with_explain(mocker, domain):
+    """Test that filtered approximate counts use the planner's row estimate, sending literals verbatim."""
+    from src.domain.models.user import UserFilter
+
+    session = postgres_session(mocker)
+    result = mocker.MagicMock()
+    result.scalar.return_value = '[{"Plan": {"Plan Rows": 48000}}]'
+    connection = mocker.MagicMock()
+    connection.exec_driver_sql = mocker.AsyncMock(return_value=result)
+    session.connection = mocker.AsyncMock(return_value=connection)
+
+    count = await UserRepositoryImpl(session).count_users(UserFilter(email_domain=domain), approximate=True)
+
+    assert (count.total, count.exact) == (48000, False)
+    explain = connection.exec_driver_sql.call_args.args[0]
+    assert explain.startswith("EXPLAIN (FORMAT JSON) SELECT users.id")
+    assert f"split_part(users.email, '@', 2)) = '{domain}'" in explain
+    session.scalar.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("estimate", [-1, 12, None])
+async def test_count_users_falls_back_to_exact_count(mocker, estimate):
+    """Test that unanalyzed tables and small estimates are counted exactly."""
+    session = postgres_session(mocker, estimate, 12)
+
+    count = await UserRepositoryImpl(session).count_users(approximate=True)
+
+    assert (count.total, count.exact) == (12, True)
+    assert "count(*)" in str(session.scalar.call_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_get_user_updated_at(db_session: AsyncSession, query_budget):
+    """Test that the revalidation lookup reads a single column."""
+    user_repo = UserRepositoryImpl(db_session)
+    user = await user_repo.create_user(CreateUser(name="Fresh", email="fresh@example.com", password="pass"))
+
+    with query_budget(1) as profile:
+        updated_at = await user_repo.get_user_updated_at(user.id)
+
+    assert updated_at == user.updated_at
+    assert next(iter(profile.statements.values())).startswith("select users.updated_at from users")
+
+    with pytest.raises(NotFoundError):
+        await user_repo.get_user_updated_at(uuid4())
+
+
+@pytest.mark.asyncio
+async def test_get_users_by_ids(db_session: AsyncSession, query_budget):
+    """Test that one query returns the found users in request order."""
+    user_repo = UserRepositoryImpl(db_session)
+    first = await user_repo.create_user(CreateUser(name="First", email="first@example.com", password="pass"))
+    second = await user_repo.create_user(CreateUser(name="Second", email="second@example.com", password="pass"))
+
+    with query_budget(1):
+        users = await user_repo.get_users_by_ids([second.id, uuid4(), first.id, second.id])
+
+    assert [user.name for user in users] == ["Second", "First"]
+    assert await user_repo.get_users_by_ids([]) == []
+
+
+def test_get_users_by_ids_binds_one_array_on_postgres(mocker):
+    """Test that Postgres gets ``id = ANY(:user_ids)`` instead of an expanding IN."""
+    from sqlalchemy.dialects import postgresql
+
+    session = mocker.MagicMock()
+    session.bind.dialect.name = "postgresql"
+    user_repo = UserRepositoryImpl(session)
+
+    condition = user_repo._UserRepositoryImpl__id_in([uuid4(), uuid4()])
+
+    assert str(condition.compile(dialect=postgresql.dialect())) == "users.id = ANY (%(user_ids)s::UUID[])"
+
+
+@pytest.mark.asyncio
+async def test_existing_emails_binds_one_array_on_postgres(mocker):
+    """Test that the bulk duplicate check sends ``email = ANY(:emails)`` to Postgres."""
+    from sqlalchemy.dialects import postgresql
+
+    session = mocker.MagicMock()
+    session.bind.dialect.name = "postgresql"
+    result = mocker.MagicMock()
+    result.scalars.return_value.all.return_value = ["a@example.com"]
+    session.execute = mocker.AsyncMock(return_value=result)
+
+    seen = await UserRepositoryImpl(session)._UserRepositoryImpl__existing_emails(["a@example.com", "b@example.com"])
+
+    assert seen == {"a@example.com"}
+    statement = session.execute.call_args.args[0]
+    assert str(statement.compile(dialect=postgresql.dialect())).endswith("WHERE users.email = ANY (%(emails)s::VARCHAR[])")
+
+
+@pytest.mark.asyncio
+async def test_get_all_users_invalid_cursor(db_session: AsyncSession):
+    """Test that a malformed cursor raises ValidationError."""
+    user_repo = UserRepositoryImpl(db_session)
+
+    with pytest.raises(ValidationError):
+        await user_repo.get_all_users(limit=10, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_stream_users(db_session: AsyncSession):
+    """Test iterating over every user through a server-side cursor."""
+    user_repo = UserRepositoryImpl(db_session)
+
+    for index in range(3):
+        await user_repo.create_user(CreateUser(name=f"Stream{index}", email=f"stream{index}@example.com", password="pass"))
+
+    users = [user async for user in user_repo.stream_users(batch_size=2)]
+
+    assert sorted(user.email for user in users) == [
+        "stream0@example.com",
+        "stream1@example.com",
+        "stream2@example.com",
+    ]
 
 
 @pytest.mark.asyncio
@@ -98,6 +394,46 @@ async def test_delete_user_not_found(db_session: AsyncSession):
         await user_repo.delete_user(uuid4())
 
 
+@pytest.mark.asyncio
+async def test_delete_users(db_session: AsyncSession):
+    """Test deleting several users with one statement."""
+    user_repo = UserRepositoryImpl(db_session)
+
+    first = await user_repo.create_user(CreateUser(name="Ann", email="ann@example.com", password="pass"))
+    second = await user_repo.create_user(CreateUser(name="Ben", email="ben@example.com", password="pass"))
+    missing = uuid4()
+
+    response = await user_repo.delete_users([first.id, missing, second.id, first.id])
+
+    assert response.deleted == [first.id, second.id]
+    assert response.not_found == [missing]
+
+    with pytest.raises(NotFoundError):
+        await user_repo.get_user_by_id(first.id)
+
+
+@pytest.mark.asyncio
+async def test_delete_users_db_error(db_session: AsyncSession, mocker):
+    """Test that a database error during bulk deletion raises ValidationError."""
+    user_repo = UserRepositoryImpl(db_session)
+
+    mocker.patch.object(db_session, "commit", side_effect=SQLAlchemyError("DB error"))
+
+    with pytest.raises(ValidationError):
+        await user_repo.delete_users([uuid4()])
+
+
+def test_insert_uses_postgres_dialect(mocker):
+    """Test that non-SQLite sessions build a PostgreSQL ON CONFLICT insert."""
+    session = mocker.MagicMock()
+    session.bind.dialect.name = "postgresql"
+    user_repo = UserRepositoryImpl(session)
+
+    statement = user_repo._UserRepositoryImpl__insert().on_conflict_do_nothing(index_elements=["email"])
+
+    assert type(statement).__module__.startswith("sqlalchemy.dialects.postgresql")
+
+
 @pytest.mark.asyncio
 async def test_create_user_db_error(db_session: AsyncSession, mocker):
     """Test that a database error during user creation raises ValidationError."""
@@ -124,3 +460,107 @@ async def test_delete_user_db_error(db_session: AsyncSession, mocker):
 
     with pytest.raises(ValidationError):
         await user_repo.delete_user(user.id)
+
+
+@pytest.mark.asyncio
+async def test_create_users(db_session: AsyncSession):
+    """Test bulk creation reports created and duplicate rows in order."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_user(CreateUser(name="Existing", email="existing@example.com", password="pass"))
+
+    results = await user_repo.create_users([
+        CreateUser(name="New", email="new@example.com", password="pass"),
+        CreateUser(name="Existing", email="existing@example.com", password="pass"),
+        CreateUser(name="Other", email="other@example.com", password="pass"),
+        CreateUser(name="Repeat", email="new@example.com", password="pass"),
+    ])
+
+    assert [result.status for result in results] == ["created", "duplicate", "created", "duplicate"]
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert results[0].user.email == "new@example.com"
+    assert results[2].user.email == "other@example.com"
+    assert results[2].user.created_at is not None
+
+    stored = await user_repo.get_user_by_id(results[2].user.id)
+    assert stored.name == "Other"
+
+
+@pytest.mark.asyncio
+async def test_create_users_all_duplicates(db_session: AsyncSession):
+    """Test that a batch with nothing to insert skips the INSERT."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_user(CreateUser(name="Only", email="only@example.com", password="pass"))
+
+    results = await user_repo.create_users([CreateUser(name="Only", email="only@example.com", password="pass")])
+
+    assert [result.status for result in results] == ["duplicate"]
+
+
+@pytest.mark.asyncio
+async def test_create_users_db_error(db_session: AsyncSession, mocker):
+    """Test that a database error during bulk creation raises ValidationError."""
+    user_repo = UserRepositoryImpl(db_session)
+
+    mocker.patch.object(db_session, "commit", side_effect=SQLAlchemyError("DB error"))
+
+    with pytest.raises(ValidationError):
+        await user_repo.create_users([CreateUser(name="Fail", email="fail@example.com", password="pass")])
+
+
+@pytest.mark.asyncio
+async def test_create_users_concurrent_insert_reported_as_duplicate(db_session: AsyncSession, mocker):
+    """Test that rows skipped by ON CONFLICT come back as duplicates."""
+    user_repo = UserRepositoryImpl(db_session)
+    await user_repo.create_user(CreateUser(name="Racer", email="racer@example.com", password="pass"))
+
+    # simulate the row being inserted between the existence check and the INSERT
+    mocker.patch.object(user_repo, "_UserRepositoryImpl__existing_emails", return_value=set())
+
+    results = await user_repo.create_users([
+        CreateUser(name="Racer", email="racer@example.com", password="pass"),
+        CreateUser(name="Winner", email="winner@example.com", password="pass"),
+    ])
+
+    assert [result.status for result in results] == ["duplicate", "created"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scope, held", [("request", True), ("unit_of_work", False)])
+async def test_reads_release_connection_in_unit_of_work_scope(db_session: AsyncSession, monkeypatch, scope, held):
+    """Test that unit_of_work scope ends read transactions right after the query."""
+    from src.core.config import settings
+
+    user_repo = UserRepositoryImpl(db_session)
+    user = await user_repo.create_user(CreateUser(name="Scoped", email="scoped@example.com", password="pass"))
+    monkeypatch.setattr(settings, "DATABASE_SESSION_SCOPE", scope)
+
+    await user_repo.get_all_users(limit=10)
+    assert db_session.in_transaction() is held
+    await db_session.rollback()
+
+    db_session.expunge_all()
+    await user_repo.get_user_by_id(user.id)
+    assert db_session.in_transaction() is held
+
+
+@pytest.mark.asyncio
+async def test_create_users_hashes_without_holding_a_connection(db_session: AsyncSession, monkeypatch, mocker):
+    """Test that bulk hashing runs after the duplicate check released its connection."""
+    from src.core.config import settings
+    from src.infrastructure.repositories import user_repository_impl
+
+    monkeypatch.setattr(settings, "DATABASE_SESSION_SCOPE", "unit_of_work")
+    in_transaction = []
+
+    async def fake_hash(passwords):
+        in_transaction.append(db_session.in_transaction())
+        return ["hashed"] * len(passwords)
+
+    mocker.patch.object(user_repository_impl, "hash_passwords_async", side_effect=fake_hash)
+
+    results = await UserRepositoryImpl(db_session).create_users(
+        [CreateUser(name="Hash", email="hash@example.com", password="pass")]
+    )
+
+    assert results[0].status == "created"
+    assert in_transaction == [False]
@@ -1,4 +1,16 @@
-from src.infrastructure.security.hash import hash_password, verify_password
+import asyncio
+import threading
+import pytest
+from src.core.exceptions import ServiceUnavailableError
+from src.infrastructure.security.hash import (
+    HashPool,
+    hash_password,
+    hash_password_async,
+    hash_passwords_async,
+    load_hash_backend,
+    verify_password,
+    verify_password_async,
+)
 
 def test_hash_password():
     password = "securepassword"
@@ -7,9 +19,62 @@ def test_hash_password():
     assert password != hashed_password
     assert verify_password(password, hashed_password)
 
+def test_load_hash_backend():
+    assert load_hash_backend() == "bcrypt"
+
+
 def test_verify_password():
     password = "mypassword"
     hashed_password = hash_password(password)
 
     assert verify_password(password, hashed_password)
     assert not verify_password("wrongpassword", hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_hash_password_async():
+    """Test that async hashing round-trips through the worker pool."""
+    hashed_password = await hash_password_async("asyncpassword")
+
+    assert await verify_password_async("asyncpassword", hashed_password)
+    assert not await verify_password_async("wrongpassword", hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_hash_passwords_async():
+    """Test that batch hashing keeps the input order."""
+    passwords = [f"password{index}" for index in range(6)]
+
+    hashed_passwords = await hash_passwords_async(passwords)
+
+    assert len(hashed_passwords) == 6
+    for password, hashed_password in zip(passwords, hashed_passwords):
+        assert verify_password(password, hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_hash_pool_rejects_when_saturated():
+    """Test that the pool answers 503 instead of queueing past its limit."""
+    pool = HashPool(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    running = asyncio.ensure_future(pool.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceUnavailableError) as exc_info:
+        await pool.run(release.wait)
+
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+    release.set()
+    assert await running is True
+
+    stats = pool.stats()
+    assert stats.pending == 0
+    assert stats.completed == 1
+    assert stats.rejected == 1
+    assert stats.hash_seconds_total > 0
+    assert stats.wait_seconds_total >= 0
+
+    pool.shutdown()
+    pool.shutdown()
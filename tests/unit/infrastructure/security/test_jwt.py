@@ -0,0 +1,127 @@
+import time
+from datetime import timedelta
+import jwt as pyjwt
+import pytest
+from src.core.config import settings
+from src.infrastructure.security import jwt
+from src.infrastructure.security.jwt import (
+    KeySet,
+    VerifiedTokenCache,
+    create_access_token,
+    decode_access_token,
+    decode_principal,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test with an empty verified-token cache."""
+    jwt.token_cache.clear()
+    yield
+    jwt.token_cache.clear()
+
+
+def test_create_and_decode_access_token():
+    """Test that a freshly issued token decodes to its claims."""
+    token = create_access_token({"sub": "user-1"})
+
+    payload = decode_access_token(token)
+
+    assert payload["sub"] == "user-1"
+    assert payload["exp"] > time.time()
+
+
+def test_decode_access_token_uses_cache(mocker):
+    """Test that a verified token is not verified again."""
+    token = create_access_token({"sub": "user-1"})
+    decode = mocker.spy(jwt.jwt, "decode")
+
+    first = decode_access_token(token)
+    first["sub"] = "tampered"
+    second = decode_access_token(token)
+
+    assert decode.call_count == 1
+    assert second["sub"] == "user-1"
+
+
+def test_decode_access_token_invalid_and_expired():
+    """Test that invalid or expired tokens decode to None."""
+    expired = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=-1))
+
+    assert decode_access_token("not-a-token") is None
+    assert decode_access_token(expired) is None
+
+
+def test_verified_token_cache_honors_exp_and_size():
+    """Test that cached payloads expire with the token and are LRU-bounded."""
+    cache = VerifiedTokenCache(max_entries=2)
+
+    cache.put(b"expired", {"sub": "a", "exp": time.time() - 1})
+    assert cache.get(b"expired") is None
+
+    cache.put(b"valid", {"sub": "b", "exp": time.time() + 60})
+    cache.put(b"no-exp", {"sub": "c"})
+    assert cache.get(b"valid")["sub"] == "b"
+
+    cache.put(b"newest", {"sub": "d"})
+    assert cache.get(b"no-exp") is None
+    assert cache.get(b"valid")["sub"] == "b"
+    assert cache.get(b"missing") is None
+
+
+def test_decode_principal():
+    """Test that claims are mapped onto a typed Principal."""
+    token = create_access_token({"sub": "42", "scope": "users:read users:write"})
+
+    principal = decode_principal(token)
+
+    assert principal.subject == "42"
+    assert principal.scopes == ["users:read", "users:write"]
+    assert principal.expires_at is not None
+    assert principal.claims["scope"] == "users:read users:write"
+
+
+def test_decode_principal_without_subject():
+    """Test that tokens without a subject do not yield a principal."""
+    assert decode_principal(create_access_token({"role": "admin"})) is None
+    assert decode_principal("not-a-token") is None
+
+
+def test_key_set_rejects_unknown_algorithm():
+    """Test that an unsupported algorithm fails at startup, not per request."""
+    with pytest.raises(RuntimeError):
+        KeySet(settings.model_copy(update={"JWT_ALGORITHM": "XX999"}))
+
+
+def test_asymmetric_keys_with_key_ids(monkeypatch):
+    """Test RS256 signing and kid-based verification key selection."""
+    rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+    config = settings.model_copy(
+        update={
+            "JWT_ALGORITHM": "RS256",
+            "JWT_PRIVATE_KEY": private_pem,
+            "JWT_PUBLIC_KEYS": {"key-1": public_pem},
+            "JWT_KEY_ID": "key-1",
+        }
+    )
+    monkeypatch.setattr(jwt, "key_set", KeySet(config))
+
+    token = create_access_token({"sub": "user-1"})
+
+    assert pyjwt.get_unverified_header(token)["kid"] == "key-1"
+    assert decode_access_token(token)["sub"] == "user-1"
+
+    unknown_kid = pyjwt.encode({"sub": "user-1"}, private_pem, algorithm="RS256", headers={"kid": "other"})
+    assert decode_access_token(unknown_kid) is None
@@ -0,0 +1,46 @@
+import pytest
+from src.infrastructure.security.jwt import create_access_token
+from src.interfaces.api.admission import ConcurrencyLimiter, RateLimit, RouteRules, client_key
+
+
+def test_rate_limit_parse():
+    assert RateLimit.parse("10/minute") == RateLimit(rate=10 / 60, burst=10)
+    assert RateLimit.parse("5/second") == RateLimit(rate=5.0, burst=5)
+
+    for spec in ("10", "ten/minute", "10/day", "-1/second", "0/minute"):
+        with pytest.raises(ValueError):
+            RateLimit.parse(spec)
+
+
+def test_route_rules_match_method_and_template():
+    """Test that rules match path templates for their method only."""
+    rules = RouteRules({"POST /api/v1/user/": 1, "get /api/v1/user/{user_id}": 2})
+
+    assert rules.match("POST", "/api/v1/user/") == ("POST /api/v1/user/", 1)
+    assert rules.match("GET", "/api/v1/user/abc") == ("get /api/v1/user/{user_id}", 2)
+    assert rules.match("GET", "/api/v1/user/") is None
+    assert rules.match("POST", "/api/v1/user/abc") is None
+    assert not RouteRules({})
+
+
+def test_concurrency_limiter():
+    limiter = ConcurrencyLimiter(2)
+
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+    limiter.release()
+    assert limiter.try_acquire()
+    assert limiter.active == 2
+
+
+def test_client_key_prefers_a_valid_token_subject():
+    """Test that callers are keyed by JWT subject and fall back to their address."""
+    token = create_access_token({"sub": "user-1"})
+    scope = {"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())], "client": ("10.0.0.1", 1234)}
+
+    assert client_key(scope) == "sub:user-1"
+
+    scope["headers"] = [(b"authorization", b"Bearer forged")]
+    assert client_key(scope) == "ip:10.0.0.1"
+
+    assert client_key({"type": "http", "headers": [], "client": None}) == "ip:unknown"
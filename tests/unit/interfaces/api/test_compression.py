@@ -0,0 +1,93 @@
+import gzip
+import pytest
+from src.core.config import settings
+from src.interfaces.api import compression
+from src.interfaces.api.compression import PrecompressedCache, compress, is_compressible, negotiate, request_key
+
+
+@pytest.mark.parametrize(
+    "header, encodings, expected",
+    [
+        ("gzip, br, zstd", ["zstd", "br", "gzip"], "zstd"),
+        ("gzip, br;q=0.5", ["zstd", "br", "gzip"], "gzip"),
+        ("br;q=0.5, gzip;q=0.5", ["br", "gzip"], "br"),
+        ("*", ["br", "gzip"], "br"),
+        ("*;q=0.1, gzip;q=0", ["br", "gzip"], "br"),
+        ("gzip;q=nope", ["gzip"], None),
+        ("identity", ["gzip"], None),
+        ("", ["gzip"], None),
+    ],
+)
+def test_negotiate(header, encodings, expected):
+    """Test q-value negotiation with server preference on ties."""
+    assert negotiate(header, encodings) == expected
+
+
+def test_negotiate_defaults_to_installed_encodings(monkeypatch):
+    """Test that configured encodings without an installed codec are skipped."""
+    monkeypatch.setattr(settings, "COMPRESSION_ENCODINGS", ["snappy", "gzip"])
+
+    assert negotiate("snappy, gzip") == "gzip"
+    assert negotiate("snappy") is None
+
+
+@pytest.mark.parametrize(
+    "content_type, expected",
+    [
+        ("application/json", True),
+        ("text/csv; charset=utf-8", True),
+        ("application/problem+json", True),
+        ("application/x-ndjson", True),
+        ("image/png", False),
+        ("", False),
+    ],
+)
+def test_is_compressible(content_type, expected):
+    """Test which media types are worth compressing."""
+    assert is_compressible(content_type) is expected
+
+
+@pytest.mark.asyncio
+async def test_compress_offloads_large_bodies(monkeypatch):
+    """Test that bodies past COMPRESSION_OFFLOAD_BYTES are compressed in a worker thread."""
+    offloaded = []
+
+    async def run_in_threadpool(func, *args):
+        offloaded.append(len(args[0]))
+        return func(*args)
+
+    monkeypatch.setattr(compression, "run_in_threadpool", run_in_threadpool)
+    monkeypatch.setattr(settings, "COMPRESSION_OFFLOAD_BYTES", 100)
+
+    assert gzip.decompress(await compress(b"a" * 10, "gzip")) == b"a" * 10
+    assert gzip.decompress(await compress(b"b" * 200, "gzip")) == b"b" * 200
+    assert offloaded == [200]
+    assert await compress(b"same", "gzip") == await compress(b"same", "gzip")
+
+
+def test_request_key_ignores_parameter_order():
+    """Test that query parameter order does not split cache entries."""
+    first = request_key({"path": "/users", "query_string": b"limit=5&sort=name"})
+    second = request_key({"path": "/users", "query_string": b"sort=name&limit=5"})
+
+    assert first == second == "/users?limit=5&sort=name"
+
+
+def test_precompressed_cache_is_a_bounded_lru():
+    """Test LRU eviction, ETag matching and a disabled cache."""
+    cache = PrecompressedCache(2)
+    scopes = [{"path": f"/{index}", "query_string": b""} for index in range(3)]
+    for index, scope in enumerate(scopes[:2]):
+        cache.put(scope, "gzip", f'W/"{index}"', 200, [(b"content-encoding", b"gzip")], b"body")
+
+    assert cache.get(scopes[0], "gzip", 'W/"0"').body == b"body"
+    cache.put(scopes[2], "gzip", 'W/"2"', 200, [], b"body")
+
+    assert cache.has(scopes[0], "gzip")
+    assert not cache.has(scopes[1], "gzip")
+    assert not cache.has(scopes[0], None)
+    assert cache.get(scopes[0], "br", 'W/"0"') is None
+
+    disabled = PrecompressedCache(0)
+    disabled.put(scopes[0], "gzip", 'W/"0"', 200, [], b"body")
+    assert not disabled.has(scopes[0], "gzip")
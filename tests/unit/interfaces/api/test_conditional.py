@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi import Request, Response
+from src.core.config import settings
+from src.interfaces.api.conditional import is_conditional, is_not_modified, not_modified, set_validators, weak_etag
+
+UPDATED_AT = datetime(2025, 3, 1, 12, 30, 15, 250000)
+ETAG = weak_etag("user", UPDATED_AT)
+
+
+def request_with(**headers):
+    return Request({"type": "http", "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]})
+
+
+def test_weak_etag_is_stable_and_weak():
+    """Test that equal parts give equal weak ETags and different parts differ."""
+    assert ETAG == weak_etag("user", UPDATED_AT)
+    assert ETAG != weak_etag("user", UPDATED_AT + timedelta(microseconds=1))
+    assert ETAG.startswith('W/"') and ETAG.endswith('"')
+
+
+def test_is_conditional():
+    """Test detection of conditional request headers."""
+    assert not is_conditional(request_with())
+    assert is_conditional(request_with(if_none_match=ETAG))
+    assert is_conditional(request_with(if_modified_since="Sat, 01 Mar 2025 12:30:15 GMT"))
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (ETAG, True),
+        (ETAG.removeprefix("W/"), True),
+        (f'"other", {ETAG}', True),
+        ("*", True),
+        ('W/"other"', False),
+    ],
+)
+def test_if_none_match_uses_weak_comparison(if_none_match, expected):
+    """Test If-None-Match matching, which takes precedence over If-Modified-Since."""
+    request = request_with(if_none_match=if_none_match, if_modified_since="Sat, 01 Mar 2025 12:30:15 GMT")
+
+    assert is_not_modified(request, ETAG, UPDATED_AT) is expected
+
+
+@pytest.mark.parametrize(
+    "if_modified_since, expected",
+    [
+        ("Sat, 01 Mar 2025 12:30:15 GMT", True),
+        ("Sat, 01 Mar 2025 13:00:00 GMT", True),
+        ("Sat, 01 Mar 2025 12:30:14 GMT", False),
+        ("Sat, 01 Mar 2025 12:30:15", False),
+        ("yesterday", False),
+    ],
+)
+def test_if_modified_since_compares_at_second_precision(if_modified_since, expected):
+    """Test If-Modified-Since against a naive UTC timestamp."""
+    request = request_with(if_modified_since=if_modified_since)
+
+    assert is_not_modified(request, ETAG, UPDATED_AT) is expected
+    assert not is_not_modified(request, ETAG, None)
+
+
+def test_set_validators_and_not_modified():
+    """Test the validator headers on full responses and bodiless 304s."""
+    response = Response()
+    set_validators(response, ETAG, UPDATED_AT.replace(tzinfo=timezone(timedelta(hours=2))))
+
+    assert response.headers["ETag"] == ETAG
+    assert response.headers["Last-Modified"] == "Sat, 01 Mar 2025 10:30:15 GMT"
+    assert response.headers["Cache-Control"] == settings.HTTP_CACHE_CONTROL
+
+    response = not_modified(ETAG, None)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["ETag"] == ETAG
+    assert "Last-Modified" not in response.headers
@@ -0,0 +1,83 @@
+import pytest
+from src.core.config import settings
+from src.infrastructure.cache.backend import InMemoryCacheBackend
+from src.interfaces.api.idempotency import (
+    StoredResponse,
+    capture,
+    create_idempotency_store,
+    fingerprint,
+    read_body,
+    replay_receive,
+)
+
+
+def receiver(*messages):
+    queue = list(messages)
+
+    async def receive():
+        return queue.pop(0)
+
+    return receive
+
+
+def test_stored_response_round_trips():
+    """Test that stored responses survive serialization, including binary bodies."""
+    response = StoredResponse(fingerprint(b"{}"), 201, [(b"content-type", b"application/json")], b"\x00\xff{}")
+
+    assert StoredResponse.loads(response.dumps()) == response
+
+
+@pytest.mark.asyncio
+async def test_stored_response_marks_replays():
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    response = StoredResponse("digest", 200, [(b"content-type", b"text/plain")], b"ok")
+    await response.send(send, replayed=False)
+    await response.send(send, replayed=True)
+
+    assert sent[0]["headers"] == [(b"content-type", b"text/plain")]
+    assert (b"idempotent-replayed", b"true") in sent[2]["headers"]
+    assert sent[3] == {"type": "http.response.body", "body": b"ok"}
+
+
+@pytest.mark.asyncio
+async def test_read_body_joins_chunks_and_detects_disconnects():
+    chunks = receiver(
+        {"type": "http.request", "body": b"ab", "more_body": True},
+        {"type": "http.request", "body": b"c"},
+    )
+
+    assert await read_body(chunks) == b"abc"
+    assert await read_body(receiver({"type": "http.disconnect"})) is None
+
+
+@pytest.mark.asyncio
+async def test_replay_receive_hands_over_the_body_once():
+    """Test that the buffered body is replayed once and later calls reach the client."""
+    receive = replay_receive(b"body", receiver({"type": "http.disconnect"}))
+
+    assert await receive() == {"type": "http.request", "body": b"body", "more_body": False}
+    assert await receive() == {"type": "http.disconnect"}
+
+
+@pytest.mark.asyncio
+async def test_capture_collects_streamed_responses():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 201, "headers": [(b"x", b"1")]})
+        await send({"type": "http.response.body", "body": b"a", "more_body": True})
+        await send({"type": "http.response.body", "body": b"b"})
+
+    response = await capture(app, {}, None, "digest")
+
+    assert response == StoredResponse("digest", 201, [(b"x", b"1")], b"ab")
+
+
+def test_create_idempotency_store_without_a_cache():
+    """Test that keys are still stored in memory when response caching is off."""
+    store = create_idempotency_store(settings.model_copy(update={"CACHE_BACKEND": "none", "IDEMPOTENCY_MAX_ENTRIES": 7}))
+
+    assert isinstance(store, InMemoryCacheBackend)
+    assert store.max_entries == 7
@@ -0,0 +1,485 @@
+import asyncio
+import gzip
+import pytest
+from fastapi import APIRouter, FastAPI, Response
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from src.core.config import settings
+from src.interfaces.api.compression import PrecompressedCache
+from src.infrastructure.cache.backend import InMemoryCacheBackend
+from src.infrastructure.cache.rate_limit import InMemoryRateLimitBackend
+from src.interfaces.api.admission import RateLimit
+from src.interfaces.api.idempotency import IN_PROGRESS
+from src.interfaces.api.middleware import (
+    AdmissionMiddleware,
+    CompressionMiddleware,
+    IdempotencyMiddleware,
+    TimingMiddleware,
+    rejected_requests,
+    request_duration,
+)
+from src.interfaces.api.routing import TracedRoute
+
+
+def build_app(sample_rate=None) -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(route_class=TracedRoute)
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    @router.get("/sync")
+    def sync_endpoint():
+        return "ok"
+
+    app.include_router(router)
+    app.add_middleware(TimingMiddleware, sample_rate=sample_rate)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_return_server_timing():
+    """Test that sampled requests get a Server-Timing header per layer."""
+    async with AsyncClient(transport=ASGITransport(app=build_app(1.0)), base_url="http://test") as client:
+        response = await client.get("/items/7")
+
+    assert response.json() == {"id": 7}
+    timing = response.headers["Server-Timing"]
+    for name in ("deps", "endpoint", "serialize", "total"):
+        assert f"{name};dur=" in timing
+
+
+@pytest.mark.asyncio
+async def test_unsampled_requests_are_still_measured(monkeypatch):
+    """Test that sampling only affects spans, not the latency histogram."""
+    monkeypatch.setattr(settings, "TRACE_SAMPLE_RATE", 0.0)
+    key = ("GET", "/items/{item_id}", "200")
+    before = sum(request_duration.values.get(key, [0.0])[:-1])
+
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as client:
+        response = await client.get("/items/1")
+        missing = await client.get("/nope")
+
+    assert "Server-Timing" not in response.headers
+    assert missing.status_code == 404
+    assert sum(request_duration.values[key][:-1]) == before + 1
+    assert ("GET", "unmatched", "404") in request_duration.values
+
+
+@pytest.mark.asyncio
+async def test_sync_endpoints_are_left_unwrapped():
+    """Test that TracedRoute does not wrap sync endpoints."""
+    async with AsyncClient(transport=ASGITransport(app=build_app(1.0)), base_url="http://test") as client:
+        response = await client.get("/sync")
+
+    assert response.json() == "ok"
+    assert "deps;dur=" not in response.headers["Server-Timing"]
+
+
+@pytest.mark.asyncio
+async def test_non_http_scopes_pass_through():
+    """Test that lifespan and websocket scopes skip timing."""
+    calls = []
+
+    async def inner(scope, receive, send):
+        calls.append(scope["type"])
+
+    await TimingMiddleware(inner)({"type": "lifespan"}, None, None)
+
+    assert calls == ["lifespan"]
+
+
+def build_compressed_app(cache=None) -> FastAPI:
+    app = FastAPI()
+    payload = b'{"data": "' + b"x" * 2048 + b'"}'
+
+    @app.get("/large")
+    async def large():
+        return Response(payload, media_type="application/json", headers={"ETag": 'W/"large"'})
+
+    @app.get("/small")
+    async def small():
+        return {"data": "x"}
+
+    @app.get("/image")
+    async def image():
+        return Response(payload, media_type="image/png")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(gzip.compress(payload), media_type="application/json", headers={"Content-Encoding": "gzip"})
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            yield payload
+            yield payload
+
+        return StreamingResponse(chunks(), media_type="application/json")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, cache=cache)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_compression_middleware_compresses_large_bodies():
+    """Test that large compressible bodies are gzipped and cached by ETag."""
+    cache = PrecompressedCache(10)
+    app = build_compressed_app(cache)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < 100
+    assert response.json() == {"data": "x" * 2048}
+
+    replay = cache.get({"path": "/large", "query_string": b""}, "gzip", 'W/"large"')
+    assert replay.status_code == 200
+    assert gzip.decompress(replay.body) == response.content
+    assert replay.headers["content-encoding"] == "gzip"
+    assert cache.get({"path": "/large", "query_string": b""}, "gzip", 'W/"other"') is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, accept_encoding",
+    [
+        ("/large", "identity"),
+        ("/large", "gzip;q=0"),
+        ("/small", "gzip"),
+        ("/image", "gzip"),
+        ("/encoded", "gzip"),
+        ("/stream", "gzip"),
+    ],
+)
+async def test_compression_middleware_passes_through(path, accept_encoding):
+    """Test that unaccepted, small, binary, encoded and streamed bodies are left alone."""
+    app = build_compressed_app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") in (None, "gzip" if path == "/encoded" else None)
+    assert "vary" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_compression_middleware_skips_non_http_scopes():
+    """Test that lifespan scopes skip compression."""
+    calls = []
+
+    async def inner(scope, receive, send):
+        calls.append(scope["type"])
+
+    await CompressionMiddleware(inner)({"type": "lifespan"}, None, None)
+
+    assert calls == ["lifespan"]
+
+
+def build_admission_app(**options):
+    app = FastAPI()
+    app.state.release = asyncio.Event()
+
+    @app.post("/signup")
+    async def signup():
+        await app.state.release.wait()
+        return {"ok": True}
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    if options:
+        app.add_middleware(AdmissionMiddleware, **options)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_admission_rate_limits_each_client(monkeypatch):
+    """Test that clients over their route budget get 429 with Retry-After, independently of each other."""
+    app = build_admission_app(
+        rate_limits={"GET /items/{item_id}": "2/minute"},
+        concurrency_limits={},
+        backend=InMemoryRateLimitBackend(100),
+    )
+    before = rejected_requests.values.get(("GET /items/{item_id}", "rate_limit"), 0)
+
+    async with AsyncClient(transport=ASGITransport(app=app, client=("10.0.0.1", 1)), base_url="http://test") as first:
+        statuses = [(await first.get(f"/items/{index}")).status_code for index in range(3)]
+        rejected = await first.get("/items/9")
+    async with AsyncClient(transport=ASGITransport(app=app, client=("10.0.0.2", 1)), base_url="http://test") as second:
+        other = await second.get("/items/1")
+
+    assert statuses == [200, 200, 429]
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "30"
+    assert rejected.json() == {"detail": "Rate limit exceeded, retry later"}
+    assert other.status_code == 200
+    assert rejected_requests.values[("GET /items/{item_id}", "rate_limit")] == before + 2
+
+
+@pytest.mark.asyncio
+async def test_admission_rejects_over_the_concurrency_limit():
+    """Test that requests beyond a route's in-flight limit get 503 immediately instead of queuing."""
+    app = build_admission_app()
+    middleware = AdmissionMiddleware(app, rate_limits={}, concurrency_limits={"POST /signup": 2})
+    _, limiter = middleware.concurrency_limits.match("POST", "/signup")
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        in_flight = [asyncio.create_task(client.post("/signup")) for _ in range(2)]
+        while limiter.active < 2:
+            await asyncio.sleep(0.01)
+        busy = await client.post("/signup")
+        unlimited = await client.get("/items/1")
+        app.state.release.set()
+        done = await asyncio.gather(*in_flight)
+        after = await client.post("/signup")
+
+    assert busy.status_code == 503
+    assert busy.headers["Retry-After"] == "1"
+    assert unlimited.status_code == 200
+    assert [response.status_code for response in done] == [200, 200]
+    assert after.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_admission_fails_open_when_the_backend_errors(caplog):
+    """Test that an unreachable rate limit store lets requests through."""
+
+    class BrokenBackend:
+        async def acquire(self, key, rate, burst):
+            raise ConnectionError("down")
+
+    app = build_admission_app(rate_limits={"GET /items/{item_id}": "1/hour"}, concurrency_limits={}, backend=BrokenBackend())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        responses = [await client.get("/items/1") for _ in range(2)]
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert "Rate limit backend failed" in caplog.text
+
+
+def test_admission_defaults_come_from_settings(monkeypatch):
+    """Test that limits default to settings and a backend is only built when rate limits exist."""
+    monkeypatch.setattr(settings, "RATE_LIMITS", {"POST /signup": "1/second"})
+    monkeypatch.setattr(settings, "CONCURRENCY_LIMITS", {"POST /signup": 3})
+
+    middleware = AdmissionMiddleware(None)
+
+    assert isinstance(middleware.backend, InMemoryRateLimitBackend)
+    assert middleware.rate_limits.match("POST", "/signup")[1] == RateLimit(1.0, 1)
+    assert middleware.concurrency_limits.match("POST", "/signup")[1].limit == 3
+    assert AdmissionMiddleware(None, rate_limits={}).backend is None
+
+
+@pytest.mark.asyncio
+async def test_admission_passes_through_non_http_scopes():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+
+    await AdmissionMiddleware(app, rate_limits={}, concurrency_limits={})({"type": "lifespan"}, None, None)
+
+    assert seen == ["lifespan"]
+
+
+def build_idempotent_app():
+    app = FastAPI()
+    app.state.calls = 0
+    app.state.release = None
+
+    @app.post("/orders")
+    async def create_order(payload: dict):
+        app.state.calls += 1
+        if app.state.release is not None:
+            await app.state.release.wait()
+        if payload.get("fail"):
+            return Response(status_code=500)
+        return {"order": app.state.calls, **payload}
+
+    @app.post("/crash")
+    async def crash():
+        raise RuntimeError("boom")
+
+    @app.post("/other")
+    async def other():
+        app.state.calls += 1
+        return {"calls": app.state.calls}
+
+    return app
+
+
+@pytest.fixture
+def idempotent():
+    app = build_idempotent_app()
+    store = InMemoryCacheBackend(100)
+    middleware = IdempotencyMiddleware(app, routes=["POST /orders", "POST /crash"], store=store)
+    return app, middleware, store
+
+
+@pytest.mark.asyncio
+async def test_idempotency_replays_the_first_response(idempotent):
+    """Test that a repeated key replays the stored response without running the endpoint again."""
+    app, middleware, _ = idempotent
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        first = await client.post("/orders", json={"item": 1}, headers={"Idempotency-Key": "k1"})
+        retry = await client.post("/orders", json={"item": 1}, headers={"Idempotency-Key": "k1"})
+        other_key = await client.post("/orders", json={"item": 1}, headers={"Idempotency-Key": "k2"})
+        no_key = await client.post("/orders", json={"item": 1})
+        unlisted = [await client.post("/other", headers={"Idempotency-Key": "k1"}) for _ in range(2)]
+
+    assert first.json() == retry.json() == {"order": 1, "item": 1}
+    assert "Idempotent-Replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.headers["content-type"] == "application/json"
+    assert other_key.json()["order"] == 2
+    assert no_key.json()["order"] == 3
+    assert [response.json()["calls"] for response in unlisted] == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_idempotency_keys_are_scoped_per_client(idempotent):
+    app, middleware, _ = idempotent
+
+    for host in ("10.0.0.1", "10.0.0.2"):
+        async with AsyncClient(transport=ASGITransport(app=middleware, client=(host, 1)), base_url="http://test") as client:
+            await client.post("/orders", json={}, headers={"Idempotency-Key": "shared"})
+
+    assert app.state.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_idempotency_coalesces_concurrent_repeats(idempotent):
+    """Test that concurrent requests with one key wait for the first instead of racing it."""
+    app, middleware, _ = idempotent
+    app.state.release = asyncio.Event()
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        requests = [
+            asyncio.create_task(client.post("/orders", json={"item": 2}, headers={"Idempotency-Key": "k"}))
+            for _ in range(5)
+        ]
+        while app.state.calls == 0:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        app.state.release.set()
+        responses = await asyncio.gather(*requests)
+
+    assert app.state.calls == 1
+    assert {response.json()["order"] for response in responses} == {1}
+    assert sorted(response.headers.get("Idempotent-Replayed", "false") for response in responses) == ["false"] + ["true"] * 4
+
+
+@pytest.mark.asyncio
+async def test_idempotency_rejects_key_reuse_with_another_body(idempotent):
+    _, middleware, _ = idempotent
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        await client.post("/orders", json={"item": 1}, headers={"Idempotency-Key": "k"})
+        reused = await client.post("/orders", json={"item": 2}, headers={"Idempotency-Key": "k"})
+        too_long = await client.post("/orders", json={}, headers={"Idempotency-Key": "x" * 256})
+
+    assert reused.status_code == 422
+    assert "different request" in reused.json()["detail"]
+    assert too_long.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_idempotency_conflicts_while_another_worker_holds_the_key(idempotent):
+    """Test that a key claimed elsewhere answers 409 with Retry-After until its response is stored."""
+    app, middleware, store = idempotent
+    await store.set("ip:127.0.0.1:POST /orders:k", IN_PROGRESS, 60)
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        response = await client.post("/orders", json={}, headers={"Idempotency-Key": "k"})
+
+    assert response.status_code == 409
+    assert response.headers["Retry-After"] == "1"
+    assert app.state.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_idempotency_does_not_store_failures(idempotent):
+    """Test that server errors and exceptions release the key so the request can be retried."""
+    app, middleware, store = idempotent
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        failures = [await client.post("/orders", json={"fail": True}, headers={"Idempotency-Key": "f"}) for _ in range(2)]
+        with pytest.raises(RuntimeError):
+            await client.post("/crash", headers={"Idempotency-Key": "c"})
+
+    assert [response.status_code for response in failures] == [500, 500]
+    assert app.state.calls == 2
+    assert await store.get("ip:127.0.0.1:POST /crash:c") is None
+
+
+@pytest.mark.asyncio
+async def test_idempotency_ignores_disconnects_and_non_http_scopes(idempotent):
+    app, middleware, _ = idempotent
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/orders",
+        "headers": [(b"idempotency-key", b"k")],
+        "client": ("127.0.0.1", 1),
+    }
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    await middleware(scope, receive, None)
+    seen = []
+
+    async def inner(scope, receive, send):
+        seen.append(scope["type"])
+
+    await IdempotencyMiddleware(inner, routes=[], store=InMemoryCacheBackend(1))({"type": "lifespan"}, None, None)
+
+    assert app.state.calls == 0
+    assert seen == ["lifespan"]
+
+
+@pytest.mark.asyncio
+async def test_idempotency_renews_the_lock_while_the_request_runs(idempotent, monkeypatch, caplog):
+    """Test that a request running past IDEMPOTENCY_LOCK_SECONDS keeps its key locked, even if a renewal fails."""
+    from src.core.config import settings
+
+    app, middleware, store = idempotent
+    app.state.release = asyncio.Event()
+    monkeypatch.setattr(settings, "IDEMPOTENCY_LOCK_SECONDS", 0.3)
+    set_lock = store.set
+    failures = iter([ConnectionError("down")])
+
+    async def flaky_set(key, value, ttl):
+        failure = next(failures, None)
+        if failure is not None:
+            raise failure
+        await set_lock(key, value, ttl)
+
+    key = "ip:127.0.0.1:POST /orders:slow"
+
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        first = asyncio.create_task(client.post("/orders", json={}, headers={"Idempotency-Key": "slow"}))
+        while app.state.calls == 0:
+            await asyncio.sleep(0.005)
+        store.set = flaky_set
+        await asyncio.sleep(0.6)
+        assert await store.get(key) == IN_PROGRESS
+        app.state.release.set()
+        await first
+        retry = await client.post("/orders", json={}, headers={"Idempotency-Key": "slow"})
+
+    assert app.state.calls == 1
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotency lock renewal failed" in caplog.text
+
+
+def test_idempotency_defaults_come_from_settings():
+    middleware = IdempotencyMiddleware(None)
+
+    assert middleware.routes.match("POST", "/api/v1/user/bulk") is not None
+    assert isinstance(middleware.store, InMemoryCacheBackend)
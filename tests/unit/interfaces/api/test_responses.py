@@ -0,0 +1,145 @@
+import csv
+import gzip
+import io
+import json
+import pytest
+from uuid import uuid4
+from fastapi import Response
+from src.core.config import settings
+from src.domain.models.user import User
+from src.interfaces.api.responses import FastJSONResponse, accepts_gzip, export_response, respond, respond_fields
+
+
+def test_fast_json_response_renders_models():
+    """Test that FastJSONResponse serializes pydantic models directly."""
+    user = User.model_construct(id=uuid4(), name="Alice", email="alice@example.com", is_active=True)
+
+    response = FastJSONResponse([user])
+
+    body = json.loads(response.body)
+    assert body[0]["id"] == str(user.id)
+    assert body[0]["email"] == "alice@example.com"
+    assert response.media_type == "application/json"
+
+
+def test_respond_passthrough_when_disabled(monkeypatch):
+    """Test that content is returned untouched unless the fast path is on."""
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+    content = {"message": "ok"}
+
+    assert respond(content, Response()) is content
+
+
+def test_respond_keeps_status_and_headers(monkeypatch):
+    """Test that the fast path carries over headers set on the sub-response."""
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    sub_response = Response(status_code=201)
+    sub_response.headers["X-Next-Cursor"] = "abc"
+
+    response = respond({"message": "ok"}, sub_response)
+
+    assert isinstance(response, FastJSONResponse)
+    assert response.status_code == 201
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert json.loads(response.body) == {"message": "ok"}
+
+
+def test_respond_fields_renders_only_selected_fields():
+    """Test that sparse fieldsets are rendered directly with the sub-response headers."""
+    user = User.model_construct(id=uuid4(), name="Alice", email="alice@example.com")
+    sub_response = Response()
+    sub_response.headers["X-Next-Cursor"] = "abc"
+
+    response = respond_fields([user], ["email"], sub_response)
+
+    assert json.loads(response.body) == [{"email": "alice@example.com"}]
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert response.media_type == "application/json"
+
+
+async def iter_users(*users):
+    for user in users:
+        yield user
+
+
+async def read_body(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.asyncio
+async def test_export_response_streams_ndjson_in_chunks(monkeypatch):
+    """Test that NDJSON rows are buffered into chunks of EXPORT_CHUNK_BYTES."""
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_BYTES", 1)
+    users = [User(name=f"User{index}", email=f"user{index}@example.com") for index in range(3)]
+
+    response = export_response(iter_users(*users), "ndjson")
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    assert len(chunks) == 3
+    assert [json.loads(chunk)["email"] for chunk in chunks] == [user.email for user in users]
+    assert response.media_type == "application/x-ndjson"
+    assert response.headers["Content-Disposition"] == 'attachment; filename="users.ndjson"'
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_export_response_renders_csv():
+    """Test CSV rows: header first, lowercase booleans and neutralized formulas."""
+    user = User(name="=HYPERLINK(\"x\")", email="csv@example.com", is_superuser=True)
+
+    response = export_response(iter_users(user), "csv")
+    rows = list(csv.DictReader(io.StringIO((await read_body(response)).decode())))
+
+    assert rows == [
+        {
+            "id": str(user.id),
+            "created_at": user.created_at.isoformat(),
+            "updated_at": user.updated_at.isoformat(),
+            "is_active": "true",
+            "is_superuser": "true",
+            "name": "'=HYPERLINK(\"x\")",
+            "email": "csv@example.com",
+        }
+    ]
+    assert response.media_type == "text/csv; charset=utf-8"
+
+
+@pytest.mark.asyncio
+async def test_export_response_writes_header_for_empty_csv():
+    """Test that an empty CSV export still carries its header row."""
+    response = export_response(iter_users(), "csv")
+
+    assert (await read_body(response)).decode().strip() == ",".join(User.model_fields)
+
+
+@pytest.mark.asyncio
+async def test_export_response_gzips_on_the_fly(monkeypatch):
+    """Test that every chunk is flushed as a decodable gzip member prefix."""
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_BYTES", 1)
+    users = [User(name=f"Zip{index}", email=f"zip{index}@example.com") for index in range(2)]
+
+    response = export_response(iter_users(*users), "ndjson", gzip=True)
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert len(chunks) == 3
+    lines = gzip.decompress(b"".join(chunks)).splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["Zip0", "Zip1"]
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", True),
+        ("br;q=1.0, GZIP;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip;q=abc", False),
+        ("identity", False),
+        ("", False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    """Test Accept-Encoding negotiation for gzip."""
+    assert accepts_gzip(header) is expected
@@ -1,9 +1,10 @@
 import pytest
+from datetime import datetime
 from uuid import uuid4
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from src.interfaces.controllers.user_controller import UserController
 from src.application.use_cases.user_use_case import UserUseCase
-from src.domain.models.user import CreateUser, User
+from src.domain.models.user import BulkDeleteResult, BulkUserResult, CreateUser, User, UserBatch, UserCount, UserFilter, UserPage
 
 
 @pytest.fixture
@@ -21,17 +22,50 @@ def user_controller(mock_user_use_case):
 @pytest.mark.asyncio
 async def test_get_users(user_controller: UserController, mock_user_use_case):
     """Test get_users method in UserController."""
-    mock_user_use_case.list_users.return_value = [
-        User(id=uuid4(), name="Alice", email="alice@example.com"),
-        User(id=uuid4(), name="Bob", email="bob@example.com"),
-    ]
+    mock_user_use_case.list_users.return_value = UserPage(
+        items=[
+            User(id=uuid4(), name="Alice", email="alice@example.com"),
+            User(id=uuid4(), name="Bob", email="bob@example.com"),
+        ]
+    )
 
-    response = await user_controller.get_users()
+    response = await user_controller.get_users(10)
 
-    assert len(response) == 2
-    assert response[0].name == "Alice"
-    assert response[1].name == "Bob"
-    mock_user_use_case.list_users.assert_called_once()
+    assert len(response.items) == 2
+    assert response.items[0].name == "Alice"
+    assert response.items[1].name == "Bob"
+    assert response.next_cursor is None
+    mock_user_use_case.list_users.assert_called_once_with(10, None, None, "created_at", None)
+
+
+@pytest.mark.asyncio
+async def test_count_users(user_controller, mock_user_use_case):
+    """Test that count_users() passes filters and the approximate flag through."""
+    filters = UserFilter(is_active=True)
+    mock_user_use_case.count_users.return_value = UserCount(total=42, exact=False)
+
+    count = await user_controller.count_users(filters, approximate=True)
+
+    assert count == UserCount(total=42, exact=False)
+    mock_user_use_case.count_users.assert_called_once_with(filters, True)
+
+
+def test_export_users(user_controller, mock_user_use_case):
+    """Test that export_users() hands back the underlying row stream."""
+    mock_user_use_case.export_users = MagicMock(return_value="iterator")
+
+    assert user_controller.export_users(500) == "iterator"
+    mock_user_use_case.export_users.assert_called_once_with(500)
+
+
+@pytest.mark.asyncio
+async def test_get_user_updated_at(user_controller, mock_user_use_case):
+    """Test that get_user_updated_at() passes the lookup through."""
+    user_id = uuid4()
+    mock_user_use_case.get_user_updated_at.return_value = datetime(2025, 1, 1)
+
+    assert await user_controller.get_user_updated_at(user_id) == datetime(2025, 1, 1)
+    mock_user_use_case.get_user_updated_at.assert_called_once_with(user_id)
 
 
 @pytest.mark.asyncio
@@ -48,6 +82,18 @@ async def test_get_user(user_controller: UserController, mock_user_use_case):
     mock_user_use_case.get_user.assert_called_once_with(user_id)
 
 
+@pytest.mark.asyncio
+async def test_get_users_by_ids(user_controller: UserController, mock_user_use_case):
+    """Test get_users_by_ids method in UserController."""
+    user_ids = [uuid4()]
+    mock_user_use_case.get_users.return_value = UserBatch(users=[], not_found=user_ids)
+
+    response = await user_controller.get_users_by_ids(user_ids)
+
+    assert response.not_found == user_ids
+    mock_user_use_case.get_users.assert_called_once_with(user_ids)
+
+
 @pytest.mark.asyncio
 async def test_create_user(user_controller: UserController, mock_user_use_case):
     """Test create_user method in UserController."""
@@ -61,6 +107,18 @@ async def test_create_user(user_controller: UserController, mock_user_use_case):
     mock_user_use_case.register_user.assert_called_once_with(user_data)
 
 
+@pytest.mark.asyncio
+async def test_create_users(user_controller: UserController, mock_user_use_case):
+    """Test create_users method in UserController."""
+    users_data = [CreateUser(name="Erin", email="erin@example.com", password="securepass")]
+    mock_user_use_case.register_users.return_value = [BulkUserResult(index=0, status="duplicate")]
+
+    response = await user_controller.create_users(users_data)
+
+    assert response[0].status == "duplicate"
+    mock_user_use_case.register_users.assert_called_once_with(users_data)
+
+
 @pytest.mark.asyncio
 async def test_delete_user(user_controller: UserController, mock_user_use_case):
     """Test delete_user method in UserController."""
@@ -71,3 +129,15 @@ async def test_delete_user(user_controller: UserController, mock_user_use_case):
 
     assert response == {"message": "User deleted"}
     mock_user_use_case.delete_user.assert_called_once_with(user_id)
+
+
+@pytest.mark.asyncio
+async def test_delete_users(user_controller: UserController, mock_user_use_case):
+    """Test delete_users method in UserController."""
+    user_ids = [uuid4()]
+    mock_user_use_case.delete_users.return_value = BulkDeleteResult(deleted=user_ids, not_found=[])
+
+    response = await user_controller.delete_users(user_ids)
+
+    assert response.deleted == user_ids
+    mock_user_use_case.delete_users.assert_called_once_with(user_ids)
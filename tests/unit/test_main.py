@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from httpx import ASGITransport, AsyncClient
 from src.main import app
 
@@ -16,3 +17,149 @@ def test_router_included():
     routes = [route.path for route in app.router.routes]
     
     assert "/api/v1/user/" in routes
+
+
+@pytest.mark.anyio
+async def test_pool_stats_endpoint():
+    """Ensure the pool stats endpoint reports the engine's pool state."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/system/pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["size"] >= 1
+    assert {"checked_in", "checked_out", "overflow", "waits", "wait_seconds_total"} <= data.keys()
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint():
+    """Ensure /metrics exposes request histograms and pool gauges in Prometheus format."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/")
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/",status="200"}' in response.text
+    assert "# TYPE db_pool_checked_out gauge" in response.text
+    assert "# TYPE hash_pool_pending gauge" in response.text
+
+
+def test_compression_middleware_installed():
+    """Ensure responses are compressed by default."""
+    from src.interfaces.api.middleware import CompressionMiddleware
+
+    assert CompressionMiddleware in [m.cls for m in app.user_middleware]
+
+
+def test_admission_runs_inside_timing():
+    """Ensure admission control is installed where its rejections are still timed."""
+    from src.interfaces.api.middleware import AdmissionMiddleware, TimingMiddleware
+
+    installed = [m.cls for m in app.user_middleware]
+    assert installed.index(TimingMiddleware) < installed.index(AdmissionMiddleware)
+
+
+def test_query_profiler_is_opt_in(monkeypatch):
+    """Ensure the query profiler middleware is only installed when enabled."""
+    import importlib
+    import src.main
+    from src.core.config import settings
+    from src.infrastructure.database.profiler import query_profiler
+    from src.interfaces.api.middleware import QueryProfilerMiddleware
+
+    assert QueryProfilerMiddleware not in [m.cls for m in app.user_middleware]
+
+    monkeypatch.setattr(settings, "QUERY_PROFILER_ENABLED", True)
+    try:
+        profiled = importlib.reload(src.main).app
+        assert QueryProfilerMiddleware in [m.cls for m in profiled.user_middleware]
+    finally:
+        for target in src.main.all_engines():
+            query_profiler.detach(target)
+        monkeypatch.setattr(settings, "QUERY_PROFILER_ENABLED", False)
+        importlib.reload(src.main)
+
+
+async def make_engine(path):
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from src.infrastructure.database.base import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=2)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return engine
+
+
+@pytest.mark.anyio
+async def test_lifespan_warms_pools_and_reports_ready(tmp_path, monkeypatch):
+    """Ensure startup fills every pool before reporting ready and shutdown drains and disposes them."""
+    import src.main
+    from src.core.config import settings
+    from src.core.startup import startup
+    from src.infrastructure.database.replicas import ReplicaSet
+
+    primary = await make_engine(tmp_path / "primary.db")
+    replica = await make_engine(tmp_path / "replica.db")
+    monkeypatch.setattr(src.main, "engine", primary)
+    monkeypatch.setattr(src.main, "replica_set", ReplicaSet([replica]))
+    monkeypatch.setattr(settings, "STARTUP_PREFILL_CONNECTIONS", 2)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/system/ready")).status_code == 503
+
+        async with app.router.lifespan_context(app):
+            assert primary.sync_engine.pool.checkedin() == 2
+            assert replica.sync_engine.pool.checkedin() == 2
+            response = await client.get("/system/ready")
+            assert response.status_code == 200
+            assert response.json() == {"ready": True}
+            metrics = (await client.get("/metrics")).text
+
+        assert (await client.get("/system/ready")).status_code == 503
+
+    assert 0 < startup.import_seconds <= startup.ready_seconds
+    assert startup.warmup_seconds > 0
+    assert "# TYPE app_ready_seconds gauge" in metrics
+    assert f"app_warmup_seconds {startup.warmup_seconds}" in metrics
+    assert primary.sync_engine.pool.checkedin() == 0
+    assert replica.sync_engine.pool.checkedin() == 0
+
+
+@pytest.mark.anyio
+async def test_shutdown_drains_every_pool(monkeypatch, caplog):
+    """Ensure shutdown waits on replica pools too and reports every connection left."""
+    import src.main
+
+    replica_set = MagicMock(engines=[AsyncMock(), AsyncMock()], dispose=AsyncMock())
+    monkeypatch.setattr(src.main, "warm_up", AsyncMock())
+    monkeypatch.setattr(src.main, "engine", AsyncMock())
+    monkeypatch.setattr(src.main, "replica_set", replica_set)
+    monkeypatch.setattr(src.main, "drain_pool", AsyncMock(return_value=1))
+
+    async with app.router.lifespan_context(app):
+        pass
+
+    drained = [call.args[0] for call in src.main.drain_pool.await_args_list]
+    assert drained == [src.main.engine, *replica_set.engines]
+    assert "Closing 3 connections still checked out" in caplog.text
+    replica_set.dispose.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_lifespan_survives_failed_warm_up(monkeypatch, caplog):
+    """Ensure an unreachable database slows startup down without preventing it."""
+    import src.main
+    from src.core.startup import startup
+
+    monkeypatch.setattr(src.main, "warm_up", AsyncMock(side_effect=OSError("connection refused")))
+    monkeypatch.setattr(src.main, "engine", AsyncMock())
+    monkeypatch.setattr(src.main, "drain_pool", AsyncMock(return_value=1))
+
+    async with app.router.lifespan_context(app):
+        assert startup.ready
+
+    assert not startup.ready
+    assert "Startup warm-up failed" in caplog.text
+    assert "Closing 1 connections still checked out" in caplog.text
+    src.main.engine.dispose.assert_awaited_once()
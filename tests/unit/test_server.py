@@ -0,0 +1,148 @@
+import os
+import runpy
+import pytest
+from unittest.mock import MagicMock
+from src import server
+from src.core.config import Settings
+from src.server import PoolBudget, available_cpus, pool_budget, uvicorn_options, worker_count
+
+
+def make_settings(**overrides):
+    return Settings(
+        DATABASE_USER="user",
+        DATABASE_PASSWORD="password",
+        DATABASE_HOST="localhost",
+        DATABASE_PORT=5432,
+        DATABASE_NAME="db",
+        **overrides,
+    )
+
+
+@pytest.mark.parametrize(
+    "cpu_max, expected",
+    [("max 100000\n", 8), ("150000 100000\n", 2), ("50000 100000\n", 1), ("garbage", 8), (None, 8)],
+)
+def test_available_cpus_honours_cgroup_quota(tmp_path, monkeypatch, cpu_max, expected):
+    """Test that a container CPU quota caps the affinity-based CPU count."""
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)))
+    path = tmp_path / "cpu.max"
+    if cpu_max is not None:
+        path.write_text(cpu_max)
+
+    assert available_cpus(path) == expected
+
+
+def test_worker_count(monkeypatch):
+    monkeypatch.setattr(server, "available_cpus", lambda: 6)
+
+    assert worker_count(make_settings()) == 6
+    assert worker_count(make_settings(SERVER_WORKERS=3)) == 3
+
+
+def test_pool_budget_is_unchanged_without_a_connection_limit():
+    config = make_settings(DATABASE_POOL_SIZE=5, DATABASE_MAX_OVERFLOW=10)
+
+    assert pool_budget(config, 16) == PoolBudget(5, 10)
+
+
+@pytest.mark.parametrize(
+    "workers, expected",
+    [(4, PoolBudget(5, 10)), (8, PoolBudget(5, 6)), (18, PoolBudget(5, 0)), (30, PoolBudget(3, 0))],
+)
+def test_pool_budget_splits_max_connections(workers, expected):
+    """Test that all workers' pools together fit in max_connections minus the reserve."""
+    config = make_settings(
+        DATABASE_POOL_SIZE=5, DATABASE_MAX_OVERFLOW=10, DATABASE_MAX_CONNECTIONS=100, DATABASE_RESERVED_CONNECTIONS=10
+    )
+
+    budget = pool_budget(config, workers)
+
+    assert budget == expected
+    assert workers * (budget.pool_size + budget.max_overflow) <= 90
+
+
+def test_pool_budget_rejects_too_many_workers():
+    config = make_settings(DATABASE_MAX_CONNECTIONS=20, DATABASE_RESERVED_CONNECTIONS=10)
+
+    with pytest.raises(ValueError, match="11 workers"):
+        pool_budget(config, 11)
+
+
+def test_uvicorn_options():
+    """Test that server settings map onto uvicorn options and recycling needs a supervisor."""
+    config = make_settings(
+        SERVER_PORT=9000,
+        SERVER_BACKLOG=4096,
+        SERVER_KEEPALIVE_SECONDS=65,
+        SERVER_MAX_REQUESTS=10_000,
+        SERVER_FORWARDED_ALLOW_IPS="10.0.0.0/8",
+    )
+
+    options = uvicorn_options(config, 4)
+
+    assert options["port"] == 9000
+    assert options["workers"] == 4
+    assert options["backlog"] == 4096
+    assert options["timeout_keep_alive"] == 65
+    assert options["limit_max_requests"] == 10_000
+    assert (options["loop"], options["http"], options["lifespan"]) == ("auto", "auto", "on")
+    assert (options["proxy_headers"], options["forwarded_allow_ips"]) == (True, "10.0.0.0/8")
+    assert uvicorn_options(config, 1)["limit_max_requests"] is None
+
+
+def test_main_runs_uvicorn_with_the_pool_budget(monkeypatch):
+    """Test that `python -m src` hands the per-worker pool size to spawned workers and runs uvicorn."""
+    config = make_settings(
+        SERVER_WORKERS=4, DATABASE_POOL_SIZE=5, DATABASE_MAX_OVERFLOW=10, DATABASE_MAX_CONNECTIONS=50
+    )
+    run = MagicMock()
+    monkeypatch.setattr(server, "settings", config)
+    monkeypatch.setattr(server.uvicorn, "run", run)
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "5")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "10")
+
+    runpy.run_module("src", run_name="__main__")
+
+    run.assert_called_once()
+    assert run.call_args.args == ("src.main:app",)
+    assert run.call_args.kwargs["workers"] == 4
+    assert (os.environ["DATABASE_POOL_SIZE"], os.environ["DATABASE_MAX_OVERFLOW"]) == ("5", "5")
+    assert (config.DATABASE_POOL_SIZE, config.DATABASE_MAX_OVERFLOW) == (5, 5)
+
+
+@pytest.mark.parametrize(
+    ("workers", "backend", "warned"), [(4, "memory", True), (1, "memory", False), (4, "redis", False)]
+)
+def test_main_warns_about_per_worker_memory_cache(monkeypatch, caplog, workers, backend, warned):
+    """Test that several workers with a memory cache log that deletes can be served stale."""
+    monkeypatch.setattr(server, "settings", make_settings(SERVER_WORKERS=workers, CACHE_BACKEND=backend))
+    monkeypatch.setattr(server.uvicorn, "run", MagicMock())
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "5")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "10")
+
+    server.main()
+
+    assert ("CACHE_BACKEND=memory is per worker" in caplog.text) is warned
+
+
+@pytest.mark.parametrize(
+    ("workers", "backend", "routes", "warned"),
+    [
+        (4, "memory", ["POST /api/v1/user/"], True),
+        (4, "none", ["POST /api/v1/user/"], True),
+        (4, "redis", ["POST /api/v1/user/"], False),
+        (4, "memory", [], False),
+        (1, "memory", ["POST /api/v1/user/"], False),
+    ],
+)
+def test_main_warns_about_per_worker_idempotency_keys(monkeypatch, caplog, workers, backend, routes, warned):
+    """Test that several workers without Redis log that idempotent retries may run twice."""
+    config = make_settings(SERVER_WORKERS=workers, CACHE_BACKEND=backend, IDEMPOTENT_ROUTES=routes)
+    monkeypatch.setattr(server, "settings", config)
+    monkeypatch.setattr(server.uvicorn, "run", MagicMock())
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "5")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "10")
+
+    server.main()
+
+    assert ("Idempotency keys are per worker" in caplog.text) is warned